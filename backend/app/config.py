@@ -8,9 +8,15 @@ logger = logging.getLogger(__name__)
 class Settings(BaseSettings):
     """환경 변수 기반 설정 (.env 자동 로드)"""
 
-    # DB: 기본값은 SQLite (로컬 개발용). 프로덕션은 postgresql+psycopg://...
+    # DB: 기본값은 SQLite (로컬 개발용). 프로덕션은 postgresql://... (비동기 드라이버로 자동 변환)
     database_url: str = "sqlite:///./memolish.db"
 
+    # DB 커넥션 풀 (PostgreSQL 전용 — SQLite는 무시)
+    db_pool_size: int = 10          # 상시 유지 커넥션 수
+    db_max_overflow: int = 20       # 피크 시 추가 허용 커넥션 수
+    db_pool_recycle: int = 1800     # 초 단위 — 서버측 idle timeout 이전에 재연결
+    db_pool_timeout: int = 30       # 풀 고갈 시 커넥션 대기 최대 시간(초)
+
     # 외부 서비스 (실제 연동 시 .env에 설정)
     gemini_api_key: Optional[str] = None
     google_application_credentials: Optional[str] = None
@@ -18,6 +24,73 @@ class Settings(BaseSettings):
     aws_secret_access_key: Optional[str] = None
     aws_s3_bucket_name: Optional[str] = None
     aws_region: str = "ap-northeast-2"
+    s3_max_pool_connections: int = 32               # boto3 커넥션 풀 / 전용 스레드 풀 크기
+    s3_presign_cache_size: int = 10000              # 캐시할 presigned URL 최대 개수
+    s3_presign_safety_margin_seconds: int = 120     # 만료까지 이 시간 미만이면 재발급
+
+    # Gemini 호출 제어
+    gemini_max_concurrency: int = 16        # 워커당 동시 Gemini 호출 수
+    gemini_timeout_seconds: float = 60.0    # 호출 1회 타임아웃
+    gemini_max_retries: int = 3             # 429/5xx/타임아웃 재시도 횟수
+    gemini_backoff_base_seconds: float = 1.0
+    gemini_backoff_max_seconds: float = 20.0
+    gemini_batch_timeout_seconds: float = 180.0   # 여러 메모를 묶은 호출 1회 타임아웃
+    transform_batch_max_memos: int = 10           # 일괄 변환 1회 최대 메모 수
+
+    # Gemini 변환 결과 캐시 (동일 입력 재사용)
+    transform_cache_ttl_seconds: int = 30 * 24 * 3600
+    transform_cache_max_entries: int = 100_000
+
+    # TTS 호출 제어
+    tts_max_concurrency: int = 8            # 워커당 동시 합성 요청 수
+    tts_turn_gap_ms: int = 400              # A/B 화자 전환 시 삽입할 무음 길이
+
+    # TTS 세그먼트 캐시 (줄 단위 MP3 재사용)
+    tts_cache_dir: str = "./.cache/tts"
+    tts_cache_max_bytes: int = 512 * 1024 * 1024   # 로컬 디스크 LRU 상한
+    tts_cache_s3_prefix: Optional[str] = None      # 예: "tts-cache" — 설정 시 S3 2차 캐시 사용
+
+    # 스트리밍 응답 전달 (생성 태스크 → 클라이언트)
+    stream_relay_max_chunks: int = 32          # 응답 하나가 쌓아 둘 수 있는 최대 조각 수
+    stream_relay_stall_seconds: float = 10.0   # 큐가 찬 채로 이만큼 지나면 뒤처진 응답을 분리
+
+    # 링크 메타데이터 수집 (공유 HTTP 클라이언트 + 캐시)
+    url_fetch_timeout_seconds: float = 5.0
+    url_http_max_connections: int = 100
+    url_http_max_keepalive_connections: int = 20
+    url_metadata_cache_size: int = 10_000
+    url_metadata_ttl_seconds: int = 6 * 3600          # 성공 결과 보관
+    url_metadata_negative_ttl_seconds: int = 10 * 60  # 실패 결과 보관 (같은 죽은 링크 반복 요청 방지)
+    url_head_max_bytes: int = 256 * 1024              # <head>를 찾을 때까지 읽을 최대 바이트
+    url_per_host_concurrency: int = 4                 # 일괄 파싱 시 같은 호스트 동시 요청 수
+    url_bulk_deadline_seconds: float = 10.0           # 일괄 파싱 전체 마감 시간
+    url_bulk_max_urls: int = 50                       # 일괄 파싱 1회 최대 URL 수
+
+    # 백그라운드 작업 큐 (DB 테이블 기반, 외부 브로커 불필요)
+    job_workers: int = 4                    # 프로세스당 작업 워커 수
+    job_poll_interval_seconds: float = 2.0  # 다른 프로세스가 넣은 작업 확인 주기
+    job_lease_seconds: int = 60             # running 작업 리스 — 워커가 1/3 주기로 연장, 만료되면 재대기
+    job_reap_interval_seconds: float = 30.0  # 리스가 만료된 running 작업 확인 주기
+    job_stale_after_seconds: int = 900      # 리스 기록이 없는(이전 버전) running 작업의 재대기 기준
+    job_retention_days: int = 7             # 완료/실패 작업 보관 기간
+
+    # 메모 일괄 변경 (POST /api/memos/batch)
+    memo_batch_max_operations: int = 200       # 요청 1회 최대 항목 수
+
+    # 메모 NDJSON 가져오기/내보내기
+    memo_import_chunk_size: int = 500               # 가져오기 시 한 번에 INSERT + 커밋할 메모 수
+    memo_import_max_records: int = 100_000          # 요청 1회 최대 메모 수
+    memo_import_max_line_bytes: int = 1024 * 1024   # 한 줄(메모 하나) 최대 크기
+    memo_export_batch_size: int = 500               # 내보내기 서버측 커서 fetch 단위 (yield_per)
+
+    # 델타 동기화 (GET /api/memos/sync)
+    sync_overlap_seconds: float = 5.0          # 커서를 이 시간 이전까지만 전진 — 늦게 커밋된 변경 누락 방지
+    sync_tombstone_retention_days: int = 30    # 삭제 기록 보관 기간 (더 오래된 커서는 전체 재동기화)
+
+    # 같은 메모의 동시 변환/오디오 요청 합치기: auto(SQLite→local, PostgreSQL→postgres) | local | postgres
+    singleflight_backend: str = "auto"
+    singleflight_lease_seconds: float = 30.0          # postgres 리스 만료 — 작업 중에는 1/3 주기로 연장
+    singleflight_poll_interval_seconds: float = 0.25  # 리스를 기다리는 워커의 재시도 간격
 
     cors_origins: str = "http://localhost:3000"
     daily_free_credits: int = 3
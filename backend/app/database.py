@@ -1,6 +1,10 @@
 import logging
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
+from typing import AsyncIterator
+from sqlalchemy import Index, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateIndex
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -8,37 +12,127 @@ logger = logging.getLogger(__name__)
 # SQLite는 check_same_thread=False 필요, PostgreSQL은 pool_pre_ping
 is_sqlite = settings.database_url.startswith("sqlite")
 
-connect_args = {"check_same_thread": False} if is_sqlite else {}
-engine = create_engine(
-    settings.database_url,
-    connect_args=connect_args,
-    pool_pre_ping=not is_sqlite,
-)
 
-# SQLite: 외래키 제약 활성화
+def _async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (sqlite → aiosqlite, postgresql → asyncpg)"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if backend == "postgresql":
+        return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    return database_url
+
+
 if is_sqlite:
-    @event.listens_for(engine, "connect")
+    # SQLite는 파일 단위 잠금이라 풀 튜닝 의미 없음 — 기본 풀 사용
+    engine = create_async_engine(
+        _async_database_url(settings.database_url),
+        connect_args={"check_same_thread": False},
+    )
+
+    # SQLite: 외래키 제약 활성화
+    @event.listens_for(engine.sync_engine, "connect")
     def _enable_foreign_keys(dbapi_conn, _):
-        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+else:
+    engine = create_async_engine(
+        _async_database_url(settings.database_url),
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+    )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: 커밋 후 속성 접근 시 암묵적 I/O(lazy load) 방지
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def get_db() -> Session:
-    """데이터베이스 세션 의존성 주입용 제너레이터"""
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """비동기 데이터베이스 세션 의존성 주입용 제너레이터"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_tables() -> None:
-    """앱 시작 시 테이블 생성"""
-    from app.models import memo, user  # noqa: F401
-    Base.metadata.create_all(bind=engine)
+def _add_missing_columns(conn) -> None:
+    """
+    기존 테이블에 모델에서 새로 추가된 nullable 컬럼을 보충.
+    create_all은 이미 존재하는 테이블을 건드리지 않으므로 가벼운 마이그레이션 용도.
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            logger.info("컬럼 추가: %s.%s (%s)", table.name, column.name, column_type)
+
+
+def _missing_indexes(conn) -> list[tuple[Index, bool]]:
+    """
+    기존 테이블에 아직 없는 모델 인덱스 → (인덱스, 재생성 여부) 목록 (새 테이블은 create_all이 이미 생성).
+    PostgreSQL에서 CONCURRENTLY 빌드가 중간에 끊기면(배포 중 재시작 등) INVALID 인덱스가 남는데,
+    이름은 있어도 조회에 쓰이지 않으므로 지우고 다시 만들 대상으로 포함.
+    """
+    inspector = inspect(conn)
+    invalid: set[str] = set()
+    if not is_sqlite:
+        invalid = set(conn.exec_driver_sql(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE NOT i.indisvalid"
+        ).scalars())
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing += [
+            (index, index.name in invalid)
+            for index in table.indexes
+            if index.name not in existing or index.name in invalid
+        ]
+    return missing
+
+
+async def _create_indexes(indexes: list[tuple[Index, bool]]) -> None:
+    """
+    빠진 인덱스를 트랜잭션 밖(autocommit)에서 하나씩 생성.
+    PostgreSQL은 CREATE INDEX CONCURRENTLY — 큰 테이블에서도 빌드 중 쓰기를 막지 않음
+    (트랜잭션 안에서는 쓸 수 없음). IF NOT EXISTS로 여러 인스턴스가 동시에 떠도 안전.
+    """
+    if not indexes:
+        return
+    async with engine.execution_options(isolation_level="AUTOCOMMIT").connect() as conn:
+        for index, rebuild in indexes:
+            if rebuild:
+                logger.warning("INVALID 인덱스 재생성: %s.%s", index.table.name, index.name)
+                await conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+            statement = str(CreateIndex(index, if_not_exists=True).compile(dialect=conn.dialect))
+            if not is_sqlite:
+                statement = statement.replace(" INDEX ", " INDEX CONCURRENTLY ", 1)
+            await conn.exec_driver_sql(statement)
+            logger.info("인덱스 추가: %s.%s", index.table.name, index.name)
+
+
+async def create_tables() -> None:
+    """앱 시작 시 테이블 생성 + 신규 컬럼/인덱스 보충"""
+    from app.models import dialogue, job, memo, singleflight_lease, tombstone, transform_cache, user  # noqa: F401
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        missing_indexes = await conn.run_sync(_missing_indexes)
+    await _create_indexes(missing_indexes)
     logger.info("DB 테이블 초기화 완료 (%s)", "SQLite" if is_sqlite else "PostgreSQL")
+
+
+async def dispose_engine() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    await engine.dispose()
@@ -5,8 +5,18 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.database import create_tables
-from app.routers import memos, ai, audio
+from app.database import AsyncSessionLocal, create_tables, dispose_engine
+from app.routers import memos, ai, audio, jobs
+from app.services import (
+    dialogue_service,
+    gemini_service,
+    job_service,
+    s3_service,
+    search_service,
+    sync_service,
+    transform_cache_service,
+    url_parser_service,
+)
 
 # Windows UTF-8 출력 보장
 if sys.platform == "win32":
@@ -23,9 +33,21 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작 시 DB 테이블 초기화"""
-    create_tables()
+    await create_tables()
+    await search_service.ensure_index()
+    async with AsyncSessionLocal() as db:
+        await transform_cache_service.invalidate_stale_prompts(db)
+        await dialogue_service.backfill_legacy_dialogues(db)
+        await search_service.backfill_index(db)
+        await sync_service.prune_tombstones(db)
+    await job_service.start_workers()
     logger.info("Memolish API 서버 시작")
     yield
+    await job_service.stop_workers()
+    await gemini_service.close_client()
+    await url_parser_service.close_client()
+    s3_service.shutdown()
+    await dispose_engine()
     logger.info("Memolish API 서버 종료")
 
 
@@ -48,6 +70,7 @@ app.add_middleware(
 app.include_router(memos.router, prefix="/api/memos", tags=["memos"])
 app.include_router(ai.router, prefix="/api/ai", tags=["ai"])
 app.include_router(audio.router, prefix="/api/audio", tags=["audio"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
 
 
 @app.get("/health")
@@ -1,4 +1,20 @@
-from app.models.memo import Memo, MemoStatus
+from app.models.dialogue import DialogueExchange
+from app.models.job import Job, JobStatus
+from app.models.memo import Memo, MemoStatus, UrlEnrichmentStatus
+from app.models.singleflight_lease import SingleFlightLease
+from app.models.tombstone import MemoTombstone
+from app.models.transform_cache import TransformCache
 from app.models.user import User
 
-__all__ = ["Memo", "MemoStatus", "User"]
+__all__ = [
+    "DialogueExchange",
+    "Job",
+    "JobStatus",
+    "Memo",
+    "MemoStatus",
+    "MemoTombstone",
+    "SingleFlightLease",
+    "TransformCache",
+    "UrlEnrichmentStatus",
+    "User",
+]
@@ -0,0 +1,20 @@
+import logging
+from sqlalchemy import Column, ForeignKey, Integer, String, Text, UniqueConstraint
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+class DialogueExchange(Base):
+    """AI 생성 대화문 한 줄 — 메모별 순서(position)대로 저장, 줄 단위 조회/TTS 주소 지정용"""
+    __tablename__ = "dialogue_exchanges"
+    __table_args__ = (
+        UniqueConstraint("memo_id", "position", name="uq_dialogue_exchanges_memo_position"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    memo_id = Column(Integer, ForeignKey("memos.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)      # 대화 내 순서 (0부터)
+    speaker = Column(String(8), nullable=False)     # "A" | "B"
+    line = Column(Text, nullable=False)             # 영어 문장
+    korean = Column(Text, nullable=False)           # 한국어 번역
@@ -0,0 +1,41 @@
+import logging
+import enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"        # 대기
+    RUNNING = "running"      # 실행 중
+    SUCCEEDED = "succeeded"  # 완료
+    FAILED = "failed"        # 실패
+
+
+class Job(Base):
+    """백그라운드 작업 — AI 변환/TTS 등 오래 걸리는 작업을 요청과 분리해 실행"""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # 워커가 가장 오래된 대기 작업을 집어갈 때 사용
+        Index("ix_jobs_status_created", "status", "created_at"),
+        # 같은 메모의 중복 작업 확인용
+        Index("ix_jobs_user_kind_memo", "user_id", "kind", "memo_id"),
+    )
+
+    id = Column(String(32), primary_key=True)               # uuid4 hex
+    kind = Column(String(32), nullable=False)                # "transform" | "audio" ...
+    user_id = Column(String(64), nullable=False)
+    memo_id = Column(Integer, nullable=True)
+    payload_json = Column(Text, nullable=True)               # 작업별 추가 인자
+
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    result_json = Column(Text, nullable=True)                # 성공 시 결과
+    error_json = Column(Text, nullable=True)                 # 실패 시 {"status_code", "detail"}
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)  # running 중 워커가 주기적으로 연장
+    reserved_credits = Column(Integer, nullable=True)  # 이번 시도가 예약한 크레딧 — 워커가 죽어 재대기되면 환불
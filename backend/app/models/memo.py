@@ -1,12 +1,20 @@
 import logging
 import enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Boolean
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Boolean, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.dialogue import DialogueExchange
 
 logger = logging.getLogger(__name__)
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class MemoStatus(str, enum.Enum):
     NOT_STARTED = "not_started"      # 진행 전
     IN_PROGRESS = "in_progress"      # 진행 중
@@ -14,9 +22,23 @@ class MemoStatus(str, enum.Enum):
     KEEP_REVIEWING = "keep_reviewing"  # 계속 참조
 
 
+class UrlEnrichmentStatus(str, enum.Enum):
+    PENDING = "pending"    # 링크 메타데이터 수집 대기/진행 중
+    DONE = "done"          # 수집 완료
+    FAILED = "failed"      # 수집 실패 (URL을 제목으로 사용)
+
+
 class Memo(Base):
     """메모 모델 — 사용자의 일상 메모 및 할 일"""
     __tablename__ = "memos"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션 (user_id, created_at DESC, id DESC)
+        Index("ix_memos_user_created", "user_id", "created_at", "id"),
+        # 칸반 보드: 상태별 윈도 쿼리 (user_id, status, created_at DESC)
+        Index("ix_memos_user_status_created", "user_id", "status", "created_at", "id"),
+        # 델타 동기화: 커서 이후 변경분 (user_id, updated_at, id)
+        Index("ix_memos_user_updated", "user_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(64), nullable=False, index=True)  # 브라우저 세션 UUID (MVP)
@@ -24,18 +46,44 @@ class Memo(Base):
     source_url = Column(String(2048), nullable=True)           # 첨부 URL (선택)
     url_title = Column(String(512), nullable=True)             # 파싱된 링크 제목
     url_description = Column(Text, nullable=True)              # 파싱된 링크 설명
+    # 링크 메타데이터 백그라운드 수집 상태 (URL 없으면 NULL) — 기존 테이블에 ALTER로 붙도록 VARCHAR 저장
+    url_enrichment_status = Column(Enum(UrlEnrichmentStatus, native_enum=False, length=16), nullable=True)
 
     status = Column(Enum(MemoStatus), default=MemoStatus.NOT_STARTED, nullable=False)
     start_date = Column(DateTime(timezone=True), server_default=func.now())
     end_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # 파이썬에서 마이크로초 단위로 기록 — 동기화 커서 정렬 기준 (DB now()는 트랜잭션 시작 시각/초 단위)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), default=_utcnow, onupdate=_utcnow)
 
     # AI 변환 결과 — [✨ 영어로 변환하기] 버튼 클릭 시에만 채워짐 (수동 원칙)
     is_transformed = Column(Boolean, default=False)
     ai_summary_ko = Column(Text, nullable=True)        # 한국어 요약
     ai_summary_en = Column(Text, nullable=True)        # 영어 요약
-    ai_dialogue_json = Column(Text, nullable=True)     # A-B 대화문 JSON 문자열
+    dialogue_title = Column(String(256), nullable=True)  # 대화 장면 제목
+    dialogue_situation = Column(Text, nullable=True)     # 롤플레이 상황 설명 (한국어)
+    # A-B 대화문 줄 — dialogue_exchanges 테이블 (selectin: 메모 조회 시 IN 쿼리 한 번으로 함께 로드)
+    exchanges = relationship(
+        DialogueExchange,
+        order_by=DialogueExchange.position,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+    # 구버전 JSON 문자열 — 시작 시 dialogue_exchanges로 옮긴 뒤 비움 (신규 저장 없음)
+    ai_dialogue_json = Column(Text, nullable=True)
 
     # 오디오
     audio_s3_key = Column(String(512), nullable=True)  # S3 저장 경로
+    audio_timeline_json = Column(Text, nullable=True)  # 줄별 재생 위치 인덱스 (offset_ms/byte_offset)
+
+    @property
+    def ai_dialogue(self) -> Optional[dict]:
+        """응답용 구조화 대화문 (변환 전이면 None)"""
+        if self.dialogue_title is None:
+            return None
+        return {
+            "title": self.dialogue_title,
+            "situation": self.dialogue_situation or "",
+            "exchanges": list(self.exchanges),
+        }
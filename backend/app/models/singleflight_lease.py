@@ -0,0 +1,14 @@
+import logging
+from sqlalchemy import Column, DateTime, String
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightLease(Base):
+    """다중 워커 간 같은 작업(변환/오디오 생성) 직렬화용 리스 — 만료 시각이 지나면 다른 워커가 차지"""
+    __tablename__ = "singleflight_leases"
+
+    key = Column(String(64), primary_key=True)                     # sha256(single-flight 키)
+    owner = Column(String(32), nullable=False)                     # 리스를 잡은 워커의 임의 토큰
+    expires_at = Column(DateTime(timezone=True), nullable=False)   # 작업 중 주기적으로 연장
@@ -0,0 +1,19 @@
+import logging
+from sqlalchemy import Column, DateTime, Index, Integer, String
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+class MemoTombstone(Base):
+    """삭제된 메모 기록 — 델타 동기화(GET /api/memos/sync)에서 클라이언트에 삭제를 전달"""
+    __tablename__ = "memo_tombstones"
+    __table_args__ = (
+        # 동기화 커서 이후 삭제분 조회 (user_id, deleted_at, id)
+        Index("ix_memo_tombstones_user_deleted", "user_id", "deleted_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    memo_id = Column(Integer, nullable=False)               # 삭제된 메모 id (메모 행이 없으므로 FK 없음)
+    user_id = Column(String(64), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False)
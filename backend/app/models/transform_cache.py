@@ -0,0 +1,17 @@
+import logging
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+class TransformCache(Base):
+    """Gemini 변환 결과 캐시 — 정규화된 입력 텍스트 + 프롬프트 버전 해시로 메모/유저 간 공유"""
+    __tablename__ = "transform_cache"
+
+    key = Column(String(64), primary_key=True)                     # sha256(prompt_version + 정규화 입력)
+    prompt_version = Column(String(16), nullable=False, index=True)
+    result_json = Column(Text, nullable=False)                     # Gemini 결과 JSON 문자열
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)   # TTL 기준
+    last_used_at = Column(DateTime(timezone=True), nullable=False, index=True)  # LRU 기준
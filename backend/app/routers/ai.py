@@ -1,131 +1,549 @@
+import asyncio
 import logging
 import json
-from datetime import date
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
+from app.models.job import Job
 from app.models.memo import Memo
-from app.models.user import User
-from app.schemas.memo import TransformResponse, CreditsResponse
-from app.services.gemini_service import transform_memo_with_gemini
+from app.schemas.job import JobAccepted
+from app.schemas.memo import (
+    AIDialogue,
+    BatchTransformItem,
+    BatchTransformRequest,
+    BatchTransformResponse,
+    CreditsResponse,
+    DialogueExchange,
+    TransformResponse,
+)
+from app.services import credit_service, job_service, search_service
+from app.services.credit_service import CreditBalance
+from app.services.dialogue_service import apply_dialogue, has_dialogue
+from app.services.gemini_service import (
+    stream_transform_with_gemini,
+    transform_memo_with_gemini,
+    transform_memos_batch_with_gemini,
+)
+from app.services.json_stream import WILDCARD, IncrementalJsonParser
+from app.services.relay import Relay
+from app.services.singleflight import inflight
+from app.services.transform_cache_service import (
+    build_source_text,
+    get_cached_transform,
+    get_cached_transforms,
+    put_cached_transform,
+    put_cached_transforms,
+)
+from app.services.sse import event_stream, format_event
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+NO_CREDITS_DETAIL = {
+    "code": "NO_CREDITS",
+    "message": "오늘의 AI 변환 크레딧이 소진되었습니다. 광고를 시청하거나 프리미엄으로 업그레이드하세요.",
+}
+GEMINI_ERROR_DETAIL = "AI 변환 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
 
-def get_user_id(x_session_id: str = Header(...)) -> str:
-    return x_session_id
-
+# 스트리밍 변환에서 완성 즉시 전송할 JSON 경로
+STREAM_FIELDS = [
+    ("summary_ko",),
+    ("summary_en",),
+    ("dialogue", "title"),
+    ("dialogue", "situation"),
+    ("dialogue", "exchanges", WILDCARD),
+]
 
-def get_or_create_user(session_id: str, db: Session) -> User:
-    """세션 ID로 유저 조회 — 없으면 신규 생성"""
-    user = db.query(User).filter(User.session_id == session_id).first()
-    if not user:
-        user = User(session_id=session_id, daily_credits=settings.daily_free_credits)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    return user
 
-
-def reset_credits_if_new_day(user: User, db: Session) -> User:
-    """날짜가 바뀐 경우 크레딧 자정 리셋"""
-    today = date.today()
-    if user.credits_reset_date < today:
-        user.daily_credits = settings.daily_free_credits
-        user.credits_reset_date = today
-        db.commit()
-        db.refresh(user)
-        logger.info("크레딧 리셋: user=%s credits=%s", user.session_id, user.daily_credits)
-    return user
+def get_user_id(x_session_id: str = Header(...)) -> str:
+    return x_session_id
 
 
-@router.post("/transform/{memo_id}", response_model=TransformResponse)
+@router.post(
+    "/transform/{memo_id}",
+    response_model=TransformResponse,
+    responses={202: {"model": JobAccepted}},
+)
 async def transform_memo(
     memo_id: int,
-    db: Session = Depends(get_db),
+    background: bool = False,
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
     """
     ✨ AI 변환 — 유저가 버튼을 클릭했을 때만 호출 (수동 원칙 준수).
     크레딧 잔액 확인 → Gemini 변환 → 결과 저장 → 크레딧 차감.
     이미 변환된 메모는 캐시된 결과를 반환하여 API 비용 절약.
+    같은 메모의 동시 요청(더블탭/재시도)은 하나의 작업으로 합쳐 결과를 공유.
+    background=true: 작업 큐에 등록하고 job_id를 즉시 반환 (202) → /api/jobs/{job_id}로 결과 조회.
+    """
+    if background:
+        # 없는/남의 메모는 작업을 만들지 않고 바로 404
+        if not await db.scalar(select(Memo.id).where(Memo.id == memo_id, Memo.user_id == user_id)):
+            raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
+        job = await job_service.enqueue(db, "transform", user_id, memo_id=memo_id)
+        return JSONResponse(
+            status_code=202,
+            content=JobAccepted(job_id=job.id, status=job.status).model_dump(mode="json"),
+        )
+    return await _transform_once(memo_id, user_id)
+
+
+async def _transform_once(memo_id: int, user_id: str) -> TransformResponse:
+    return await inflight.do(
+        f"transform:{user_id}:{memo_id}",
+        lambda: _run_transform(memo_id, user_id),
+    )
+
+
+async def _transform_job(job: Job) -> dict:
+    result = await _transform_once(job.memo_id, job.user_id)
+    return result.model_dump(mode="json")
+
+
+async def _refund_abandoned_transform(job: Job) -> None:
+    """워커가 죽어 재대기된 변환 시도 — 결과를 저장하지 못했으면 그 시도의 예약 환불"""
+    async with AsyncSessionLocal() as db:
+        memo = await db.scalar(select(Memo).where(Memo.id == job.memo_id, Memo.user_id == job.user_id))
+        if memo and has_dialogue(memo):
+            return
+        await credit_service.refund(db, job.user_id, job.reserved_credits)
+    logger.warning("중단된 변환 작업 환불: job_id=%s memo_id=%s", job.id, job.memo_id)
+
+
+job_service.register("transform", _transform_job, on_abandoned=_refund_abandoned_transform)
+
+
+async def _run_transform(memo_id: int, user_id: str) -> TransformResponse:
+    """변환 작업 본체 — 요청과 독립된 세션 사용 (합류한 요청의 연결이 끊겨도 완료)"""
+    async with AsyncSessionLocal() as db:
+        memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+        if not memo:
+            raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
+
+        source_text = build_source_text(memo.content, memo.url_description)
+        existing = await _existing_result(db, memo, user_id, source_text)
+        if existing is not None:
+            return existing
+
+        # 크레딧 예약 — 리셋/확인/차감을 한 문장으로 (프리미엄은 무제한)
+        balance = await credit_service.reserve(db, user_id)
+        if balance is None:
+            raise HTTPException(status_code=402, detail=NO_CREDITS_DETAIL)
+        # 백그라운드 작업이면 예약을 작업 시도에 기록 — 워커가 죽어 재대기되면 환불
+        await job_service.hold_credits(db, 1)
+
+        # Gemini API 호출 + 결과 검증 — 실패 시 예약 환불 (형식이 어긋난 결과는 저장/캐시하지 않음)
+        try:
+            result = _validate_result(await transform_memo_with_gemini(source_text))
+        except Exception as exc:
+            logger.error("Gemini API 오류: %s", exc)
+            await credit_service.refund(db, user_id)
+            raise HTTPException(status_code=502, detail=GEMINI_ERROR_DETAIL)
+
+    # DB 저장 — 메모를 다시 읽어 그 사이 저장된 결과가 있으면 환불, 커밋까지 실패해도 환불
+    response = await _save_result(memo_id, user_id, source_text, result, balance)
+    logger.info("AI 변환 완료: memo_id=%s 잔여크레딧=%s", memo_id, response.credits_remaining)
+    return response
+
+
+async def _existing_result(
+    db: AsyncSession, memo: Memo, user_id: str, source_text: str
+) -> Optional[TransformResponse]:
+    """Gemini 호출 없이 돌려줄 수 있는 결과 — 이미 변환된 메모 또는 동일 입력의 캐시 (크레딧 차감 없음)"""
+    if has_dialogue(memo):
+        logger.info("AI 변환 캐시 반환: memo_id=%s", memo.id)
+        dialogue = memo.ai_dialogue
+    else:
+        # 동일 입력의 변환 결과가 있으면 재사용 (다른 메모/유저 포함)
+        cached = await get_cached_transform(db, source_text)
+        if cached is None:
+            return None
+        await _apply_transform(db, memo, cached)
+        await db.commit()
+        logger.info("AI 변환 중복 캐시 적용: memo_id=%s", memo.id)
+        dialogue = memo.ai_dialogue
+
+    balance = await credit_service.get_balance(db, user_id)
+    return TransformResponse(
+        summary_ko=memo.ai_summary_ko,
+        summary_en=memo.ai_summary_en,
+        dialogue=dialogue,
+        credits_remaining=balance.daily_credits,
+    )
+
+
+@router.post("/transform/{memo_id}/stream")
+async def stream_transform(
+    memo_id: int,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    ✨ AI 변환 스트리밍 (Server-Sent Events) — 생성되는 JSON을 점진 파싱하여
+    summary_ko → summary_en → title/situation → exchange(한 줄씩) 순으로 완성 즉시 전송.
+    전체 결과가 AIDialogue 검증을 통과해야 DB에 저장하고 `done` 이벤트(TransformResponse) 전송.
+    검증 실패/중단 시 `error` 이벤트 + 크레딧 환불.
+    이미 변환됐거나 캐시 결과가 있으면 같은 이벤트 순서로 즉시 재생.
+    일반/백그라운드 변환과 같은 single-flight 키로 실행 — 진행 중인 변환이 있으면 그 결과를 재생하고,
+    스트리밍 중에 들어온 변환 요청은 이 스트림의 결과를 공유 (Gemini 호출·차감 한 번).
     """
-    memo = db.query(Memo).filter(Memo.id == memo_id, Memo.user_id == user_id).first()
+    memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
     if not memo:
         raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
 
-    user = get_or_create_user(user_id, db)
-    user = reset_credits_if_new_day(user, db)
-
-    # 이미 변환된 메모 → 캐시 반환 (크레딧 차감 없음)
-    if memo.is_transformed and memo.ai_dialogue_json:
-        logger.info("AI 변환 캐시 반환: memo_id=%s", memo_id)
-        dialogue_data = json.loads(memo.ai_dialogue_json)
-        return TransformResponse(
-            summary_ko=memo.ai_summary_ko,
-            summary_en=memo.ai_summary_en,
-            dialogue=dialogue_data,
-            credits_remaining=user.daily_credits,
-        )
+    # 같은 메모의 변환(일반/스트리밍/백그라운드)이 진행 중이면 새로 호출하지 않고 그 결과를 재생
+    flight_key = f"transform:{user_id}:{memo_id}"
+    if inflight.in_flight(flight_key):
+        return event_stream(_replay_events(await _transform_once(memo_id, user_id)))
 
-    # 크레딧 확인 (프리미엄은 무제한)
-    if not user.is_premium and user.daily_credits <= 0:
-        raise HTTPException(
-            status_code=402,
-            detail={
-                "code": "NO_CREDITS",
-                "message": "오늘의 AI 변환 크레딧이 소진되었습니다. 광고를 시청하거나 프리미엄으로 업그레이드하세요.",
-            },
-        )
+    listener: Relay[str] = Relay()
+    flight = inflight.start(flight_key, lambda: _run_stream_transform(memo_id, user_id, listener))
+    # 첫 이벤트까지는 응답 시작 전에 받아 크레딧 부족/호출 오류를 402/502로 돌려줌
+    events = listener.items()
+    first_event = await anext(events, None)
+    if first_event is None:
+        # 부분 결과 없이 끝남 — 이미 변환됐거나 캐시/다른 워커의 결과가 있음, 또는 오류
+        return event_stream(_replay_events(await asyncio.shield(flight)))
+    return event_stream(_relay_events(first_event, events, flight))
 
-    # Gemini API 호출
-    source_text = memo.content
-    if memo.url_description:
-        source_text += f"\n\n[링크 요약]\n{memo.url_description}"
 
+async def _relay_events(first_event: str, events: AsyncIterator[str], flight: asyncio.Future):
+    """생성 태스크가 넘겨 주는 부분 이벤트 전송 → 작업 결과로 done/error"""
+    yield first_event
+    async for event in events:
+        yield event
     try:
-        result = await transform_memo_with_gemini(source_text)
-    except Exception as exc:
-        logger.error("Gemini API 오류: %s", exc)
-        raise HTTPException(status_code=502, detail="AI 변환 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+        response = await asyncio.shield(flight)
+    except HTTPException as exc:
+        yield format_event("error", {"status_code": exc.status_code, "detail": exc.detail})
+        return
+    except Exception:
+        yield format_event("error", {"status_code": 502, "detail": GEMINI_ERROR_DETAIL})
+        return
+    yield format_event("done", response.model_dump(mode="json"))
 
-    # DB 저장
-    memo.ai_summary_ko = result["summary_ko"]
-    memo.ai_summary_en = result["summary_en"]
-    memo.ai_dialogue_json = json.dumps(result["dialogue"], ensure_ascii=False)
-    memo.is_transformed = True
 
-    # 크레딧 차감 (프리미엄 제외)
-    if not user.is_premium:
-        user.daily_credits -= 1
+async def _run_stream_transform(memo_id: int, user_id: str, listener: Relay[str]) -> TransformResponse:
+    """
+    스트리밍 변환 작업 본체 (_run_transform과 같은 결과 반환) — 완성된 부분 값을 이벤트로 listener에 넘기고
+    끝나면 listener를 닫음. 요청과 독립된 태스크라 클라이언트가 끊기거나 뒤처져도 저장까지 진행
+    (합류한 요청이 결과를 받도록). 검증 실패/중단 시 예약 환불.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+            if not memo:
+                raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
+            source_text = build_source_text(memo.content, memo.url_description)
+            # 잠금을 기다리는 동안 다른 워커가 먼저 변환했을 수 있음
+            existing = await _existing_result(db, memo, user_id, source_text)
+            if existing is not None:
+                return existing
+            balance = await credit_service.reserve(db, user_id)
+            if balance is None:
+                raise HTTPException(status_code=402, detail=NO_CREDITS_DETAIL)
 
-    db.commit()
-    db.refresh(memo)
-    db.refresh(user)
+        chunks = stream_transform_with_gemini(source_text)
+        parser = IncrementalJsonParser(watch=STREAM_FIELDS)
+        try:
+            async for chunk in chunks:
+                for path, value in parser.feed(chunk):
+                    event = _partial_event(path, value)
+                    if event:
+                        await listener.put(event)
+            result = _validate_result(json.loads(parser.text))
+        except BaseException as exc:
+            # 저장 전 중단 — 예약 환불 (종료 시 취소 포함)
+            await chunks.aclose()
+            await asyncio.shield(_refund(user_id))
+            if not isinstance(exc, Exception):
+                raise
+            if isinstance(exc, (ValueError, KeyError, TypeError, ValidationError)):
+                logger.error("Gemini 스트리밍 응답 검증 실패: memo_id=%s (%s)", memo_id, exc)
+            else:
+                logger.error("Gemini 스트리밍 오류: memo_id=%s (%r)", memo_id, exc)
+            raise HTTPException(status_code=502, detail=GEMINI_ERROR_DETAIL)
 
-    logger.info("AI 변환 완료: memo_id=%s 잔여크레딧=%s", memo_id, user.daily_credits)
+        # 저장 중에는 취소돼도 끝까지 — 커밋 후 취소돼 이중 환불되는 일 없음
+        response = await asyncio.shield(_save_result(memo_id, user_id, source_text, result, balance))
+        logger.info("AI 스트리밍 변환 완료: memo_id=%s", memo_id)
+        return response
+    finally:
+        await listener.close()
+
+
+async def _save_result(
+    memo_id: int, user_id: str, source_text: str, result: dict, balance: CreditBalance
+) -> TransformResponse:
+    """
+    검증된 변환 결과 저장 — Gemini 호출 동안 요청 세션이 닫혔을 수 있으므로 별도 세션에서 메모를 다시 읽음.
+    예약 정산까지 책임: 커밋 전에 실패하거나 저장하지 않게 되면 여기서 환불.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+            if not memo:
+                raise LookupError(f"메모 삭제됨: memo_id={memo_id}")
+            duplicate = has_dialogue(memo)
+            if not duplicate:
+                await _apply_transform(db, memo, result)
+                await db.commit()
+        except Exception:
+            await db.rollback()
+            await credit_service.refund(db, user_id)
+            raise
+        if duplicate:
+            # Gemini 호출 중 다른 요청/워커가 먼저 저장 — 저장된 결과를 우선하고 이번 예약은 환불
+            await credit_service.refund(db, user_id)
+            return await _existing_result(db, memo, user_id, source_text)
+    await put_cached_transform(source_text, result)
     return TransformResponse(
         summary_ko=memo.ai_summary_ko,
         summary_en=memo.ai_summary_en,
-        dialogue=result["dialogue"],
-        credits_remaining=user.daily_credits,
+        dialogue=memo.ai_dialogue,
+        credits_remaining=balance.daily_credits,
     )
 
 
+async def _refund(user_id: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await credit_service.refund(db, user_id)
+
+
+def _validate_result(result: dict) -> dict:
+    """Gemini 결과 검증 — 형식이 어긋나면 예외 (저장하지 않음)"""
+    if not isinstance(result, dict):
+        raise ValueError("결과가 객체가 아님")
+    for key in ("summary_ko", "summary_en"):
+        if not isinstance(result.get(key), str):
+            raise ValueError(f"{key} 누락")
+    dialogue = AIDialogue.model_validate(result["dialogue"])
+    return {
+        "summary_ko": result["summary_ko"],
+        "summary_en": result["summary_en"],
+        "dialogue": dialogue.model_dump(exclude={"exchanges": {"__all__": {"id"}}}),
+    }
+
+
+def _partial_event(path: tuple, value) -> Optional[str]:
+    """완성된 부분 값 → SSE 이벤트 (형식이 어긋난 대화 줄은 건너뜀, 최종 검증에서 걸러짐)"""
+    if path[-1] in ("summary_ko", "summary_en", "title", "situation"):
+        if isinstance(value, str):
+            return format_event(path[-1], {"text": value})
+        return None
+    try:
+        exchange = DialogueExchange.model_validate(value)
+    except ValidationError:
+        return None
+    return format_event("exchange", {"index": path[-1], **exchange.model_dump(exclude={"id"})})
+
+
+async def _replay_events(response: TransformResponse):
+    """이미 있는 결과를 스트리밍과 같은 이벤트 순서로 전송"""
+    yield format_event("summary_ko", {"text": response.summary_ko})
+    yield format_event("summary_en", {"text": response.summary_en})
+    yield format_event("title", {"text": response.dialogue.title})
+    yield format_event("situation", {"text": response.dialogue.situation})
+    for index, exchange in enumerate(response.dialogue.exchanges):
+        yield format_event("exchange", {"index": index, **exchange.model_dump()})
+    yield format_event("done", response.model_dump(mode="json"))
+
+
+@router.post("/transform-batch", response_model=BatchTransformResponse)
+async def transform_memos_batch(
+    body: BatchTransformRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    ✨ 여러 메모 일괄 AI 변환 — 변환이 필요한 메모를 한 번의 Gemini 호출로 묶어
+    시스템 프롬프트/왕복 비용을 메모 수만큼 나눠 냄.
+    배치 응답에서 빠졌거나 검증에 실패한 메모만 개별 호출로 재시도.
+    캐시 조회는 배치 전체에 한 번. 크레딧이 모자라면 가능한 만큼만 (요청 순서대로) 변환하고
+    나머지는 402로 표시. 크레딧은 실제로 새로 변환된 메모 수만큼만 차감 (예약 후 남은 만큼 환불).
+    단건/스트리밍/백그라운드 변환이 진행 중인 메모는 배치에 넣지 않고 그 결과를 기다려 공유
+    (같은 single-flight 키 — 중복 호출·이중 차감 없음).
+    """
+    memo_ids = list(dict.fromkeys(body.memo_ids))
+    if not memo_ids:
+        raise HTTPException(status_code=400, detail="memo_ids가 비어 있습니다.")
+    if len(memo_ids) > settings.transform_batch_max_memos:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.transform_batch_max_memos}개까지 변환할 수 있습니다.",
+        )
+
+    memos = {
+        memo.id: memo
+        for memo in await db.scalars(
+            select(Memo).where(Memo.id.in_(memo_ids), Memo.user_id == user_id)
+        )
+    }
+    items: dict[int, BatchTransformItem] = {}
+    pending: dict[str, list[Memo]] = {}   # 원문 → 메모들 (같은 원문은 한 번만 변환)
+    joining: list[int] = []               # 다른 요청이 변환 중인 메모 — 그 작업에 합류
+    for memo_id in memo_ids:
+        memo = memos.get(memo_id)
+        if memo is None:
+            items[memo_id] = _batch_error(memo_id, 404, "메모를 찾을 수 없습니다.")
+        elif has_dialogue(memo):
+            items[memo_id] = _batch_item(memo, cached=True)
+        elif inflight.in_flight(f"transform:{user_id}:{memo_id}"):
+            joining.append(memo_id)
+        else:
+            pending.setdefault(build_source_text(memo.content, memo.url_description), []).append(memo)
+    # 배치 호출과 동시에 기다림
+    joined = asyncio.gather(*(_transform_once(memo_id, user_id) for memo_id in joining), return_exceptions=True)
+
+    # 동일 입력의 변환 결과가 있으면 재사용 (다른 메모/유저 포함) — 배치 전체를 한 번에 조회
+    reused: list[Memo] = []
+    for source_text, result in (await get_cached_transforms(db, pending)).items():
+        for memo in pending.pop(source_text):
+            await _apply_transform(db, memo, result)
+            reused.append(memo)
+    if reused:
+        await db.commit()
+        for memo in reused:
+            items[memo.id] = _batch_item(memo, cached=True)
+
+    credits_used = 0
+    if pending:
+        reserved, _ = await credit_service.reserve_up_to(db, user_id, amount=len(pending))
+        for source_text in list(pending)[reserved:]:
+            for memo in pending.pop(source_text):
+                items[memo.id] = _batch_error(memo.id, 402, NO_CREDITS_DETAIL)
+        if pending:
+            results = await _transform_sources(
+                {group[0].id: source_text for source_text, group in pending.items()}
+            )
+            saved: list[Memo] = []
+            fresh: dict[str, dict] = {}
+            for source_text, group in pending.items():
+                result = results.get(group[0].id)
+                if result is None:
+                    for memo in group:
+                        items[memo.id] = _batch_error(memo.id, 502, GEMINI_ERROR_DETAIL)
+                    continue
+                for memo in group:
+                    await _apply_transform(db, memo, result)
+                    saved.append(memo)
+                fresh[source_text] = result
+                credits_used += 1
+            await db.commit()
+            await put_cached_transforms(fresh)
+            # 커밋 후 줄 id가 채워진 대화문으로 응답
+            for memo in saved:
+                items[memo.id] = _batch_item(memo)
+            await credit_service.refund(db, user_id, amount=reserved - credits_used)
+
+    for memo_id, response in zip(joining, await joined):
+        items[memo_id] = _batch_joined_item(memo_id, response)
+
+    balance = await credit_service.get_balance(db, user_id)
+    logger.info(
+        "AI 일괄 변환: 요청=%d 신규=%d 잔여크레딧=%s", len(memo_ids), credits_used, balance.daily_credits
+    )
+    return BatchTransformResponse(
+        results=[items[memo_id] for memo_id in memo_ids],
+        credits_used=credits_used,
+        credits_remaining=balance.daily_credits,
+    )
+
+
+async def _transform_sources(sources: dict[int, str]) -> dict[int, dict]:
+    """
+    한 번의 배치 호출 → 빠졌거나 검증 실패한 메모만 개별 호출로 재시도.
+    최종적으로 실패한 메모는 결과에서 제외.
+    """
+    results: dict[int, dict] = {}
+    if len(sources) > 1:
+        try:
+            batch = await transform_memos_batch_with_gemini(sources)
+        except Exception as exc:
+            logger.error("Gemini 일괄 변환 오류 — 개별 호출로 전환: %s", exc)
+            batch = {}
+        for memo_id, result in batch.items():
+            try:
+                results[memo_id] = _validate_result(result)
+            except (ValueError, KeyError, TypeError, ValidationError) as exc:
+                logger.warning("일괄 변환 결과 검증 실패: memo_id=%s (%s)", memo_id, exc)
+
+    missing = [memo_id for memo_id in sources if memo_id not in results]
+    if missing:
+        if len(sources) > 1:
+            logger.info("일괄 변환 누락분 개별 재시도: %s", missing)
+        retried = await asyncio.gather(
+            *(transform_memo_with_gemini(sources[memo_id]) for memo_id in missing),
+            return_exceptions=True,
+        )
+        for memo_id, result in zip(missing, retried):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                results[memo_id] = _validate_result(result)
+            except Exception as exc:
+                logger.error("Gemini 개별 변환 실패: memo_id=%s (%s)", memo_id, exc)
+    return results
+
+
+def _batch_item(memo: Memo, cached: bool = False) -> BatchTransformItem:
+    return BatchTransformItem(
+        memo_id=memo.id,
+        ok=True,
+        cached=cached,
+        summary_ko=memo.ai_summary_ko,
+        summary_en=memo.ai_summary_en,
+        dialogue=memo.ai_dialogue,
+    )
+
+
+def _batch_joined_item(memo_id: int, response: TransformResponse | BaseException) -> BatchTransformItem:
+    """합류한 변환 작업의 결과 → 배치 항목 (크레딧은 그 작업을 시작한 요청이 차감)"""
+    if isinstance(response, HTTPException):
+        return _batch_error(memo_id, response.status_code, response.detail)
+    if isinstance(response, BaseException):
+        logger.error("합류한 변환 작업 실패: memo_id=%s (%r)", memo_id, response)
+        return _batch_error(memo_id, 502, GEMINI_ERROR_DETAIL)
+    return BatchTransformItem(
+        memo_id=memo_id,
+        ok=True,
+        cached=True,
+        summary_ko=response.summary_ko,
+        summary_en=response.summary_en,
+        dialogue=response.dialogue,
+    )
+
+
+def _batch_error(memo_id: int, status_code: int, detail) -> BatchTransformItem:
+    return BatchTransformItem(memo_id=memo_id, ok=False, error={"status_code": status_code, "detail": detail})
+
+
+async def _apply_transform(db: AsyncSession, memo: Memo, result: dict) -> None:
+    """변환 결과 저장 + 검색 색인 갱신 (커밋은 호출자 몫)"""
+    memo.ai_summary_ko = result["summary_ko"]
+    memo.ai_summary_en = result["summary_en"]
+    apply_dialogue(memo, result["dialogue"])
+    memo.is_transformed = True
+    await search_service.index_memos(db, [memo])
+
+
 @router.get("/credits", response_model=CreditsResponse)
 async def get_credits(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    """남은 AI 변환 크레딧 조회"""
-    user = get_or_create_user(user_id, db)
-    user = reset_credits_if_new_day(user, db)
+    """남은 AI 변환 크레딧 조회 (신규 세션 생성/자정 리셋 포함, 단일 쿼리)"""
+    balance = await credit_service.get_balance(db, user_id)
     return CreditsResponse(
-        daily_credits=user.daily_credits,
-        is_premium=user.is_premium,
+        daily_credits=balance.daily_credits,
+        is_premium=balance.is_premium,
         max_daily_credits=settings.daily_free_credits,
     )
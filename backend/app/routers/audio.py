@@ -1,13 +1,24 @@
+import asyncio
 import logging
 import json
+from typing import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
+from app.models.dialogue import DialogueExchange
+from app.models.job import Job
 from app.models.memo import Memo
-from app.services.tts_service import generate_tts_audio
-from app.services.s3_service import upload_to_s3, get_presigned_url
+from app.schemas.job import JobAccepted
+from app.services import job_service
+from app.services.dialogue_service import tts_lines
+from app.services.tts_service import generate_tts_audio, iter_dialogue_audio, new_assembler, synthesize_exchange
+from app.services.relay import Relay
+from app.services.singleflight import inflight
+from app.services.s3_service import MultipartUpload, upload_to_s3, get_presigned_url, get_presigned_url_with_ttl
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -17,59 +28,218 @@ def get_user_id(x_session_id: str = Header(...)) -> str:
     return x_session_id
 
 
-@router.post("/generate/{memo_id}")
+@router.post("/generate/{memo_id}", responses={202: {"model": JobAccepted}})
 async def generate_audio(
     memo_id: int,
-    db: Session = Depends(get_db),
+    background: bool = False,
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
     """
     TTS 오디오 생성 → S3 업로드.
     이미 생성된 경우 presigned URL만 재발급 (API 비용 절약).
+    같은 메모의 동시 요청은 하나의 TTS 작업으로 합쳐 결과를 공유.
+    background=true: 작업 큐에 등록하고 job_id를 즉시 반환 (202).
     """
-    memo = db.query(Memo).filter(Memo.id == memo_id, Memo.user_id == user_id).first()
+    if background:
+        # 없는/남의/변환 전 메모는 작업을 만들지 않고 바로 404
+        memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+        if not memo or not memo.is_transformed:
+            raise HTTPException(status_code=404, detail="AI 변환이 완료된 메모가 없습니다. 먼저 변환을 실행하세요.")
+        job = await job_service.enqueue(db, "audio", user_id, memo_id=memo_id)
+        return JSONResponse(
+            status_code=202,
+            content=JobAccepted(job_id=job.id, status=job.status).model_dump(mode="json"),
+        )
+    return await _generate_once(memo_id, user_id)
+
+
+def _flight_key(memo_id: int, user_id: str) -> str:
+    """일반 생성/스트리밍/백그라운드 작업이 공유하는 single-flight 키 — 같은 메모는 한 번만 합성"""
+    return f"audio:{user_id}:{memo_id}"
+
+
+async def _generate_once(memo_id: int, user_id: str) -> dict:
+    return await inflight.do(
+        _flight_key(memo_id, user_id),
+        lambda: _run_generate_audio(memo_id, user_id),
+    )
+
+
+async def _audio_job(job: Job) -> dict:
+    return await _generate_once(job.memo_id, job.user_id)
+
+
+job_service.register("audio", _audio_job)
+
+
+async def _run_generate_audio(memo_id: int, user_id: str) -> dict:
+    """오디오 생성 작업 본체 — 요청과 독립된 세션 사용"""
+    async with AsyncSessionLocal() as db:
+        memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+        if not memo or not memo.is_transformed:
+            raise HTTPException(status_code=404, detail="AI 변환이 완료된 메모가 없습니다. 먼저 변환을 실행하세요.")
+
+        # 기존 오디오가 있으면 presigned URL만 재발급
+        if memo.audio_s3_key:
+            url = await get_presigned_url(memo.audio_s3_key)
+            return {"audio_url": url, "cached": True, "timeline": _timeline(memo)}
+
+        # TTS 변환 (프레임 단위 조립 + 줄별 타임라인)
+        try:
+            audio_bytes, timeline = await generate_tts_audio(tts_lines(memo))
+        except Exception as exc:
+            logger.error("TTS 변환 오류: %s", exc)
+            raise HTTPException(status_code=502, detail="음성 생성 중 오류가 발생했습니다.")
+
+        # S3 업로드
+        s3_key = f"audio/{user_id}/{memo_id}.mp3"
+        try:
+            await upload_to_s3(audio_bytes, s3_key)
+        except Exception as exc:
+            logger.error("S3 업로드 오류: %s", exc)
+            raise HTTPException(status_code=502, detail="오디오 저장 중 오류가 발생했습니다.")
+
+        memo.audio_s3_key = s3_key
+        memo.audio_timeline_json = json.dumps(timeline)
+        await db.commit()
+
+        url = await get_presigned_url(s3_key)
+        logger.info("오디오 생성 완료: memo_id=%s s3_key=%s", memo_id, s3_key)
+        return {"audio_url": url, "cached": False, "timeline": timeline}
+
+
+@router.post("/stream/{memo_id}")
+async def stream_audio(
+    memo_id: int,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    TTS 오디오 스트리밍 — 대화 순서대로 한 줄씩 합성되는 즉시 MP3 바이트 전송.
+    같은 바이트를 S3로 올리고, 완료되면 audio_s3_key 저장.
+    /generate·백그라운드 작업과 같은 single-flight 키로 실행 — 진행 중인 생성이 있으면 그 결과를,
+    스트리밍 중에 들어온 생성 요청은 이 스트림의 결과를 공유.
+    합성은 요청과 독립된 태스크라 클라이언트가 끊겨도 끝까지 저장됨 (합류한 요청이 결과를 받도록).
+    이미 생성된 경우 presigned URL로 303 리다이렉트.
+    """
+    memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
     if not memo or not memo.is_transformed:
         raise HTTPException(status_code=404, detail="AI 변환이 완료된 메모가 없습니다. 먼저 변환을 실행하세요.")
 
-    # 기존 오디오가 있으면 presigned URL만 재발급
     if memo.audio_s3_key:
-        url = get_presigned_url(memo.audio_s3_key)
-        return {"audio_url": url, "cached": True}
+        return RedirectResponse(await get_presigned_url(memo.audio_s3_key), status_code=303)
+
+    # 같은 메모의 생성(일반/스트리밍)이 진행 중이면 새로 합성하지 않고 그 결과를 기다림
+    flight_key = _flight_key(memo_id, user_id)
+    if inflight.in_flight(flight_key):
+        result = await _generate_once(memo_id, user_id)
+        return RedirectResponse(result["audio_url"], status_code=303)
+
+    listener: Relay[bytes] = Relay()
+    flight = inflight.start(flight_key, lambda: _run_stream_audio(memo_id, user_id, listener))
+    # 첫 세그먼트까지는 응답 시작 전에 받아 설정/합성 오류를 502로 돌려줌
+    segments = listener.items()
+    first_segment = await anext(segments, None)
+    if first_segment is None:
+        # 세그먼트 없이 끝남 — 오류이거나 다른 워커가 먼저 생성을 마침
+        result = await asyncio.shield(flight)
+        return RedirectResponse(result["audio_url"], status_code=303)
+    return StreamingResponse(_relay(first_segment, segments), media_type="audio/mpeg")
 
-    # TTS 변환
-    dialogue = json.loads(memo.ai_dialogue_json)
-    try:
-        audio_bytes = await generate_tts_audio(dialogue["exchanges"])
-    except Exception as exc:
-        logger.error("TTS 변환 오류: %s", exc)
-        raise HTTPException(status_code=502, detail="음성 생성 중 오류가 발생했습니다.")
 
-    # S3 업로드
-    s3_key = f"audio/{user_id}/{memo_id}.mp3"
+async def _relay(first_segment: bytes, segments: AsyncIterator[bytes]):
+    """생성 태스크가 넘겨 주는 세그먼트를 그대로 전송"""
+    yield first_segment
+    async for segment in segments:
+        yield segment
+
+
+async def _run_stream_audio(memo_id: int, user_id: str, listener: Relay[bytes]) -> dict:
+    """
+    스트리밍 생성 작업 본체 (_run_generate_audio와 같은 결과 반환) — 세그먼트를 listener로 넘기면서
+    S3로 tee, 끝나면 listener를 닫음. 실패 시 업로드를 취소하므로 부분 파일은 남지 않음.
+    클라이언트가 뒤처지거나 끊기면 listener만 분리되고 합성/업로드는 끝까지 진행.
+    """
     try:
-        upload_to_s3(audio_bytes, s3_key)
-    except Exception as exc:
-        logger.error("S3 업로드 오류: %s", exc)
-        raise HTTPException(status_code=502, detail="오디오 저장 중 오류가 발생했습니다.")
+        async with AsyncSessionLocal() as db:
+            memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
+            if not memo or not memo.is_transformed:
+                raise HTTPException(status_code=404, detail="AI 변환이 완료된 메모가 없습니다. 먼저 변환을 실행하세요.")
+            # 잠금을 기다리는 동안 다른 워커가 먼저 생성했을 수 있음
+            if memo.audio_s3_key:
+                url = await get_presigned_url(memo.audio_s3_key)
+                return {"audio_url": url, "cached": True, "timeline": _timeline(memo)}
+            lines = tts_lines(memo)
 
-    memo.audio_s3_key = s3_key
-    db.commit()
+        s3_key = f"audio/{user_id}/{memo_id}.mp3"
+        assembler = new_assembler()
+        uploader = MultipartUpload(s3_key)
+        try:
+            async for segment in iter_dialogue_audio(lines, assembler):
+                uploader.write(segment)
+                await listener.put(segment)
+        except BaseException as exc:
+            logger.error("TTS 스트리밍 중단: memo_id=%s (%r)", memo_id, exc)
+            await uploader.abort()
+            if isinstance(exc, Exception):
+                raise HTTPException(status_code=502, detail="음성 생성 중 오류가 발생했습니다.")
+            raise
 
-    url = get_presigned_url(s3_key)
-    logger.info("오디오 생성 완료: memo_id=%s s3_key=%s", memo_id, s3_key)
-    return {"audio_url": url, "cached": False}
+        if not await uploader.complete():
+            raise HTTPException(status_code=502, detail="오디오 저장 중 오류가 발생했습니다.")
+        timeline = assembler.timeline
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Memo)
+                .where(Memo.id == memo_id, Memo.audio_s3_key.is_(None))
+                .values(audio_s3_key=s3_key, audio_timeline_json=json.dumps(timeline))
+            )
+            await db.commit()
+        url = await get_presigned_url(s3_key)
+        logger.info("오디오 스트리밍 완료: memo_id=%s s3_key=%s", memo_id, s3_key)
+        return {"audio_url": url, "cached": False, "timeline": timeline}
+    finally:
+        await listener.close()
+
+
+def _timeline(memo: Memo) -> list[dict] | None:
+    return json.loads(memo.audio_timeline_json) if memo.audio_timeline_json else None
+
+
+@router.get("/exchange/{exchange_id}")
+async def get_exchange_audio(
+    exchange_id: int,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """대화 한 줄 오디오 (audio/mpeg) — 줄 id로 지정, 세그먼트 캐시에서 바로 응답"""
+    exchange = await db.scalar(
+        select(DialogueExchange)
+        .join(Memo, Memo.id == DialogueExchange.memo_id)
+        .where(DialogueExchange.id == exchange_id, Memo.user_id == user_id)
+    )
+    if not exchange:
+        raise HTTPException(status_code=404, detail="대화 줄을 찾을 수 없습니다.")
+    try:
+        audio = await synthesize_exchange(exchange.line, exchange.speaker)
+    except Exception as exc:
+        logger.error("TTS 변환 오류: %s", exc)
+        raise HTTPException(status_code=502, detail="음성 생성 중 오류가 발생했습니다.")
+    return Response(content=audio, media_type="audio/mpeg", headers={"Cache-Control": "private, max-age=86400"})
 
 
 @router.get("/download/{memo_id}")
 async def get_audio_download_url(
     memo_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    """15분 유효 임시 다운로드 URL 발급"""
-    memo = db.query(Memo).filter(Memo.id == memo_id, Memo.user_id == user_id).first()
+    """최대 15분 유효 임시 다운로드 URL 발급 — expires_in_seconds는 (캐시된 URL이면) 실제 남은 시간"""
+    memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
     if not memo or not memo.audio_s3_key:
         raise HTTPException(status_code=404, detail="다운로드 가능한 오디오 파일이 없습니다.")
 
-    url = get_presigned_url(memo.audio_s3_key, expires_in=900)
-    return {"download_url": url, "expires_in_seconds": 900}
+    # 캐시된 URL이면 남은 시간이 900초보다 짧음 — 실제 남은 시간을 알려 줌
+    url, expires_in = await get_presigned_url_with_ttl(memo.audio_s3_key, expires_in=900)
+    return {"download_url": url, "expires_in_seconds": expires_in}
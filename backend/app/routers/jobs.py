@@ -0,0 +1,83 @@
+import json
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Header
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal, get_db
+from app.models.job import Job
+from app.schemas.job import JobResponse
+from app.services import job_service
+from app.services.sse import event_stream, format_comment, format_event
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+SSE_WAIT_SECONDS = 15.0
+
+
+def get_user_id(x_session_id: str = Header(...)) -> str:
+    return x_session_id
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """작업 상태/결과 조회 (폴링용)"""
+    job = await job_service.get_job(db, job_id, user_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return _to_response(job)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    작업 상태 Server-Sent Events — 상태가 바뀔 때마다 `status` 이벤트,
+    완료/실패 시 마지막 이벤트를 보내고 종료.
+    """
+    job = await job_service.get_job(db, job_id, user_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return event_stream(_job_events(job_id, user_id))
+
+
+async def _job_events(job_id: str, user_id: str):
+    last_status = None
+    # 읽기 전에 구독 — 읽은 직후 바뀐 상태도 event에 남아 놓치지 않음. 연결이 끊기면 구독 해제.
+    with job_service.watch(job_id) as updated:
+        while True:
+            updated.clear()
+            async with AsyncSessionLocal() as db:
+                job = await job_service.get_job(db, job_id, user_id)
+            if job is None:
+                return
+            if job.status != last_status:
+                last_status = job.status
+                yield format_event("status", _to_response(job).model_dump(mode="json"))
+            if job.status in job_service.TERMINAL_STATUSES:
+                return
+            yield format_comment()
+            await job_service.wait_for_update(updated, timeout=SSE_WAIT_SECONDS)
+
+
+def _to_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        memo_id=job.memo_id,
+        status=job.status,
+        attempts=job.attempts,
+        result=json.loads(job.result_json) if job.result_json else None,
+        error=json.loads(job.error_json) if job.error_json else None,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
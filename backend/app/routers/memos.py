@@ -1,18 +1,73 @@
+import base64
+import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.memo import Memo, MemoStatus
-from app.schemas.memo import MemoCreate, MemoStatusUpdate, MemoResponse, ParseUrlRequest
-from app.services import url_parser_service
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db
+from app.models.dialogue import DialogueExchange
+from app.models.job import Job
+from app.models.memo import Memo, MemoStatus, UrlEnrichmentStatus
+from app.models.tombstone import MemoTombstone
+from app.schemas.memo import (
+    MemoCreate,
+    MemoStatusUpdate,
+    MemoResponse,
+    MemoListItem,
+    MemoPage,
+    MemoSearchItem,
+    MemoSearchPage,
+    MemoSyncResponse,
+    BoardColumn,
+    BoardResponse,
+    BulkParseUrlsRequest,
+    BulkParseUrlsResponse,
+    MemoBatchOperation,
+    MemoBatchRequest,
+    MemoBatchResponse,
+    MemoBatchResult,
+    MemoImportError,
+    MemoImportResponse,
+    MemoRecord,
+    MemoParsedUrls,
+    ParsedUrl,
+    ParseUrlRequest,
+)
+from app.services import job_service, search_service, sync_service, url_parser_service
+from app.services.http_cache import make_etag, not_modified, set_etag
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+CONTENT_PREVIEW_CHARS = 300
+MAX_IMPORT_ERRORS = 100   # 가져오기 응답에 담을 실패 줄 수 상한
+# 내보내기 줄에서 제외 — 대화문 줄 id는 가져올 때 새로 발급
+EXPORT_EXCLUDE = {"ai_dialogue": {"exchanges": {"__all__": {"id"}}}}
+ENRICH_MAX_ROUNDS = 3   # 수집 중 링크가 계속 바뀔 때 재시도 상한
+
+# 목록 프로젝션 — 큰 텍스트 컬럼(AI 결과, 링크 설명, 본문 전체)은 읽지 않음
+LIST_COLUMNS = (
+    Memo.id,
+    func.substr(Memo.content, 1, CONTENT_PREVIEW_CHARS).label("content_preview"),
+    Memo.source_url,
+    Memo.url_title,
+    Memo.url_enrichment_status,
+    Memo.status,
+    Memo.start_date,
+    Memo.end_date,
+    Memo.created_at,
+    Memo.updated_at,
+    func.coalesce(Memo.is_transformed, False).label("is_transformed"),
+    Memo.audio_s3_key.is_not(None).label("has_audio"),
+)
+
 
 def get_user_id(x_session_id: str = Header(...)) -> str:
     """MVP: 헤더 X-Session-Id로 사용자 식별 (추후 JWT 인증으로 교체)"""
@@ -22,10 +77,14 @@ def get_user_id(x_session_id: str = Header(...)) -> str:
 @router.post("", response_model=MemoResponse, status_code=201)
 async def create_memo(
     memo_in: MemoCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    """메모 생성 — 시작일(오늘)/종료일(내일) 자동 할당"""
+    """
+    메모 생성 — 시작일(오늘)/종료일(내일) 자동 할당.
+    source_url이 있으면 링크 메타데이터 수집을 백그라운드 작업으로 예약하고 바로 반환
+    (url_enrichment_status=pending → 완료 시 done/failed).
+    """
     now = datetime.now(timezone.utc)
     memo = Memo(
         user_id=user_id,
@@ -33,35 +92,491 @@ async def create_memo(
         source_url=memo_in.source_url,
         start_date=now,
         end_date=now + timedelta(days=1),
+        created_at=now,
     )
     db.add(memo)
-    db.commit()
-    db.refresh(memo)
+    await db.flush()   # 검색 색인/작업 행에 memo_id가 필요
+    await search_service.index_memos(db, [memo])
+    scheduled = False
+    if memo.source_url:
+        scheduled = await _schedule_enrichment(db, memo, dedupe=False)
+    await db.commit()
+    if scheduled:
+        job_service.wake()
+    await db.refresh(memo)
     logger.info("메모 생성: id=%s user=%s", memo.id, user_id)
     return memo
 
 
-@router.get("", response_model=List[MemoResponse])
+@router.get("", response_model=MemoPage)
 async def list_memos(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    status: Optional[MemoStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    내 메모 목록 (최신순) — (created_at, id) keyset 커서 페이지네이션.
+    상태/생성일 범위 필터 지원. 상세 내용은 GET /{memo_id}로 조회.
+    ETag = 사용자 메모 컬렉션 버전 + 쿼리 — If-None-Match가 같으면 목록을 읽지 않고 304.
+    """
+    etag = make_etag("memos", user_id, *await _collection_version(db, user_id), str(request.query_params))
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_etag(response, etag)
+
+    stmt = select(*LIST_COLUMNS).where(Memo.user_id == user_id)
+    if status is not None:
+        stmt = stmt.where(Memo.status == status)
+    if created_from is not None:
+        stmt = stmt.where(Memo.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(Memo.created_at < created_to)
+    if cursor:
+        stmt = stmt.where(_before_cursor(*_decode_cursor(cursor)))
+
+    rows = (
+        await db.execute(
+            stmt.order_by(Memo.created_at.desc(), Memo.id.desc()).limit(limit + 1)
+        )
+    ).all()
+    items = [MemoListItem.model_validate(row._mapping) for row in rows[:limit]]
+    next_cursor = (
+        _encode_cursor(items[-1].created_at, items[-1].id) if len(rows) > limit else None
+    )
+    return MemoPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/board", response_model=BoardResponse)
+async def get_board(
+    request: Request,
+    response: Response,
+    per_status: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    칸반 보드 — 상태별 개수 + 상태별 최신 N개를 윈도 함수 쿼리 한 번으로 조회.
+    각 열의 추가 로드는 next_cursor로 목록 API를 호출.
+    폴링 시 컬렉션 버전이 그대로면 304 (목록과 같은 ETag 방식).
+    """
+    etag = make_etag("board", user_id, *await _collection_version(db, user_id), per_status)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_etag(response, etag)
+
+    ranked = (
+        select(
+            *LIST_COLUMNS,
+            func.row_number()
+            .over(partition_by=Memo.status, order_by=(Memo.created_at.desc(), Memo.id.desc()))
+            .label("rank"),
+            func.count().over(partition_by=Memo.status).label("status_count"),
+        )
+        .where(Memo.user_id == user_id)
+        .subquery()
+    )
+    rows = (
+        await db.execute(
+            select(ranked)
+            .where(ranked.c.rank <= per_status)
+            .order_by(ranked.c.status, ranked.c.rank)
+        )
+    ).all()
+
+    columns = {status: BoardColumn(status=status, count=0, items=[]) for status in MemoStatus}
+    for row in rows:
+        column = columns[MemoStatus(row.status)]
+        column.count = row.status_count
+        column.items.append(MemoListItem.model_validate(row._mapping))
+    for column in columns.values():
+        if column.count > len(column.items):
+            last = column.items[-1]
+            column.next_cursor = _encode_cursor(last.created_at, last.id)
+
+    return BoardResponse(
+        columns=list(columns.values()),
+        total=sum(column.count for column in columns.values()),
+    )
+
+
+@router.post("/parse-urls", response_model=BulkParseUrlsResponse)
+async def parse_urls_bulk(
+    body: BulkParseUrlsRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    여러 메모의 링크 메타데이터를 한 번에 파싱 후 저장.
+    모든 URL을 동시에 조회(호스트별 동시 요청 제한 + 전체 마감 시간)하고,
+    메모마다 성공한 첫 URL을 대표 링크로 하나의 트랜잭션에서 저장.
+    """
+    memo_ids = list(dict.fromkeys([*body.memo_ids, *(item.memo_id for item in body.items)]))
+    if not memo_ids:
+        raise HTTPException(status_code=400, detail="memo_ids 또는 items가 필요합니다.")
+    memos = {
+        memo.id: memo
+        for memo in await db.scalars(select(Memo).where(Memo.id.in_(memo_ids), Memo.user_id == user_id))
+    }
+
+    # 메모별 URL 목록 — 직접 지정한 URL → 기존 source_url → 본문 추출 순
+    memo_urls: dict[int, list[str]] = {memo_id: [] for memo_id in memo_ids}
+    for item in body.items:
+        memo_urls[item.memo_id].append(item.url.strip())
+    for memo_id in body.memo_ids:
+        memo = memos.get(memo_id)
+        if memo:
+            memo_urls[memo_id] += [memo.source_url] if memo.source_url else []
+            memo_urls[memo_id] += url_parser_service.extract_urls(memo.content)
+    memo_urls = {memo_id: list(dict.fromkeys(urls)) for memo_id, urls in memo_urls.items()}
+
+    all_urls = list(dict.fromkeys(
+        url for memo_id, urls in memo_urls.items() if memo_id in memos for url in urls
+    ))
+    if len(all_urls) > settings.url_bulk_max_urls:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.url_bulk_max_urls}개 URL까지 파싱할 수 있습니다.",
+        )
+    resolved = await url_parser_service.resolve_many(all_urls, deadline=settings.url_bulk_deadline_seconds)
+
+    results = []
+    for memo_id in memo_ids:
+        memo = memos.get(memo_id)
+        if memo is None:
+            results.append(MemoParsedUrls(memo_id=memo_id, error="메모를 찾을 수 없습니다."))
+            continue
+        parsed = [_parsed_url(url, resolved.get(url)) for url in memo_urls[memo_id]]
+        saved = next((item for item in parsed if item.ok), None)
+        if saved:
+            memo.source_url = saved.url
+            memo.url_title = saved.title
+            memo.url_description = saved.description
+            memo.url_enrichment_status = UrlEnrichmentStatus.DONE
+        results.append(MemoParsedUrls(memo_id=memo_id, urls=parsed, saved_url=saved.url if saved else None))
+    await search_service.index_memos(db, memos.values())
+    await db.commit()
+
+    logger.info("링크 일괄 파싱: 메모=%d URL=%d", len(memos), len(all_urls))
+    return BulkParseUrlsResponse(results=results)
+
+
+@router.get("/sync", response_model=MemoSyncResponse)
+async def sync_memos(
+    cursor: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    """내 메모 목록 (최신순)"""
-    return (
-        db.query(Memo)
-        .filter(Memo.user_id == user_id)
-        .order_by(Memo.created_at.desc())
-        .all()
+    """
+    델타 동기화 — 커서 이후 변경된 메모(목록용 경량 프로젝션) + 삭제된 메모 id.
+    커서 없이 호출하면 전체 목록을 updated_at 순 페이지로 내려줌 (reset=True).
+    최근 sync_overlap_seconds 안의 변경은 커서를 전진시키지 않아 다음 호출에 다시 포함
+    (늦게 커밋된 트랜잭션 누락 방지 — 클라이언트는 id 기준 upsert라 중복 무해).
+    """
+    now = datetime.now(timezone.utc)
+    watermark = now - timedelta(seconds=settings.sync_overlap_seconds)
+    memo_key, tombstone_key = _decode_sync_cursor(cursor) if cursor else (None, None)
+    reset = tombstone_key is None
+    if tombstone_key is not None and tombstone_key[0] < sync_service.tombstone_horizon(now):
+        # 삭제 기록이 이미 정리된 구간 — 전체 재동기화
+        memo_key, tombstone_key, reset = None, None, True
+
+    stmt = select(*LIST_COLUMNS).where(Memo.user_id == user_id)
+    if memo_key:
+        stmt = stmt.where(_after_key(Memo.updated_at, Memo.id, memo_key))
+    rows = (await db.execute(stmt.order_by(Memo.updated_at, Memo.id).limit(limit + 1))).all()
+    memos_more = len(rows) > limit
+    changed = [MemoListItem.model_validate(row._mapping) for row in rows[:limit]]
+
+    deleted: list[int] = []
+    tombstones_more = False
+    if tombstone_key is None:
+        # 첫 동기화 — 지금까지의 삭제는 필요 없음, 이후 삭제만 추적
+        next_tombstone_key = (watermark, 0)
+    else:
+        tombstones = (
+            await db.execute(
+                select(MemoTombstone.id, MemoTombstone.memo_id, MemoTombstone.deleted_at)
+                .where(
+                    MemoTombstone.user_id == user_id,
+                    _after_key(MemoTombstone.deleted_at, MemoTombstone.id, tombstone_key),
+                )
+                .order_by(MemoTombstone.deleted_at, MemoTombstone.id)
+                .limit(limit + 1)
+            )
+        ).all()
+        tombstones_more = len(tombstones) > limit
+        deleted = [row.memo_id for row in tombstones[:limit]]
+        next_tombstone_key = _advance_key(
+            tombstone_key,
+            [(row.deleted_at, row.id) for row in tombstones[:limit]],
+            watermark,
+            tombstones_more,
+        )
+
+    next_memo_key = _advance_key(
+        memo_key, [(item.updated_at, item.id) for item in changed], watermark, memos_more
+    )
+    return MemoSyncResponse(
+        changed=changed,
+        deleted=deleted,
+        cursor=_encode_sync_cursor(next_memo_key, next_tombstone_key),
+        has_more=memos_more or tombstones_more,
+        reset=reset,
+    )
+
+
+@router.get("/search", response_model=MemoSearchPage)
+async def search_memos(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    내 메모 전문 검색 — 본문, 링크 제목/설명, AI 요약, 대화문 줄 대상.
+    관련도 순(본문 일치 가중치가 가장 큼), offset 페이지네이션 (next_offset이 None이면 마지막).
+    """
+    ranked = await search_service.search(db, user_id, q, limit=limit + 1, offset=offset)
+    if ranked is None:
+        raise HTTPException(status_code=400, detail="검색어에 검색할 수 있는 단어가 없습니다.")
+    scores = dict(ranked[:limit])
+    rows = {
+        row.id: row
+        for row in await db.execute(
+            select(*LIST_COLUMNS).where(Memo.id.in_(scores), Memo.user_id == user_id)
+        )
+    }
+    items = [
+        MemoSearchItem.model_validate({**rows[memo_id]._mapping, "score": score})
+        for memo_id, score in scores.items()
+        if memo_id in rows
+    ]
+    return MemoSearchPage(items=items, next_offset=offset + limit if len(ranked) > limit else None)
+
+
+@router.post("/batch", response_model=MemoBatchResponse)
+async def batch_update_memos(
+    body: MemoBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    칸반 일괄 변경 — 상태 변경/내용 수정/삭제를 한 트랜잭션에서 적용.
+    소유권 확인 SELECT 한 번 + 종류별 UPDATE/DELETE ... WHERE id IN (...) AND user_id 한 번씩.
+    항목별 결과를 요청 순서대로 반환 — 없는 메모/필드 누락 항목만 실패하고 나머지는 적용.
+    같은 메모에 같은 종류가 여러 번 오면 마지막 항목이 적용되고, 삭제되는 메모의 다른 변경은 건너뜀.
+    """
+    operations = body.operations
+    if not operations:
+        raise HTTPException(status_code=400, detail="operations가 비어 있습니다.")
+    if len(operations) > settings.memo_batch_max_operations:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.memo_batch_max_operations}개까지 변경할 수 있습니다.",
+        )
+
+    owned = {
+        row.id: row.source_url
+        for row in await db.execute(
+            select(Memo.id, Memo.source_url).where(
+                Memo.id.in_({op.memo_id for op in operations}), Memo.user_id == user_id
+            )
+        )
+    }
+    deleting = {op.memo_id for op in operations if op.op == "delete" and op.memo_id in owned}
+
+    results = []
+    statuses: dict[int, MemoStatus] = {}
+    edits: dict[int, MemoBatchOperation] = {}
+    for index, op in enumerate(operations):
+        error = _batch_operation_error(op, owned, deleting)
+        if error is None and op.op == "status":
+            statuses[op.memo_id] = op.status
+        elif error is None and op.op == "edit":
+            edits[op.memo_id] = op
+        results.append(MemoBatchResult(index=index, memo_id=op.memo_id, op=op.op, ok=error is None, error=error))
+
+    if statuses:
+        await db.execute(
+            update(Memo)
+            .where(Memo.id.in_(statuses), Memo.user_id == user_id)
+            .values(status=case(
+                {memo_id: literal(status, Memo.status.type) for memo_id, status in statuses.items()},
+                value=Memo.id,
+            ))
+            .execution_options(synchronize_session=False)
+        )
+
+    scheduled = False
+    if edits:
+        # 링크가 바뀐 메모는 update_memo와 같이 메타데이터 초기화 + 수집 재예약
+        relinked = {
+            memo_id: op.source_url
+            for memo_id, op in edits.items()
+            if op.source_url is not None and op.source_url != owned[memo_id]
+        }
+        values = {"content": case({memo_id: op.content for memo_id, op in edits.items()}, value=Memo.id)}
+        if relinked:
+            values.update(
+                source_url=case(relinked, value=Memo.id, else_=Memo.source_url),
+                url_title=case((Memo.id.in_(relinked), None), else_=Memo.url_title),
+                url_description=case((Memo.id.in_(relinked), None), else_=Memo.url_description),
+                url_enrichment_status=case(
+                    {
+                        memo_id: literal(
+                            UrlEnrichmentStatus.PENDING if url else None, Memo.url_enrichment_status.type
+                        )
+                        for memo_id, url in relinked.items()
+                    },
+                    value=Memo.id,
+                    else_=Memo.url_enrichment_status,
+                ),
+            )
+        await db.execute(
+            update(Memo)
+            .where(Memo.id.in_(edits), Memo.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        for memo_id, url in relinked.items():
+            if url:
+                await job_service.add(db, "enrich_url", user_id, memo_id=memo_id)
+                scheduled = True
+        await search_service.index_memos(db, await db.scalars(select(Memo).where(Memo.id.in_(edits))))
+
+    if deleting:
+        await db.execute(
+            delete(Memo)
+            .where(Memo.id.in_(deleting), Memo.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        await search_service.remove_memos(db, deleting)
+        sync_service.record_deletions(db, user_id, deleting)
+
+    await db.commit()
+    if scheduled:
+        job_service.wake()
+    logger.info(
+        "메모 일괄 변경: 상태=%d 수정=%d 삭제=%d 실패=%d",
+        len(statuses), len(edits), len(deleting), sum(not result.ok for result in results),
+    )
+    return MemoBatchResponse(results=results)
+
+
+@router.post("/import", response_model=MemoImportResponse)
+async def import_memos(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """
+    NDJSON 메모 가져오기 — 한 줄에 메모 하나 (MemoRecord, 내보내기 형식과 동일).
+    요청 본문을 스트리밍으로 읽어 memo_import_chunk_size개씩 bulk INSERT + 커밋
+    (메모리 사용은 청크 크기로 제한, 중간에 끊겨도 커밋된 청크는 유지).
+    잘못된 줄은 건너뛰고 줄 번호와 함께 errors에 기록.
+    memo_import_max_records를 넘은 뒤의 줄도 끝까지 읽어 상한 초과 사유로 failed에 집계
+    (조용히 버려지는 줄 없이 imported + failed가 전체 줄 수와 일치).
+    """
+    imported, failed, scheduled = 0, 0, False
+    errors: list[MemoImportError] = []
+    chunk: list[MemoRecord] = []
+
+    def reject(line_no: int, error: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_IMPORT_ERRORS:
+            errors.append(MemoImportError(line=line_no, error=error))
+
+    async for line_no, line in _ndjson_lines(request):
+        if line is None:
+            reject(line_no, f"줄이 너무 깁니다 (최대 {settings.memo_import_max_line_bytes}바이트).")
+            continue
+        if imported + len(chunk) >= settings.memo_import_max_records:
+            reject(line_no, f"한 번에 최대 {settings.memo_import_max_records}개까지 가져올 수 있습니다.")
+            continue
+        try:
+            record = MemoRecord.model_validate_json(line)
+        except ValidationError as exc:
+            first = exc.errors()[0]
+            reject(line_no, f"{'.'.join(map(str, first['loc'])) or 'line'}: {first['msg']}")
+            continue
+        # 변환 결과는 요약 두 개와 대화문이 함께 있어야 변환된 메모로 저장 가능 (일부만 있으면 이후 변환 응답이 깨짐)
+        if record.ai_dialogue is not None and (record.ai_summary_ko is None or record.ai_summary_en is None):
+            reject(line_no, "ai_dialogue: ai_summary_ko, ai_summary_en과 함께 있어야 합니다.")
+            continue
+        chunk.append(record)
+        if len(chunk) >= settings.memo_import_chunk_size:
+            scheduled |= await _insert_records(db, user_id, chunk)
+            imported += len(chunk)
+            chunk = []
+    if chunk:
+        scheduled |= await _insert_records(db, user_id, chunk)
+        imported += len(chunk)
+
+    if scheduled:
+        job_service.wake()
+    logger.info("메모 가져오기: user=%s 성공=%d 실패=%d", user_id, imported, failed)
+    return MemoImportResponse(imported=imported, failed=failed, errors=errors)
+
+
+@router.get("/export")
+async def export_memos(user_id: str = Depends(get_user_id)):
+    """
+    NDJSON 메모 내보내기 — AI 요약/대화문 포함, 한 줄에 메모 하나 (id 순).
+    서버측 커서(yield_per)로 memo_export_batch_size개씩 읽어 바로 내보냄 — 전체 목록을 메모리에 올리지 않음.
+    요청 세션은 응답 본문 전송 전에 닫히므로 생성기 안에서 별도 세션 사용.
+    """
+    async def lines() -> AsyncIterator[str]:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream_scalars(
+                select(Memo)
+                .where(Memo.user_id == user_id)
+                .order_by(Memo.id)
+                .execution_options(yield_per=settings.memo_export_batch_size)
+            )
+            async for memos in result.partitions():
+                yield "".join(
+                    MemoRecord.model_validate(memo).model_dump_json(exclude=EXPORT_EXCLUDE) + "\n"
+                    for memo in memos
+                )
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="memos.ndjson"'},
     )
 
 
 @router.get("/{memo_id}", response_model=MemoResponse)
 async def get_memo(
     memo_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    memo = _get_memo_or_404(memo_id, user_id, db)
+    """메모 상세 — ETag = id + updated_at, 변경 없으면 본문/대화문을 읽지 않고 304"""
+    version = (
+        await db.execute(select(Memo.updated_at).where(Memo.id == memo_id, Memo.user_id == user_id))
+    ).first()
+    if version is None:
+        raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
+    cached = not_modified(request, _memo_etag(memo_id, version.updated_at))
+    if cached:
+        return cached
+
+    memo = await _get_memo_or_404(memo_id, user_id, db)
+    set_etag(response, _memo_etag(memo.id, memo.updated_at))
     return memo
 
 
@@ -69,42 +584,51 @@ async def get_memo(
 async def update_memo(
     memo_id: int,
     memo_in: MemoCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    """메모 내용 수정"""
-    memo = _get_memo_or_404(memo_id, user_id, db)
+    """메모 내용 수정 — 링크가 바뀌면 메타데이터 수집 다시 예약"""
+    memo = await _get_memo_or_404(memo_id, user_id, db)
     memo.content = memo_in.content
-    if memo_in.source_url is not None:
+    scheduled = False
+    if memo_in.source_url is not None and memo_in.source_url != memo.source_url:
         memo.source_url = memo_in.source_url
-    db.commit()
-    db.refresh(memo)
+        memo.url_title = None
+        memo.url_description = None
+        scheduled = await _schedule_enrichment(db, memo)
+    await search_service.index_memos(db, [memo])
+    await db.commit()
+    if scheduled:
+        job_service.wake()
+    await db.refresh(memo)
     return memo
 
 
 @router.delete("/{memo_id}", status_code=204)
 async def delete_memo(
     memo_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
-    memo = _get_memo_or_404(memo_id, user_id, db)
-    db.delete(memo)
-    db.commit()
+    memo = await _get_memo_or_404(memo_id, user_id, db)
+    await db.delete(memo)
+    await search_service.remove_memos(db, [memo.id])
+    sync_service.record_deletions(db, user_id, [memo.id])
+    await db.commit()
 
 
 @router.patch("/{memo_id}/status", response_model=MemoResponse)
 async def update_memo_status(
     memo_id: int,
     status_in: MemoStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
     """상태 변경 — 칸반 드래그 앤 드롭 / 탭 전환용"""
-    memo = _get_memo_or_404(memo_id, user_id, db)
+    memo = await _get_memo_or_404(memo_id, user_id, db)
     memo.status = status_in.status
-    db.commit()
-    db.refresh(memo)
+    await db.commit()
+    await db.refresh(memo)
     return memo
 
 
@@ -112,24 +636,274 @@ async def update_memo_status(
 async def parse_url_metadata(
     memo_id: int,
     request: ParseUrlRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_user_id),
 ):
     """URL 메타데이터 파싱 후 메모에 저장 (YouTube/일반 웹페이지)"""
-    memo = _get_memo_or_404(memo_id, user_id, db)
-    metadata = await url_parser_service.parse(request.url)
+    memo = await _get_memo_or_404(memo_id, user_id, db)
+    metadata, ok = await url_parser_service.resolve(request.url)
     memo.source_url = request.url
     memo.url_title = metadata.get("title")
     memo.url_description = metadata.get("description")
-    db.commit()
-    db.refresh(memo)
+    memo.url_enrichment_status = UrlEnrichmentStatus.DONE if ok else UrlEnrichmentStatus.FAILED
+    await search_service.index_memos(db, [memo])
+    await db.commit()
+    await db.refresh(memo)
     return {"title": memo.url_title, "description": memo.url_description}
 
 
+# ── 링크 메타데이터 백그라운드 수집 ─────────────────────────────
+
+async def _schedule_enrichment(db: AsyncSession, memo: Memo, dedupe: bool = True) -> bool:
+    """메모의 source_url 수집 작업 추가 (커밋은 호출자 몫) — 예약했으면 True"""
+    if not memo.source_url:
+        memo.url_enrichment_status = None
+        return False
+    memo.url_enrichment_status = UrlEnrichmentStatus.PENDING
+    await job_service.add(db, "enrich_url", memo.user_id, memo_id=memo.id, dedupe=dedupe)
+    return True
+
+
+async def _enrich_url_job(job: Job) -> dict:
+    """
+    작업 시점의 source_url을 읽어 수집 (URL 캐시 경유 → 같은 링크는 네트워크 없이 해결).
+    수집 중 링크가 바뀌면 새 링크로 다시, 그 사이 수동 파싱이 끝났으면 건너뜀.
+    """
+    for _ in range(ENRICH_MAX_ROUNDS):
+        async with AsyncSessionLocal() as db:
+            memo = await db.get(Memo, job.memo_id)
+            if not memo or memo.url_enrichment_status != UrlEnrichmentStatus.PENDING:
+                return {"skipped": True}
+            url = memo.source_url
+
+        metadata, ok = await url_parser_service.resolve(url)
+        async with AsyncSessionLocal() as db:
+            updated = await db.execute(
+                update(Memo)
+                .where(
+                    Memo.id == job.memo_id,
+                    Memo.source_url == url,
+                    Memo.url_enrichment_status == UrlEnrichmentStatus.PENDING,
+                )
+                .values(
+                    url_title=metadata.get("title"),
+                    url_description=metadata.get("description"),
+                    url_enrichment_status=UrlEnrichmentStatus.DONE if ok else UrlEnrichmentStatus.FAILED,
+                )
+            )
+            if updated.rowcount:
+                await search_service.index_memos(db, [await db.get(Memo, job.memo_id)])
+            await db.commit()
+        if updated.rowcount:
+            logger.info("링크 메타데이터 수집: memo_id=%s ok=%s", job.memo_id, ok)
+            return {"url": url, "ok": ok}
+    return {"skipped": True}
+
+
+job_service.register("enrich_url", _enrich_url_job)
+
+
 # ── 내부 헬퍼 ──────────────────────────────────────────────────
 
-def _get_memo_or_404(memo_id: int, user_id: str, db: Session) -> Memo:
-    memo = db.query(Memo).filter(Memo.id == memo_id, Memo.user_id == user_id).first()
+async def _ndjson_lines(request: Request) -> AsyncIterator[tuple[int, Optional[bytes]]]:
+    """
+    요청 본문 → (줄 번호, 줄) — 빈 줄은 건너뜀.
+    memo_import_max_line_bytes를 넘는 줄은 버퍼에 쌓지 않고 (줄 번호, None) 한 번만 반환.
+    """
+    limit = settings.memo_import_max_line_bytes
+    # 아직 끝나지 않은 줄의 조각 — 새 청크만 split하고 줄이 끝날 때 한 번만 합침 (누적 재복사 없음)
+    tail: list[bytes] = []
+    tail_size, line_no, oversized = 0, 0, False
+    async for chunk in request.stream():
+        *complete, rest = chunk.split(b"\n")
+        for piece in complete:
+            line_no += 1
+            if oversized or tail_size + len(piece) > limit:
+                yield line_no, None
+            else:
+                line = b"".join(tail) + piece if tail else piece
+                if line.strip():
+                    yield line_no, line
+            tail, tail_size, oversized = [], 0, False
+        if oversized:
+            continue
+        tail_size += len(rest)
+        if tail_size > limit:
+            tail, tail_size, oversized = [], 0, True
+        elif rest:
+            tail.append(rest)
+    if oversized:
+        yield line_no + 1, None
+    elif tail and (line := b"".join(tail)).strip():
+        yield line_no + 1, line
+
+
+async def _insert_records(db: AsyncSession, user_id: str, records: list[MemoRecord]) -> bool:
+    """
+    가져온 메모 한 청크 저장 — 메모/대화문 줄 bulk INSERT + 검색 색인 + 커밋.
+    제목 없는 링크는 create_memo처럼 메타데이터 수집 예약 — 예약했으면 True.
+    """
+    now = datetime.now(timezone.utc)
+    rows = []
+    for record in records:
+        start_date = record.start_date or now
+        rows.append({
+            "user_id": user_id,
+            "content": record.content,
+            "source_url": record.source_url,
+            "url_title": record.url_title,
+            "url_description": record.url_description,
+            "url_enrichment_status": (
+                None if not record.source_url
+                else UrlEnrichmentStatus.DONE if record.url_title
+                else UrlEnrichmentStatus.PENDING
+            ),
+            "status": record.status,
+            "start_date": start_date,
+            "end_date": record.end_date or start_date + timedelta(days=1),
+            "created_at": record.created_at or now,
+            "is_transformed": record.ai_dialogue is not None,
+            "ai_summary_ko": record.ai_summary_ko,
+            "ai_summary_en": record.ai_summary_en,
+            "dialogue_title": record.ai_dialogue.title if record.ai_dialogue else None,
+            "dialogue_situation": record.ai_dialogue.situation if record.ai_dialogue else None,
+        })
+    memo_ids = (
+        await db.scalars(insert(Memo).returning(Memo.id, sort_by_parameter_order=True), rows)
+    ).all()
+
+    exchanges = [
+        {
+            "memo_id": memo_id,
+            "position": position,
+            "speaker": exchange.speaker,
+            "line": exchange.line,
+            "korean": exchange.korean,
+        }
+        for memo_id, record in zip(memo_ids, records)
+        if record.ai_dialogue
+        for position, exchange in enumerate(record.ai_dialogue.exchanges)
+    ]
+    if exchanges:
+        await db.execute(insert(DialogueExchange), exchanges)
+
+    pending = [
+        memo_id for memo_id, row in zip(memo_ids, rows)
+        if row["url_enrichment_status"] == UrlEnrichmentStatus.PENDING
+    ]
+    for memo_id in pending:
+        await job_service.add(db, "enrich_url", user_id, memo_id=memo_id, dedupe=False)
+    await search_service.index_memo_ids(db, memo_ids)
+    await db.commit()
+    return bool(pending)
+
+
+def _batch_operation_error(op: MemoBatchOperation, owned: dict[int, Optional[str]], deleting: set[int]) -> Optional[str]:
+    if op.memo_id not in owned:
+        return "메모를 찾을 수 없습니다."
+    if op.op != "delete" and op.memo_id in deleting:
+        return "같은 요청에서 삭제되는 메모입니다."
+    if op.op == "status" and op.status is None:
+        return "status가 필요합니다."
+    if op.op == "edit" and op.content is None:
+        return "content가 필요합니다."
+    return None
+
+
+def _parsed_url(url: str, result: Optional[tuple[dict, bool]]) -> ParsedUrl:
+    if result is None:
+        return ParsedUrl(url=url, ok=False, error="timeout")
+    metadata, ok = result
+    if not ok:
+        return ParsedUrl(url=url, ok=False, error="fetch_failed")
+    return ParsedUrl(url=url, ok=True, title=metadata.get("title"), description=metadata.get("description"))
+
+
+def _encode_cursor(created_at: datetime, memo_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), memo_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, memo_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(memo_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _memo_etag(memo_id: int, updated_at: Optional[datetime]) -> str:
+    return make_etag("memo", memo_id, _as_utc(updated_at).isoformat() if updated_at else None)
+
+
+async def _collection_version(db: AsyncSession, user_id: str) -> tuple:
+    """
+    목록/보드 ETag용 버전 — (최신 updated_at, 개수).
+    (user_id, updated_at) 인덱스만 읽음. 생성/수정은 최신 시각, 삭제는 개수로 반영.
+    """
+    row = (
+        await db.execute(
+            select(func.max(Memo.updated_at), func.count()).where(Memo.user_id == user_id)
+        )
+    ).one()
+    return tuple(row)
+
+
+def _encode_sync_cursor(memo_key: Optional[tuple[datetime, int]], tombstone_key: tuple[datetime, int]) -> str:
+    raw = json.dumps({
+        "m": [memo_key[0].isoformat(), memo_key[1]] if memo_key else None,
+        "t": [tombstone_key[0].isoformat(), tombstone_key[1]],
+    })
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_sync_cursor(cursor: str) -> tuple[Optional[tuple[datetime, int]], tuple[datetime, int]]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        memo_key = (_as_utc(datetime.fromisoformat(data["m"][0])), int(data["m"][1])) if data["m"] else None
+        return memo_key, (_as_utc(datetime.fromisoformat(data["t"][0])), int(data["t"][1]))
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _advance_key(
+    previous: Optional[tuple[datetime, int]],
+    keys: list[tuple[datetime, int]],
+    watermark: datetime,
+    has_more: bool,
+) -> Optional[tuple[datetime, int]]:
+    """
+    다음 동기화 커서 — 이어지는 페이지가 있으면 마지막 행,
+    마지막 페이지면 watermark까지 전진 (그 이전 행은 모두 받았으므로).
+    변경이 없어도 커서가 watermark를 따라가야 오래 켜 둔 클라이언트가 보관 기간에 걸려 재동기화되지 않음.
+    """
+    if has_more:
+        return _as_utc(keys[-1][0]), keys[-1][1]
+    floor = (watermark, 0)
+    return max(previous, floor) if previous else floor
+
+
+def _after_key(at_column, id_column, key: tuple[datetime, int]):
+    """(시각, id) 오름차순 기준으로 커서 다음 행 조건"""
+    at, row_id = key
+    return or_(at_column > at, and_(at_column == at, id_column > row_id))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite는 시간대 없이 저장 — UTC로 간주"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _before_cursor(created_at: datetime, memo_id: int):
+    """(created_at, id) 내림차순 기준으로 커서 다음 행 조건"""
+    return or_(
+        Memo.created_at < created_at,
+        and_(Memo.created_at == created_at, Memo.id < memo_id),
+    )
+
+
+async def _get_memo_or_404(memo_id: int, user_id: str, db: AsyncSession) -> Memo:
+    memo = await db.scalar(select(Memo).where(Memo.id == memo_id, Memo.user_id == user_id))
     if not memo:
         raise HTTPException(status_code=404, detail="메모를 찾을 수 없습니다.")
     return memo
@@ -0,0 +1,27 @@
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel
+from app.models.job import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobAccepted(BaseModel):
+    """작업 등록 응답 (202)"""
+    job_id: str
+    status: JobStatus
+
+
+class JobResponse(BaseModel):
+    """작업 상태/결과 조회 응답"""
+    id: str
+    kind: str
+    memo_id: Optional[int] = None
+    status: JobStatus
+    attempts: int
+    result: Optional[Any] = None     # 성공 시 작업별 결과 (예: TransformResponse)
+    error: Optional[dict] = None     # 실패 시 {"status_code", "detail"}
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
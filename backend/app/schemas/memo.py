@@ -1,8 +1,8 @@
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 from pydantic import BaseModel, HttpUrl
-from app.models.memo import MemoStatus
+from app.models.memo import MemoStatus, UrlEnrichmentStatus
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,43 @@ class MemoStatusUpdate(BaseModel):
     status: MemoStatus
 
 
+class BulkParseUrlItem(BaseModel):
+    """일괄 링크 파싱 — 메모에 붙일 URL 직접 지정"""
+    memo_id: int
+    url: str
+
+
+class BulkParseUrlsRequest(BaseModel):
+    """
+    일괄 링크 파싱 요청.
+    memo_ids: 메모 본문/source_url에서 URL 자동 추출, items: 메모별 URL 직접 지정 (둘 다 사용 가능)
+    """
+    memo_ids: List[int] = []
+    items: List[BulkParseUrlItem] = []
+
+
+class MemoBatchOperation(BaseModel):
+    """
+    일괄 변경 항목 하나 — op별 필요한 필드:
+    status → status / edit → content (+ 선택 source_url) / delete → 없음
+    """
+    op: Literal["status", "edit", "delete"]
+    memo_id: int
+    status: Optional[MemoStatus] = None
+    content: Optional[str] = None
+    source_url: Optional[str] = None
+
+
+class MemoBatchRequest(BaseModel):
+    """메모 일괄 변경 요청 (최대 memo_batch_max_operations개, 한 트랜잭션)"""
+    operations: List[MemoBatchOperation]
+
+
+class BatchTransformRequest(BaseModel):
+    """일괄 AI 변환 요청 (최대 transform_batch_max_memos개)"""
+    memo_ids: List[int]
+
+
 class ParseUrlRequest(BaseModel):
     """URL 메타데이터 파싱 요청"""
     url: str
@@ -28,11 +65,14 @@ class ParseUrlRequest(BaseModel):
 # ── 응답 스키마 ────────────────────────────────────────────────
 
 class DialogueExchange(BaseModel):
-    """대화문 한 줄"""
+    """대화문 한 줄 — 저장된 줄은 id로 개별 조회/TTS 주소 지정 가능"""
+    id: Optional[int] = None
     speaker: str   # "A" | "B"
     line: str
     korean: str
 
+    model_config = {"from_attributes": True}
+
 
 class AIDialogue(BaseModel):
     """AI 생성 대화문 전체 구조"""
@@ -40,6 +80,44 @@ class AIDialogue(BaseModel):
     situation: str
     exchanges: List[DialogueExchange]
 
+    model_config = {"from_attributes": True}
+
+
+class MemoRecord(BaseModel):
+    """
+    NDJSON 가져오기/내보내기 한 줄 (메모 하나) — 가져오기는 content만 필수.
+    id/updated_at은 내보내기 참고용 (가져오기 시 무시, 새 id 발급).
+    날짜가 없으면 create_memo와 같은 기본값 (시작일=지금, 종료일=시작일+1일, 생성일=지금).
+    """
+    id: Optional[int] = None
+    content: str
+    source_url: Optional[str] = None
+    url_title: Optional[str] = None
+    url_description: Optional[str] = None
+    status: MemoStatus = MemoStatus.NOT_STARTED
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    ai_summary_ko: Optional[str] = None
+    ai_summary_en: Optional[str] = None
+    ai_dialogue: Optional[AIDialogue] = None
+
+    model_config = {"from_attributes": True}
+
+
+class MemoImportError(BaseModel):
+    """가져오기 실패 줄 — line은 1부터"""
+    line: int
+    error: str
+
+
+class MemoImportResponse(BaseModel):
+    """NDJSON 가져오기 결과 — errors는 앞쪽 일부만"""
+    imported: int
+    failed: int
+    errors: List[MemoImportError]
+
 
 class MemoResponse(BaseModel):
     """메모 단건 응답"""
@@ -49,6 +127,7 @@ class MemoResponse(BaseModel):
     source_url: Optional[str] = None
     url_title: Optional[str] = None
     url_description: Optional[str] = None
+    url_enrichment_status: Optional[UrlEnrichmentStatus] = None   # 링크 메타데이터 백그라운드 수집 상태
     status: MemoStatus
     start_date: datetime
     end_date: Optional[datetime] = None
@@ -57,12 +136,75 @@ class MemoResponse(BaseModel):
     is_transformed: bool
     ai_summary_ko: Optional[str] = None
     ai_summary_en: Optional[str] = None
-    ai_dialogue_json: Optional[str] = None   # JSON 문자열 그대로 전달
+    ai_dialogue: Optional[AIDialogue] = None   # 구조화 대화문 (클라이언트 재파싱 불필요)
     audio_s3_key: Optional[str] = None
+    audio_timeline_json: Optional[str] = None
 
     model_config = {"from_attributes": True}
 
 
+class MemoListItem(BaseModel):
+    """메모 목록용 경량 프로젝션 — 본문은 미리보기만, AI 결과/링크 설명 제외"""
+    id: int
+    content_preview: str
+    source_url: Optional[str] = None
+    url_title: Optional[str] = None
+    url_enrichment_status: Optional[UrlEnrichmentStatus] = None
+    status: MemoStatus
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    is_transformed: bool
+    has_audio: bool
+
+    model_config = {"from_attributes": True}
+
+
+class MemoPage(BaseModel):
+    """메모 목록 페이지 — next_cursor가 None이면 마지막 페이지"""
+    items: List[MemoListItem]
+    next_cursor: Optional[str] = None
+
+
+class MemoSearchItem(MemoListItem):
+    """검색 결과 한 건 — score가 클수록 관련도 높음"""
+    score: float
+
+
+class MemoSearchPage(BaseModel):
+    """검색 결과 페이지 — next_offset이 None이면 마지막 페이지"""
+    items: List[MemoSearchItem]
+    next_offset: Optional[int] = None
+
+
+class MemoSyncResponse(BaseModel):
+    """
+    델타 동기화 응답 — changed는 id 기준 upsert, deleted는 로컬에서 제거.
+    cursor는 다음 호출에 그대로 전달, has_more면 즉시 이어서 호출.
+    reset=True면 로컬 목록을 비운 뒤 적용 (첫 동기화 / 삭제 기록 보관 기간이 지난 커서).
+    """
+    changed: List[MemoListItem]
+    deleted: List[int]
+    cursor: str
+    has_more: bool
+    reset: bool = False
+
+
+class BoardColumn(BaseModel):
+    """칸반 보드 한 열 — next_cursor로 GET /api/memos?status=...&cursor=... 추가 로드"""
+    status: MemoStatus
+    count: int
+    items: List[MemoListItem]
+    next_cursor: Optional[str] = None
+
+
+class BoardResponse(BaseModel):
+    """칸반 보드 전체 (상태 4개 열)"""
+    columns: List[BoardColumn]
+    total: int
+
+
 class TransformResponse(BaseModel):
     """AI 변환 결과 응답"""
     summary_ko: str
@@ -71,6 +213,60 @@ class TransformResponse(BaseModel):
     credits_remaining: int
 
 
+class ParsedUrl(BaseModel):
+    """URL 하나의 파싱 결과 — ok=False면 실패/마감 초과 (error에 사유)"""
+    url: str
+    ok: bool
+    title: Optional[str] = None
+    description: Optional[str] = None
+    error: Optional[str] = None
+
+
+class MemoParsedUrls(BaseModel):
+    """메모별 일괄 파싱 결과 — saved_url: 메모에 저장된 대표 링크 (성공한 첫 URL)"""
+    memo_id: int
+    urls: List[ParsedUrl] = []
+    saved_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkParseUrlsResponse(BaseModel):
+    """일괄 링크 파싱 응답"""
+    results: List[MemoParsedUrls]
+
+
+class MemoBatchResult(BaseModel):
+    """일괄 변경 항목별 결과 — index는 요청 operations의 위치"""
+    index: int
+    memo_id: int
+    op: str
+    ok: bool
+    error: Optional[str] = None
+
+
+class MemoBatchResponse(BaseModel):
+    """일괄 변경 응답 — 요청 순서대로 결과"""
+    results: List[MemoBatchResult]
+
+
+class BatchTransformItem(BaseModel):
+    """일괄 변환 메모별 결과 — 실패한 메모는 error({status_code, detail})만 채움"""
+    memo_id: int
+    ok: bool
+    cached: bool = False                 # 기존 변환/중복 캐시 재사용 (크레딧 차감 없음)
+    summary_ko: Optional[str] = None
+    summary_en: Optional[str] = None
+    dialogue: Optional[AIDialogue] = None
+    error: Optional[dict] = None
+
+
+class BatchTransformResponse(BaseModel):
+    """일괄 변환 응답 — 요청 순서대로 결과"""
+    results: List[BatchTransformItem]
+    credits_used: int
+    credits_remaining: int
+
+
 class CreditsResponse(BaseModel):
     """크레딧 현황 응답"""
     daily_credits: int
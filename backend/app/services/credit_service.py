@@ -0,0 +1,129 @@
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import case, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import is_sqlite
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_insert = sqlite_insert if is_sqlite else pg_insert
+
+
+@dataclass(frozen=True)
+class CreditBalance:
+    daily_credits: int
+    is_premium: bool
+
+
+def _is_new_day(today: date):
+    return User.credits_reset_date < today
+
+
+async def get_balance(db: AsyncSession, session_id: str) -> CreditBalance:
+    """
+    잔여 크레딧 조회 — 신규 세션 생성 + 자정 리셋을 UPSERT ... RETURNING 한 문장으로 처리.
+    """
+    today = date.today()
+    max_credits = settings.daily_free_credits
+    stmt = (
+        _insert(User)
+        .values(session_id=session_id, daily_credits=max_credits, credits_reset_date=today, is_premium=False)
+        .on_conflict_do_update(
+            index_elements=[User.session_id],
+            set_={
+                "daily_credits": case((_is_new_day(today), max_credits), else_=User.daily_credits),
+                "credits_reset_date": today,
+            },
+        )
+        .returning(User.daily_credits, User.is_premium)
+    )
+    row = (await db.execute(stmt)).one()
+    await db.commit()
+    return CreditBalance(daily_credits=row.daily_credits, is_premium=bool(row.is_premium))
+
+
+async def reserve(db: AsyncSession, session_id: str, amount: int = 1) -> Optional[CreditBalance]:
+    """
+    크레딧 예약(선차감) — 신규 생성/자정 리셋/잔액 확인/차감을 조건부 UPSERT 한 문장으로 처리.
+    잔액 부족이면 None. 프리미엄은 차감하지 않음.
+    동시 요청이 같은 행을 두고 경쟁해도 WHERE 조건이 행 잠금 하에 평가되어 초과 차감 없음.
+    """
+    today = date.today()
+    max_credits = settings.daily_free_credits
+    if amount > max_credits:
+        # 신규 세션 INSERT 분기에서 음수 잔액이 생기지 않도록 — 프리미엄만 가능
+        balance = await get_balance(db, session_id)
+        return balance if balance.is_premium else None
+
+    stmt = (
+        _insert(User)
+        .values(
+            session_id=session_id,
+            daily_credits=max_credits - amount,
+            credits_reset_date=today,
+            is_premium=False,
+        )
+        .on_conflict_do_update(
+            index_elements=[User.session_id],
+            set_={
+                "daily_credits": case(
+                    (User.is_premium, case((_is_new_day(today), max_credits), else_=User.daily_credits)),
+                    (_is_new_day(today), max_credits - amount),
+                    else_=User.daily_credits - amount,
+                ),
+                "credits_reset_date": today,
+            },
+            where=or_(User.is_premium, _is_new_day(today), User.daily_credits >= amount),
+        )
+        .returning(User.daily_credits, User.is_premium)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    await db.commit()
+    if row is None:
+        return None
+    return CreditBalance(daily_credits=row.daily_credits, is_premium=bool(row.is_premium))
+
+
+async def reserve_up_to(db: AsyncSession, session_id: str, amount: int) -> tuple[int, Optional[CreditBalance]]:
+    """
+    가능한 만큼만 예약 → (예약 수, 잔액). 잔액이 없으면 (0, None).
+    잔액 확인과 예약 사이에 다른 요청이 먼저 차감했으면 줄어든 잔액으로 다시 시도.
+    """
+    while True:
+        balance = await get_balance(db, session_id)
+        granted = amount if balance.is_premium else min(amount, balance.daily_credits)
+        if granted <= 0:
+            return 0, None
+        reserved = await reserve(db, session_id, amount=granted)
+        if reserved is not None:
+            return granted, reserved
+
+
+async def refund(db: AsyncSession, session_id: str, amount: int = 1) -> None:
+    """
+    예약 환불 — 외부 API 실패 등으로 작업이 완료되지 않은 경우.
+    예약한 날과 같은 날에만, 일일 한도를 넘지 않게 되돌림.
+    """
+    if amount <= 0:
+        return
+    max_credits = settings.daily_free_credits
+    refunded = User.daily_credits + amount
+    await db.execute(
+        update(User)
+        .where(
+            User.session_id == session_id,
+            User.credits_reset_date == date.today(),
+            User.is_premium.is_not(True),
+        )
+        .values(daily_credits=case((refunded > max_credits, max_credits), else_=refunded))
+    )
+    await db.commit()
+    logger.info("크레딧 환불: user=%s amount=%s", session_id, amount)
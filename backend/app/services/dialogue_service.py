@@ -0,0 +1,100 @@
+import json
+import logging
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dialogue import DialogueExchange
+from app.models.memo import Memo
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def apply_dialogue(memo: Memo, dialogue: dict) -> None:
+    """
+    검증된 대화문(dict)을 메모에 저장 — 제목/상황은 메모 컬럼, 줄은 dialogue_exchanges 행.
+    기존 줄은 delete-orphan으로 정리 (memo.exchanges가 로드된 상태여야 함).
+    """
+    memo.dialogue_title = dialogue["title"]
+    memo.dialogue_situation = dialogue.get("situation", "")
+    memo.exchanges = [
+        DialogueExchange(
+            position=position,
+            speaker=exchange["speaker"],
+            line=exchange["line"],
+            korean=exchange["korean"],
+        )
+        for position, exchange in enumerate(dialogue["exchanges"])
+    ]
+    memo.ai_dialogue_json = None
+
+
+def has_dialogue(memo: Memo) -> bool:
+    return memo.is_transformed and memo.dialogue_title is not None
+
+
+def tts_lines(memo: Memo) -> list[dict]:
+    """TTS 파이프라인 입력 — 줄 id 포함 (타임라인에서 줄 단위 주소 지정)"""
+    return [
+        {"id": exchange.id, "speaker": exchange.speaker, "line": exchange.line}
+        for exchange in memo.exchanges
+    ]
+
+
+async def backfill_legacy_dialogues(db: AsyncSession) -> int:
+    """
+    구버전 ai_dialogue_json 문자열 → dialogue_title/situation + dialogue_exchanges 행으로 이전.
+    앱 시작 시 id 순 배치로 실행, 옮긴 메모는 JSON 컬럼을 비워 다시 처리하지 않음.
+    파싱할 수 없는 행은 원본을 그대로 두고 건너뜀.
+    """
+    migrated, last_id = 0, 0
+    while True:
+        rows = (
+            await db.execute(
+                select(Memo.id, Memo.ai_dialogue_json)
+                .where(Memo.ai_dialogue_json.is_not(None), Memo.id > last_id)
+                .order_by(Memo.id)
+                .limit(BACKFILL_BATCH_SIZE)
+            )
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        memo_rows, exchange_rows = [], []
+        for memo_id, raw in rows:
+            try:
+                dialogue = json.loads(raw)
+                exchanges = [
+                    {
+                        "memo_id": memo_id,
+                        "position": position,
+                        "speaker": str(exchange["speaker"]),
+                        "line": str(exchange["line"]),
+                        "korean": str(exchange.get("korean", "")),
+                    }
+                    for position, exchange in enumerate(dialogue["exchanges"])
+                ]
+                memo_rows.append({
+                    "id": memo_id,
+                    "dialogue_title": str(dialogue.get("title", "")),
+                    "dialogue_situation": str(dialogue.get("situation", "")),
+                    "ai_dialogue_json": None,
+                })
+            except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                logger.warning("대화문 이전 건너뜀: memo_id=%s (%s)", memo_id, exc)
+                continue
+            exchange_rows += exchanges
+
+        if memo_rows:
+            await db.execute(update(Memo), memo_rows)      # 기본키 기준 일괄 UPDATE
+        if exchange_rows:
+            await db.execute(insert(DialogueExchange), exchange_rows)
+        await db.commit()
+        migrated += len(memo_rows)
+
+    if migrated:
+        logger.info("구버전 대화문 이전 완료: %d개 메모", migrated)
+    return migrated
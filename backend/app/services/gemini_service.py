@@ -1,6 +1,10 @@
+import asyncio
 import logging
 import json
 import os
+import random
+from typing import AsyncIterator
+
 import certifi
 
 # Windows SSL 인증서 경로 강제 설정 — google.genai 임포트 전에 반드시 먼저 설정
@@ -9,11 +13,18 @@ os.environ["SSL_CERT_FILE"] = certifi.where()
 os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+GEMINI_MODEL = "gemini-2.5-flash"
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 프로세스 전역 클라이언트 (커넥션 풀 재사용) + 동시 호출 수 제한
+_client: genai.Client | None = None
+_semaphore = asyncio.Semaphore(settings.gemini_max_concurrency)
+
 SYSTEM_PROMPT = """You are an English conversation learning assistant for the Memolish app.
 
 ## Your Role
@@ -43,27 +54,179 @@ You MUST return ONLY a valid JSON object — no markdown, no explanation text, n
 3. Each line should be 1-2 sentences maximum.
 4. ALWAYS return valid JSON only."""
 
+# 일괄 변환: 시스템 프롬프트는 한 번만 보내고 메모별 결과를 배열로 받음
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
 
-async def transform_memo_with_gemini(source_text: str) -> dict:
-    """메모 텍스트를 Gemini API로 변환. 수동 트리거 전용."""
+## Batch Mode
+The user message contains several memos, each introduced by a line `[memo_id=<number>]`.
+Transform every memo independently, following all rules above, and return a JSON array
+instead of a single object — one element per memo, in any order:
+
+[
+  {"memo_id": <number copied from the header>, "summary_ko": "...", "summary_en": "...", "dialogue": {...}}
+]
+
+Never merge memos together and never omit a memo."""
+
+
+def _get_client() -> genai.Client:
+    global _client
     if not settings.gemini_api_key:
         raise RuntimeError("GEMINI_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
+    if _client is None:
+        _client = genai.Client(api_key=settings.gemini_api_key)
+    return _client
 
-    client = genai.Client(api_key=settings.gemini_api_key)
-    user_prompt = (
+
+async def close_client() -> None:
+    """앱 종료 시 비동기 HTTP 커넥션 정리"""
+    global _client
+    if _client is not None:
+        aclose = getattr(_client.aio, "aclose", None)
+        if aclose:
+            await aclose()
+        _client = None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    return isinstance(exc, errors.APIError) and exc.code in RETRYABLE_STATUS_CODES
+
+
+async def _generate_content(
+    contents: str,
+    config: types.GenerateContentConfig,
+    timeout: float | None = None,
+):
+    """
+    client.aio로 Gemini 호출 — 세마포어로 동시 호출 수 제한, 호출별 타임아웃,
+    429/5xx/타임아웃은 지수 백오프 + full jitter로 재시도.
+    """
+    client = _get_client()
+    for attempt in range(settings.gemini_max_retries + 1):
+        try:
+            async with _semaphore:
+                return await asyncio.wait_for(
+                    client.aio.models.generate_content(
+                        model=GEMINI_MODEL, contents=contents, config=config
+                    ),
+                    timeout=timeout or settings.gemini_timeout_seconds,
+                )
+        except Exception as exc:
+            if attempt >= settings.gemini_max_retries or not _is_retryable(exc):
+                raise
+            await _backoff(attempt, exc)
+
+
+async def _backoff(attempt: int, exc: Exception) -> None:
+    """지수 백오프 + full jitter 대기"""
+    cap = min(
+        settings.gemini_backoff_max_seconds,
+        settings.gemini_backoff_base_seconds * 2 ** attempt,
+    )
+    delay = random.uniform(0, cap)
+    logger.warning(
+        "Gemini 재시도 %d/%d (%.2fs 후): %r",
+        attempt + 1, settings.gemini_max_retries, delay, exc,
+    )
+    await asyncio.sleep(delay)
+
+
+def _transform_prompt(source_text: str) -> str:
+    return (
         "다음 메모를 분석하고 영어 학습 콘텐츠로 변환해 주세요."
         " 반드시 유효한 JSON만 반환하고 다른 텍스트는 포함하지 마세요.\n\n"
         f"---\n{source_text}\n---"
     )
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=SYSTEM_PROMPT,
-            temperature=0.7,
-            response_mime_type="application/json",
-        ),
+
+
+def _transform_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT,
+        temperature=0.7,
+        response_mime_type="application/json",
     )
+
+
+async def transform_memo_with_gemini(source_text: str) -> dict:
+    """메모 텍스트를 Gemini API로 변환. 수동 트리거 전용."""
+    response = await _generate_content(_transform_prompt(source_text), _transform_config())
     result = json.loads(response.text)
     logger.info("Gemini 변환 완료 (exchanges=%s)", len(result["dialogue"]["exchanges"]))
     return result
+
+
+async def stream_transform_with_gemini(source_text: str) -> AsyncIterator[str]:
+    """
+    스트리밍 변환 — 응답 JSON 텍스트 조각을 도착 순서대로 반환.
+    이미 조각을 내보낸 뒤에는 중복 출력이 되므로 첫 조각 전 실패만 재시도.
+    gemini_timeout_seconds는 조각 사이의 최대 대기 시간으로 적용.
+    """
+    client = _get_client()
+    for attempt in range(settings.gemini_max_retries + 1):
+        started = False
+        try:
+            async with _semaphore:
+                stream = await asyncio.wait_for(
+                    client.aio.models.generate_content_stream(
+                        model=GEMINI_MODEL,
+                        contents=_transform_prompt(source_text),
+                        config=_transform_config(),
+                    ),
+                    timeout=settings.gemini_timeout_seconds,
+                )
+                chunks = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), timeout=settings.gemini_timeout_seconds
+                        )
+                    except StopAsyncIteration:
+                        break
+                    if chunk.text:
+                        started = True
+                        yield chunk.text
+            return
+        except Exception as exc:
+            if started or attempt >= settings.gemini_max_retries or not _is_retryable(exc):
+                raise
+            await _backoff(attempt, exc)
+
+
+async def transform_memos_batch_with_gemini(sources: dict[int, str]) -> dict[int, dict]:
+    """
+    여러 메모를 한 번의 Gemini 호출로 변환 — {memo_id: 결과}.
+    응답에서 빠졌거나 형식이 어긋난 메모는 결과에 포함하지 않음 (호출자가 개별 재시도).
+    """
+    sections = "\n\n".join(
+        f"[memo_id={memo_id}]\n---\n{source_text}\n---" for memo_id, source_text in sources.items()
+    )
+    user_prompt = (
+        f"다음 메모 {len(sources)}개를 각각 분석하고 영어 학습 콘텐츠로 변환해 주세요."
+        " memo_id를 그대로 포함한 JSON 배열만 반환하고 다른 텍스트는 포함하지 마세요.\n\n"
+        f"{sections}"
+    )
+    response = await _generate_content(
+        user_prompt,
+        types.GenerateContentConfig(
+            system_instruction=BATCH_SYSTEM_PROMPT,
+            temperature=0.7,
+            response_mime_type="application/json",
+        ),
+        timeout=settings.gemini_batch_timeout_seconds,
+    )
+    items = json.loads(response.text)
+    if isinstance(items, dict):
+        items = items.get("results", [])
+
+    results: dict[int, dict] = {}
+    for item in items if isinstance(items, list) else []:
+        try:
+            memo_id = int(item.pop("memo_id"))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
+        if memo_id in sources:
+            results[memo_id] = item
+    logger.info("Gemini 일괄 변환 완료 (요청=%d, 응답=%d)", len(sources), len(results))
+    return results
@@ -0,0 +1,133 @@
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# <head>가 끝났다고 볼 수 있는 본문 태그 (</head>를 생략한 문서 대비)
+BODY_TAGS = {"body", "main", "article", "header", "nav", "section", "div", "p", "h1"}
+META_CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+SNIFF_BYTES = 2048
+
+
+class HeadMetadataParser(HTMLParser):
+    """
+    <head> 영역에서 og:title / og:description / meta description / <title>만 수집하는 이벤트 파서.
+    feed()로 조각을 넣을 수 있고, </head>(또는 본문 태그)를 만나면 done=True — 이후 입력은 무시.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.og_title = ""
+        self.og_description = ""
+        self.meta_description = ""
+        self.title = ""
+        self.done = False
+        self._in_title = False
+        self._title_parts: list[str] = []
+
+    def feed(self, data: str) -> None:
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self.done:
+            return
+        if tag == "meta":
+            self._handle_meta(dict(attrs))
+        elif tag == "title":
+            self._in_title = True
+        elif tag in BODY_TAGS:
+            self.finish()
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag == "meta" and not self.done:
+            self._handle_meta(dict(attrs))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = self.title or "".join(self._title_parts).strip()
+        elif tag == "head":
+            self.finish()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title_parts.append(data)
+
+    def _handle_meta(self, attrs: dict) -> None:
+        content = (attrs.get("content") or "").strip()
+        if not content:
+            return
+        prop = (attrs.get("property") or "").lower()
+        name = (attrs.get("name") or "").lower()
+        if prop == "og:title" and not self.og_title:
+            self.og_title = content
+        elif prop == "og:description" and not self.og_description:
+            self.og_description = content
+        elif name == "description" and not self.meta_description:
+            self.meta_description = content
+
+    def finish(self) -> None:
+        if self._in_title:
+            self._in_title = False
+            self.title = self.title or "".join(self._title_parts).strip()
+        self.done = True
+
+    def metadata(self) -> dict:
+        return {
+            "title": (self.og_title or self.title)[:512],
+            "description": (self.og_description or self.meta_description)[:1000],
+        }
+
+
+class HeadExtractor:
+    """
+    바이트 조각 → 증분 디코딩 → HeadMetadataParser.
+    인코딩은 Content-Type charset, 없으면 첫 조각의 <meta charset>, 그것도 없으면 UTF-8.
+    """
+
+    def __init__(self, charset: Optional[str] = None):
+        self.parser = HeadMetadataParser()
+        self.bytes_read = 0
+        self._charset = charset
+        self._decoder = None
+        self._pending = b""
+
+    @property
+    def done(self) -> bool:
+        return self.parser.done
+
+    def feed(self, chunk: bytes) -> None:
+        self.bytes_read += len(chunk)
+        if self._decoder is None:
+            # 인코딩 결정 전까지 앞부분을 모아 <meta charset> 탐색
+            self._pending += chunk
+            if len(self._pending) < SNIFF_BYTES:
+                return
+            chunk, self._pending = self._pending, b""
+            self._decoder = _incremental_decoder(self._charset or _sniff_charset(chunk))
+        self.parser.feed(self._decoder.decode(chunk))
+
+    def close(self) -> dict:
+        if self._decoder is None:
+            self._decoder = _incremental_decoder(self._charset or _sniff_charset(self._pending))
+            self.parser.feed(self._decoder.decode(self._pending))
+        self.parser.feed(self._decoder.decode(b"", final=True))
+        self.parser.finish()
+        return self.parser.metadata()
+
+
+def _sniff_charset(head: bytes) -> str:
+    match = META_CHARSET_PATTERN.search(head[:SNIFF_BYTES])
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+
+def _incremental_decoder(charset: str):
+    try:
+        return codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        logger.debug("알 수 없는 문자 인코딩: %s — UTF-8로 대체", charset)
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
@@ -0,0 +1,33 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# 브라우저가 매번 재검증(If-None-Match)하도록 — 응답 본문은 캐시하되 바로 쓰지 않음
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소 → 강한 ETag (따옴표 포함)"""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 — 목록/와일드카드 허용, W/ 접두사는 무시 (약한 비교)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """클라이언트 사본이 최신이면 304 응답, 아니면 None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,362 @@
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job], Awaitable[dict]]
+AbandonHandler = Callable[[Job], Awaitable[None]]
+
+TERMINAL_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+# kind → 핸들러 (각 라우터가 import 시점에 등록)
+_handlers: dict[str, JobHandler] = {}
+# kind → 중단된 시도 정리 (예약한 크레딧 환불 등)
+_abandon_handlers: dict[str, AbandonHandler] = {}
+# 실행 중인 작업 — 핸들러와 그 안에서 만든 태스크에서 보임 (요청에서 호출되면 None)
+current_job: ContextVar[Optional[Job]] = ContextVar("current_job", default=None)
+
+# 같은 프로세스에서 넣은 작업은 폴링 없이 즉시 워커를 깨움 (작업 1건당 워커 1개)
+_wakeups: asyncio.Queue = asyncio.Queue()
+# job_id → 상태 변경 알림 (SSE 구독자마다 Event 하나)
+_job_events: dict[str, set[asyncio.Event]] = {}
+_workers: list[asyncio.Task] = []
+
+
+def register(kind: str, handler: JobHandler, on_abandoned: Optional[AbandonHandler] = None) -> None:
+    """
+    작업 종류별 핸들러 등록 — 핸들러는 결과 dict 반환, 실패 시 HTTPException 권장.
+    on_abandoned: 예약 크레딧을 남긴 채 중단된 시도(워커 종료)가 재대기될 때 호출.
+    """
+    _handlers[kind] = handler
+    if on_abandoned is not None:
+        _abandon_handlers[kind] = on_abandoned
+
+
+async def hold_credits(db: AsyncSession, amount: int) -> None:
+    """
+    현재 작업 시도가 크레딧을 예약했음을 기록 — 이 시도가 끝나지 못하고 재대기되면 on_abandoned로 환불.
+    작업 밖(요청)에서 호출되면 아무것도 하지 않음.
+    """
+    job = current_job.get()
+    if job is None:
+        return
+    await db.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts)
+        .values(reserved_credits=amount)
+    )
+    await db.commit()
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    user_id: str,
+    memo_id: Optional[int] = None,
+    payload: Optional[dict] = None,
+    dedupe: bool = True,
+) -> Job:
+    """
+    작업 등록 후 커밋. dedupe=True면 같은 유저/종류/메모의 대기·실행 중 작업을 재사용.
+    """
+    job = await add(db, kind, user_id, memo_id=memo_id, payload=payload, dedupe=dedupe)
+    await db.commit()
+    wake()
+    return job
+
+
+async def add(
+    db: AsyncSession,
+    kind: str,
+    user_id: str,
+    memo_id: Optional[int] = None,
+    payload: Optional[dict] = None,
+    dedupe: bool = True,
+) -> Job:
+    """
+    작업 행만 추가하고 커밋은 호출자 몫 — 다른 쓰기와 같은 트랜잭션에 묶을 때 사용.
+    커밋 후 wake()를 불러야 같은 프로세스 워커가 바로 집어감.
+    """
+    if dedupe and memo_id is not None:
+        existing = await db.scalar(
+            select(Job).where(
+                Job.user_id == user_id,
+                Job.kind == kind,
+                Job.memo_id == memo_id,
+                Job.status.in_((JobStatus.QUEUED, JobStatus.RUNNING)),
+            )
+        )
+        if existing:
+            return existing
+
+    job = Job(
+        id=uuid.uuid4().hex,
+        kind=kind,
+        user_id=user_id,
+        memo_id=memo_id,
+        payload_json=json.dumps(payload, ensure_ascii=False) if payload else None,
+        status=JobStatus.QUEUED,
+        attempts=0,
+        created_at=_now(),
+    )
+    db.add(job)
+    logger.info("작업 등록: id=%s kind=%s memo_id=%s", job.id, kind, memo_id)
+    return job
+
+
+def wake() -> None:
+    """같은 프로세스의 워커 하나를 즉시 깨움"""
+    _wakeups.put_nowait(None)
+
+
+async def get_job(db: AsyncSession, job_id: str, user_id: str) -> Optional[Job]:
+    return await db.scalar(select(Job).where(Job.id == job_id, Job.user_id == user_id))
+
+
+@contextmanager
+def watch(job_id: str) -> Iterator[asyncio.Event]:
+    """
+    같은 프로세스의 상태 변경 알림 구독 — 블록을 벗어나면 해제.
+    작업을 읽기 전에 구독(과 event.clear())해야 읽은 직후의 변경을 놓치지 않음.
+    """
+    event = asyncio.Event()
+    _job_events.setdefault(job_id, set()).add(event)
+    try:
+        yield event
+    finally:
+        subscribers = _job_events.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(event)
+            if not subscribers:
+                del _job_events[job_id]
+
+
+async def wait_for_update(event: asyncio.Event, timeout: float) -> None:
+    """알림 또는 timeout까지 대기 (다른 프로세스 실행분은 timeout 후 재조회로 감지)"""
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+def _notify(job_id: str) -> None:
+    for event in _job_events.get(job_id, ()):
+        event.set()
+
+
+def job_payload(job: Job) -> dict:
+    return json.loads(job.payload_json) if job.payload_json else {}
+
+
+# ── 워커 ────────────────────────────────────────────────────────
+
+async def start_workers() -> None:
+    """앱 시작 시 호출 — 중단된 작업 복구 + 오래된 작업 정리 후 워커/리스 감시 기동"""
+    await requeue_expired()
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            delete(Job).where(
+                Job.status.in_(TERMINAL_STATUSES),
+                Job.finished_at < _now() - timedelta(days=settings.job_retention_days),
+            )
+        )
+        await db.commit()
+
+    for worker_no in range(settings.job_workers):
+        _workers.append(asyncio.create_task(_worker_loop(worker_no)))
+    _workers.append(asyncio.create_task(_reaper_loop()))
+    logger.info("작업 워커 %d개 시작", settings.job_workers)
+
+
+async def requeue_expired() -> int:
+    """
+    리스가 만료된 running 작업을 재대기 — 워커가 죽었거나 프로세스가 재시작된 경우.
+    리스 기록이 없는 행(이전 버전에서 시작된 작업)은 started_at 기준.
+    중단된 시도가 크레딧을 예약해 두었으면 종류별 on_abandoned로 정리(환불).
+    """
+    now = _now()
+    expired = or_(
+        Job.lease_expires_at < now,
+        and_(
+            Job.lease_expires_at.is_(None),
+            Job.started_at < now - timedelta(seconds=settings.job_stale_after_seconds),
+        ),
+    )
+    async with AsyncSessionLocal() as db:
+        candidates = (await db.scalars(select(Job).where(Job.status == JobStatus.RUNNING, expired))).all()
+        requeued: list[Job] = []
+        for job in candidates:
+            # 조회 후 리스가 연장됐거나 다른 프로세스가 먼저 재대기했으면 건너뜀
+            result = await db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts, expired)
+                .values(status=JobStatus.QUEUED, lease_expires_at=None, reserved_credits=None)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                requeued.append(job)
+        await db.commit()
+
+    for job in requeued:
+        on_abandoned = _abandon_handlers.get(job.kind)
+        if job.reserved_credits and on_abandoned is not None:
+            try:
+                await on_abandoned(job)
+            except Exception as exc:
+                logger.error("중단된 작업 정리 실패: id=%s kind=%s (%s)", job.id, job.kind, exc)
+    if requeued:
+        logger.warning("중단된 작업 %d건 재대기", len(requeued))
+        for _ in requeued:
+            wake()
+    return len(requeued)
+
+
+async def _reaper_loop() -> None:
+    """다른 워커/프로세스가 죽어 남은 running 작업을 주기적으로 재대기 (시작 시 한 번으로는 부족)"""
+    while True:
+        await asyncio.sleep(settings.job_reap_interval_seconds)
+        try:
+            await requeue_expired()
+        except Exception as exc:
+            logger.error("만료 작업 확인 실패: %s", exc)
+
+
+async def stop_workers() -> None:
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+
+async def _worker_loop(worker_no: int) -> None:
+    while True:
+        try:
+            job = await _claim_next()
+        except Exception as exc:
+            logger.error("작업 조회 실패 (worker=%s): %s", worker_no, exc)
+            job = None
+        if job is None:
+            try:
+                await asyncio.wait_for(_wakeups.get(), timeout=settings.job_poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        await _execute(job)
+
+
+async def _claim_next() -> Optional[Job]:
+    """
+    가장 오래된 대기 작업을 compare-and-set UPDATE로 선점.
+    여러 워커/프로세스가 같은 행을 노려도 status 조건 덕분에 한 곳만 성공.
+    """
+    async with AsyncSessionLocal() as db:
+        candidates = (
+            await db.scalars(
+                select(Job.id)
+                .where(Job.status == JobStatus.QUEUED)
+                .order_by(Job.created_at)
+                .limit(5)
+            )
+        ).all()
+        for job_id in candidates:
+            now = _now()
+            claimed = await db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+                .values(
+                    status=JobStatus.RUNNING,
+                    started_at=now,
+                    lease_expires_at=_lease_expiry(now),
+                    attempts=Job.attempts + 1,
+                )
+            )
+            await db.commit()
+            if claimed.rowcount == 1:
+                _notify(job_id)
+                return await db.get(Job, job_id)
+    return None
+
+
+async def _execute(job: Job) -> None:
+    handler = _handlers.get(job.kind)
+    values: dict
+    renewer = asyncio.create_task(_renew_lease(job))
+    token = current_job.set(job)
+    try:
+        if handler is None:
+            raise HTTPException(status_code=500, detail=f"알 수 없는 작업 종류: {job.kind}")
+        result = await handler(job)
+        values = {
+            "status": JobStatus.SUCCEEDED,
+            "result_json": json.dumps(result, ensure_ascii=False, default=str),
+        }
+        logger.info("작업 완료: id=%s kind=%s", job.id, job.kind)
+    except HTTPException as exc:
+        values = {
+            "status": JobStatus.FAILED,
+            "error_json": json.dumps({"status_code": exc.status_code, "detail": exc.detail}, ensure_ascii=False),
+        }
+        logger.warning("작업 실패: id=%s kind=%s (%s)", job.id, job.kind, exc.detail)
+    except Exception as exc:
+        values = {
+            "status": JobStatus.FAILED,
+            "error_json": json.dumps({"status_code": 500, "detail": "작업 처리 중 오류가 발생했습니다."}),
+        }
+        logger.exception("작업 오류: id=%s kind=%s (%r)", job.id, job.kind, exc)
+    finally:
+        current_job.reset(token)
+        renewer.cancel()
+
+    # 이번 시도가 아직 유효할 때만 기록 — 리스를 잃고 재대기/재실행된 작업은 새 시도의 결과를 덮어쓰지 않음
+    async with AsyncSessionLocal() as db:
+        finished = await db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts)
+            .values(finished_at=_now(), lease_expires_at=None, reserved_credits=None, **values)
+        )
+        await db.commit()
+    if not finished.rowcount:
+        logger.warning("리스를 잃은 작업의 결과 버림: id=%s kind=%s attempt=%s", job.id, job.kind, job.attempts)
+        return
+    _notify(job.id)
+
+
+async def _renew_lease(job: Job) -> None:
+    """실행 중 리스 연장 — 이번 시도(attempts)의 리스만 연장하므로 재대기된 뒤의 시도와 섞이지 않음"""
+    while True:
+        await asyncio.sleep(settings.job_lease_seconds / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                renewed = await db.execute(
+                    update(Job)
+                    .where(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts)
+                    .values(lease_expires_at=_lease_expiry(_now()))
+                )
+                await db.commit()
+            if not renewed.rowcount:
+                logger.warning("작업 리스를 잃음: id=%s kind=%s", job.id, job.kind)
+                return
+        except Exception as exc:
+            logger.warning("작업 리스 연장 실패: id=%s (%s)", job.id, exc)
+
+
+def _lease_expiry(now: datetime) -> datetime:
+    return now + timedelta(seconds=settings.job_lease_seconds)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
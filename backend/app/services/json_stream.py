@@ -0,0 +1,130 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PathPart = Union[str, int]
+Path = tuple[PathPart, ...]
+
+WILDCARD = "*"   # 배열 인덱스 자리에 쓰면 모든 원소와 일치
+
+_WHITESPACE = " \t\r\n"
+
+
+@dataclass
+class _Frame:
+    """열려 있는 객체/배열 하나"""
+    kind: str                  # "{" | "["
+    path: Path
+    start: int
+    key: Optional[str] = None  # 객체: 마지막으로 읽은 키
+    index: int = 0             # 배열: 현재 원소 인덱스
+    expecting_key: bool = True
+
+    def child_path(self) -> Path:
+        return self.path + ((self.key,) if self.kind == "{" else (self.index,))
+
+
+@dataclass
+class IncrementalJsonParser:
+    """
+    조각으로 도착하는 JSON 텍스트를 누적하며, 관심 경로(watch)의 값이 완성되는 즉시 반환.
+    전체 문서를 매번 다시 파싱하지 않고 문자 단위 상태 기계로 새로 들어온 부분만 훑음.
+
+        parser = IncrementalJsonParser(watch=[("summary_ko",), ("dialogue", "exchanges", "*")])
+        for path, value in parser.feed(chunk): ...
+    """
+    watch: Iterable[Path]
+    _buffer: str = ""
+    _pos: int = 0
+    _stack: list[_Frame] = field(default_factory=list)
+    _in_string: bool = False
+    _escape: bool = False
+    _string_start: int = -1
+    _scalar_start: int = -1
+
+    def __post_init__(self) -> None:
+        self.watch = [tuple(path) for path in self.watch]
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트 (최종 검증용)"""
+        return self._buffer
+
+    def feed(self, chunk: str) -> list[tuple[Path, Any]]:
+        self._buffer += chunk
+        completed: list[tuple[Path, Any]] = []
+        buf = self._buffer
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._end_string(i, completed)
+                continue
+
+            if ch == '"':
+                if self._stack:
+                    self._in_string = True
+                    self._string_start = i
+            elif ch in "{[":
+                if self._stack or ch == "{":
+                    path = self._stack[-1].child_path() if self._stack else ()
+                    self._stack.append(_Frame(kind=ch, path=path, start=i))
+            elif ch in "}]":
+                self._end_scalar(i, completed)
+                if self._stack:
+                    frame = self._stack.pop()
+                    self._emit(frame.path, frame.start, i + 1, completed)
+            elif ch == ",":
+                self._end_scalar(i, completed)
+                if self._stack:
+                    frame = self._stack[-1]
+                    if frame.kind == "{":
+                        frame.expecting_key = True
+                    else:
+                        frame.index += 1
+            elif ch == ":":
+                if self._stack:
+                    self._stack[-1].expecting_key = False
+            elif ch not in _WHITESPACE and self._stack and self._scalar_start < 0:
+                self._scalar_start = i
+        self._pos = len(buf)
+        return completed
+
+    def _end_string(self, end: int, completed: list) -> None:
+        frame = self._stack[-1]
+        if frame.kind == "{" and frame.expecting_key:
+            frame.key = json.loads(self._buffer[self._string_start:end + 1])
+            return
+        self._emit(frame.child_path(), self._string_start, end + 1, completed)
+
+    def _end_scalar(self, end: int, completed: list) -> None:
+        """숫자/true/false/null — 구분자(, } ])를 만나야 끝을 알 수 있음"""
+        if self._scalar_start < 0:
+            return
+        start, self._scalar_start = self._scalar_start, -1
+        self._emit(self._stack[-1].child_path(), start, end, completed)
+
+    def _emit(self, path: Path, start: int, end: int, completed: list) -> None:
+        if not any(_matches(pattern, path) for pattern in self.watch):
+            return
+        try:
+            completed.append((path, json.loads(self._buffer[start:end])))
+        except ValueError:
+            logger.debug("부분 JSON 파싱 실패: path=%s", path)
+
+
+def _matches(pattern: Path, path: Path) -> bool:
+    if len(pattern) != len(path):
+        return False
+    return all(
+        expected == actual or (expected == WILDCARD and isinstance(actual, int))
+        for expected, actual in zip(pattern, path)
+    )
@@ -0,0 +1,200 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# ── MPEG 오디오 프레임 헤더 테이블 (Layer III 전용 — Google TTS 출력 형식) ──
+
+_MPEG1, _MPEG2, _MPEG25 = 3, 2, 0  # 헤더의 version 비트 값
+_LAYER3 = 1
+
+_BITRATES_KBPS = {
+    _MPEG1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    _MPEG2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES_KBPS[_MPEG25] = _BITRATES_KBPS[_MPEG2]
+
+_SAMPLE_RATES = {
+    _MPEG1: (44100, 48000, 32000),
+    _MPEG2: (22050, 24000, 16000),
+    _MPEG25: (11025, 12000, 8000),
+}
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    version: int
+    protected: bool
+    bitrate_kbps: int
+    sample_rate: int
+    padding: int
+    mono: bool
+    raw: bytes
+
+    @property
+    def samples_per_frame(self) -> int:
+        return 1152 if self.version == _MPEG1 else 576
+
+    @property
+    def frame_length(self) -> int:
+        coefficient = 144 if self.version == _MPEG1 else 72
+        return coefficient * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    @property
+    def side_info_length(self) -> int:
+        if self.version == _MPEG1:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+
+def parse_header(data: bytes, offset: int) -> Optional[FrameHeader]:
+    """offset 위치의 4바이트를 Layer III 프레임 헤더로 해석 — 유효하지 않으면 None"""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != _LAYER3 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    return FrameHeader(
+        version=version,
+        protected=not (b1 & 0x01),
+        bitrate_kbps=_BITRATES_KBPS[version][bitrate_index],
+        sample_rate=_SAMPLE_RATES[version][sample_rate_index],
+        padding=(b2 >> 1) & 0x01,
+        mono=(b3 >> 6) == 0x03,
+        raw=bytes(data[offset:offset + 4]),
+    )
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """선두 ID3v2 태그 길이 (없으면 0)"""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_info_frame(data: bytes, offset: int, header: FrameHeader) -> bool:
+    """Xing/Info/VBRI 메타데이터 프레임 여부 — 세그먼트 단독 길이 정보라 합친 파일에선 제거"""
+    tag_offset = offset + 4 + (2 if header.protected else 0) + header.side_info_length
+    if data[tag_offset:tag_offset + 4] in (b"Xing", b"Info"):
+        return True
+    return data[offset + 36:offset + 40] == b"VBRI"
+
+
+@dataclass
+class Mp3Segment:
+    """헤더/태그를 제거한 순수 오디오 프레임 묶음"""
+    frames: bytes
+    frame_count: int
+    header: Optional[FrameHeader]  # 첫 오디오 프레임 헤더 (무음 프레임 템플릿)
+
+    @property
+    def duration_ms(self) -> float:
+        if not self.header:
+            return 0.0
+        return self.frame_count * self.header.samples_per_frame * 1000 / self.header.sample_rate
+
+
+def extract_frames(data: bytes) -> Mp3Segment:
+    """
+    MP3 바이트에서 ID3v2/ID3v1 태그와 Xing/Info 프레임을 제거하고 오디오 프레임만 추출.
+    프레임 경계가 깨진 구간은 다음 동기 워드까지 건너뜀.
+    """
+    end = len(data)
+    if end >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    offset = _skip_id3v2(data)
+
+    frames = bytearray()
+    frame_count = 0
+    first_header: Optional[FrameHeader] = None
+    while offset + 4 <= end:
+        header = parse_header(data, offset)
+        if header is None or offset + header.frame_length > end:
+            offset += 1
+            continue
+        length = header.frame_length
+        if first_header is None and frame_count == 0 and _is_info_frame(data, offset, header):
+            offset += length
+            continue
+        frames += data[offset:offset + length]
+        frame_count += 1
+        first_header = first_header or header
+        offset += length
+
+    return Mp3Segment(frames=bytes(frames), frame_count=frame_count, header=first_header)
+
+
+def silence_frames(template: FrameHeader, duration_ms: int) -> tuple[bytes, int]:
+    """
+    template과 같은 형식의 무음 프레임 생성 → (바이트, 프레임 수).
+    사이드 인포/메인 데이터가 모두 0인 Layer III 프레임은 디코더에서 무음으로 재생됨.
+    """
+    if duration_ms <= 0:
+        return b"", 0
+    # 패딩 비트 해제, protection 비트 설정(CRC 없음)
+    raw = bytearray(template.raw)
+    raw[1] |= 0x01
+    raw[2] &= ~0x02 & 0xFF
+    header = parse_header(bytes(raw), 0)
+    count = math.ceil(duration_ms * header.sample_rate / (1000 * header.samples_per_frame))
+    frame = bytes(raw) + b"\x00" * (header.frame_length - 4)
+    return frame * count, count
+
+
+class Mp3Assembler:
+    """
+    대화 줄 단위 MP3 세그먼트를 하나의 프레임 정합 MP3로 조립.
+    화자가 바뀔 때 무음 프레임을 삽입하고, 줄별 시작 시각/바이트 오프셋 인덱스를 기록.
+    스트리밍 경로에서도 쓸 수 있도록 add()가 그때그때 내보낼 바이트를 반환.
+    """
+
+    def __init__(self, turn_gap_ms: int = 0):
+        self.turn_gap_ms = turn_gap_ms
+        self.timeline: list[dict] = []
+        self._elapsed_ms = 0.0
+        self._byte_offset = 0
+        self._last_speaker: Optional[str] = None
+        self._template: Optional[FrameHeader] = None
+
+    def add(self, data: bytes, speaker: str, line_index: int, exchange_id: Optional[int] = None) -> bytes:
+        segment = extract_frames(data)
+        if segment.header is None:
+            logger.warning("MP3 프레임을 찾지 못함 — 원본 바이트 사용 (line=%s)", line_index)
+            segment = Mp3Segment(frames=data, frame_count=0, header=None)
+
+        out = bytearray()
+        template = self._template or segment.header
+        if self._last_speaker is not None and speaker != self._last_speaker and template:
+            silence, count = silence_frames(template, self.turn_gap_ms)
+            out += silence
+            self._elapsed_ms += count * template.samples_per_frame * 1000 / template.sample_rate
+
+        self.timeline.append({
+            "line_index": line_index,
+            "exchange_id": exchange_id,
+            "speaker": speaker,
+            "offset_ms": round(self._elapsed_ms),
+            "duration_ms": round(segment.duration_ms),
+            "byte_offset": self._byte_offset + len(out),
+            "byte_length": len(segment.frames),
+        })
+        out += segment.frames
+        self._elapsed_ms += segment.duration_ms
+        self._byte_offset += len(out)
+        self._last_speaker = speaker
+        self._template = template
+        return bytes(out)
+
+    @property
+    def duration_ms(self) -> int:
+        return round(self._elapsed_ms)
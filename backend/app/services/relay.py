@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Generic, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class Relay(Generic[T]):
+    """
+    생성 태스크 → 스트리밍 응답 하나로 조각을 넘기는 bounded 큐.
+    큐가 차면 생성 태스크는 stall_seconds까지만 기다리고, 그래도 비지 않으면(클라이언트가 뒤처짐)
+    또는 응답이 먼저 닫히면(클라이언트 끊김) 응답을 분리 — 이후 조각은 버리고 생성은 계속됨
+    (합류한 요청/저장을 위해). 한 응답이 붙잡는 메모리는 maxsize 조각으로 제한됨.
+    """
+
+    def __init__(self, maxsize: int | None = None, stall_seconds: float | None = None):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize or settings.stream_relay_max_chunks)
+        self._stall_seconds = stall_seconds if stall_seconds is not None else settings.stream_relay_stall_seconds
+        self.detached = False
+
+    async def put(self, item: T) -> None:
+        """조각 전달 — 분리된 뒤에는 버림"""
+        if self.detached:
+            return
+        try:
+            await asyncio.wait_for(self._queue.put(item), self._stall_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("스트리밍 응답이 %.0f초 넘게 뒤처져 분리함", self._stall_seconds)
+            self._detach()
+
+    async def close(self) -> None:
+        """끝 표시 — 생성 태스크가 성공/실패와 관계없이 마지막에 호출"""
+        if self.detached:
+            return
+        try:
+            await asyncio.wait_for(self._queue.put(_END), self._stall_seconds)
+        except asyncio.TimeoutError:
+            self._detach()
+
+    def _detach(self) -> None:
+        """쌓인 조각을 버리고 끝 표시만 남김 — 기다리는 응답은 (잘린 채로) 끝남"""
+        self.detached = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_END)
+
+    async def items(self) -> AsyncIterator[T]:
+        """응답 쪽 — 끝 표시까지 조각을 꺼냄. 중간에 닫히면(클라이언트 끊김) 분리해 생성 태스크를 막지 않음"""
+        try:
+            while (item := await self._queue.get()) is not _END:
+                yield item
+        finally:
+            self.detached = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
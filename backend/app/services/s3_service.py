@@ -1,28 +1,64 @@
+import asyncio
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from app.config import settings
+from app.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 S3 클라이언트 (botocore 클라이언트는 스레드 안전) + 블로킹 호출 전용 스레드 풀
+_client = None
+_client_lock = threading.Lock()
+_executor = ThreadPoolExecutor(
+    max_workers=settings.s3_max_pool_connections,
+    thread_name_prefix="s3",
+)
+
+# presigned URL 캐시: (s3_key, expires_in) → (url, URL 만료 시각) — 만료 safety margin 전까지만 재사용
+_presigned_urls = TTLCache(maxsize=settings.s3_presign_cache_size)
+
 
 def _get_client():
+    global _client
+    if _client is not None:
+        return _client
     if not settings.aws_access_key_id:
         raise RuntimeError("AWS 자격증명이 설정되지 않았습니다. .env 파일을 확인하세요.")
     try:
         import boto3  # lazy import
+        from botocore.config import Config
     except ImportError:
         raise RuntimeError("boto3 패키지가 설치되지 않았습니다. pip install boto3 를 실행하세요.")
 
-    return boto3.client(
-        "s3",
-        region_name=settings.aws_region,
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-    )
+    with _client_lock:
+        if _client is None:
+            _client = boto3.client(
+                "s3",
+                region_name=settings.aws_region,
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                config=Config(
+                    max_pool_connections=settings.s3_max_pool_connections,
+                    retries={"mode": "standard"},
+                ),
+            )
+    return _client
+
 
+async def _run(fn, *args, **kwargs):
+    """블로킹 boto3 호출을 S3 전용 스레드 풀로 넘김"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
 
-def upload_to_s3(audio_bytes: bytes, s3_key: str) -> None:
+
+async def upload_to_s3(audio_bytes: bytes, s3_key: str) -> None:
     client = _get_client()
-    client.put_object(
+    await _run(
+        client.put_object,
         Bucket=settings.aws_s3_bucket_name,
         Key=s3_key,
         Body=audio_bytes,
@@ -31,10 +67,174 @@ def upload_to_s3(audio_bytes: bytes, s3_key: str) -> None:
     logger.info("S3 업로드 완료: %s", s3_key)
 
 
-def get_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
+async def download_from_s3(s3_key: str) -> Optional[bytes]:
+    """객체 바이트 반환 — 없으면 None"""
+    client = _get_client()
+
+    def _download() -> Optional[bytes]:
+        try:
+            resp = client.get_object(Bucket=settings.aws_s3_bucket_name, Key=s3_key)
+        except client.exceptions.NoSuchKey:
+            return None
+        return resp["Body"].read()
+
+    return await _run(_download)
+
+
+async def get_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
+    """presigned URL 발급 — 남은 유효기간이 safety margin 이상이면 캐시된 URL 재사용"""
+    url, _ = await get_presigned_url_with_ttl(s3_key, expires_in)
+    return url
+
+
+async def get_presigned_url_with_ttl(s3_key: str, expires_in: int = 3600) -> tuple[str, int]:
+    """
+    presigned URL + 실제 남은 유효시간(초).
+    캐시된 URL이면 발급 후 지난 시간만큼 짧음 — 클라이언트에 만료 시간을 알려 줄 때 사용.
+    """
+    cache_key = (s3_key, expires_in)
+    cached = _presigned_urls.get(cache_key)
+    if cached:
+        url, url_expires_at = cached
+        return url, int(url_expires_at - time.monotonic())
+
     client = _get_client()
-    return client.generate_presigned_url(
+    issued_at = time.monotonic()   # 서명 시각보다 앞서 잡아 남은 시간을 짧게 (보수적)
+    url = await _run(
+        client.generate_presigned_url,
         "get_object",
         Params={"Bucket": settings.aws_s3_bucket_name, "Key": s3_key},
         ExpiresIn=expires_in,
     )
+    margin = min(settings.s3_presign_safety_margin_seconds, expires_in // 2)
+    _presigned_urls.set(cache_key, (url, issued_at + expires_in), ttl=expires_in - margin)
+    return url, expires_in
+
+
+def shutdown() -> None:
+    """앱 종료 시 스레드 풀 정리"""
+    _executor.shutdown(wait=False, cancel_futures=True)
+
+
+# S3 멀티파트 업로드 — 마지막 파트를 제외한 각 파트는 최소 5MiB
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class MultipartUpload:
+    """
+    스트리밍 응답과 병행해 바이트를 S3로 흘려보내는 업로더.
+    S3는 마지막을 제외한 파트가 5MiB 이상이어야 하므로 버퍼가 그만큼 차면 그때 멀티파트 업로드를
+    시작해 파트를 백그라운드로 올림 — 스트림당 메모리는 최대 한 파트(5MiB) + 쓰는 중인 세그먼트.
+    대부분의 대화 오디오처럼 5MiB에 못 미치면 끝까지 버퍼에 남았다가 complete()에서 PUT 한 번으로 저장
+    (멀티파트 시작/확정 왕복 없음). 업로드 실패는 failed 플래그와 complete()의 반환값으로만 알림.
+    """
+
+    def __init__(self, s3_key: str, content_type: str = "audio/mpeg"):
+        self.s3_key = s3_key
+        self.content_type = content_type
+        self.failed = False
+        self._upload_id: Optional[str] = None
+        self._start_task: Optional[asyncio.Task] = None
+        self._buffer = bytearray()
+        self._part_tasks: list[asyncio.Task] = []
+
+    def write(self, data: bytes) -> None:
+        if self.failed:
+            return
+        self._buffer.extend(data)
+        if len(self._buffer) >= MULTIPART_MIN_PART_SIZE:
+            if self._start_task is None:
+                self._start_task = asyncio.create_task(self._start())
+            self._flush_part()
+
+    async def _start(self) -> None:
+        resp = await _run(
+            _get_client().create_multipart_upload,
+            Bucket=settings.aws_s3_bucket_name,
+            Key=self.s3_key,
+            ContentType=self.content_type,
+        )
+        self._upload_id = resp["UploadId"]
+
+    def _flush_part(self) -> None:
+        part_number = len(self._part_tasks) + 1
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        self._part_tasks.append(asyncio.create_task(self._upload_part(part_number, body)))
+
+    async def _upload_part(self, part_number: int, body: bytes) -> dict:
+        await self._start_task
+        resp = await _run(
+            _get_client().upload_part,
+            Bucket=settings.aws_s3_bucket_name,
+            Key=self.s3_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"PartNumber": part_number, "ETag": resp["ETag"]}
+
+    async def complete(self) -> bool:
+        """업로드 확정 — 성공 여부 반환"""
+        if self.failed:
+            await self.abort()
+            return False
+        if not self._part_tasks:
+            return await self._put_whole()
+        if self._buffer:
+            self._flush_part()
+        try:
+            parts = await asyncio.gather(*self._part_tasks)
+            await _run(
+                _get_client().complete_multipart_upload,
+                Bucket=settings.aws_s3_bucket_name,
+                Key=self.s3_key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except Exception as exc:
+            logger.error("S3 멀티파트 업로드 확정 실패 (%s): %s", self.s3_key, exc)
+            self.failed = True
+            await self.abort()
+            return False
+        logger.info("S3 멀티파트 업로드 완료: %s (%d parts)", self.s3_key, len(parts))
+        return True
+
+    async def _put_whole(self) -> bool:
+        """파트 최소 크기에 못 미친 객체 — 멀티파트 없이 PUT 한 번"""
+        try:
+            await _run(
+                _get_client().put_object,
+                Bucket=settings.aws_s3_bucket_name,
+                Key=self.s3_key,
+                Body=bytes(self._buffer),
+                ContentType=self.content_type,
+            )
+        except Exception as exc:
+            logger.error("S3 업로드 오류 (%s): %s", self.s3_key, exc)
+            self.failed = True
+            return False
+        finally:
+            self._buffer.clear()
+        logger.info("S3 업로드 완료: %s", self.s3_key)
+        return True
+
+    async def abort(self) -> None:
+        self._buffer.clear()
+        tasks = [task for task in (self._start_task, *self._part_tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        # 시작이 이미 끝났을 수 있음 — 실패한 태스크의 예외는 여기서 회수
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if not self._upload_id:
+            return
+        try:
+            await _run(
+                _get_client().abort_multipart_upload,
+                Bucket=settings.aws_s3_bucket_name,
+                Key=self.s3_key,
+                UploadId=self._upload_id,
+            )
+        except Exception as exc:
+            logger.warning("S3 멀티파트 업로드 취소 실패 (%s): %s", self.s3_key, exc)
+        self._upload_id = None
@@ -0,0 +1,275 @@
+import hashlib
+import logging
+import re
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine, is_sqlite
+from app.models.dialogue import DialogueExchange
+from app.models.memo import Memo
+
+logger = logging.getLogger(__name__)
+
+# 메모 전문 검색 인덱스 — SQLite: FTS5 가상 테이블 / PostgreSQL: tsvector + GIN.
+# 두 DB 모두 한국어 형태소 분석기가 없으므로 한글은 음절 bigram으로 미리 쪼개 저장
+# ("회의록을" → "회의 의록 록을"), 검색어도 같은 방식으로 쪼개 인접 구문(phrase)으로 조회.
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memo_search USING fts5("
+    "owner, content, link, ai, tokenize = 'unicode61')",
+)
+POSTGRES_DDL = (
+    "CREATE TABLE IF NOT EXISTS memo_search ("
+    "memo_id INTEGER PRIMARY KEY REFERENCES memos(id) ON DELETE CASCADE, "
+    "user_id VARCHAR(64) NOT NULL, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_memo_search_document ON memo_search USING GIN (document)",
+    "CREATE INDEX IF NOT EXISTS ix_memo_search_user ON memo_search (user_id)",
+)
+
+# 필드 가중치 — 본문 > 링크 제목/설명 > AI 요약/대화문
+SQLITE_RANK = "bm25(memo_search, 0.0, 3.0, 1.5, 1.0)"   # owner 컬럼은 점수에서 제외
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', :content), 'A') || "
+    "setweight(to_tsvector('simple', :link), 'B') || "
+    "setweight(to_tsvector('simple', :ai), 'C')"
+)
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+HANGUL_RUN_PATTERN = re.compile(r"([가-힣ㄱ-ㆎ]+)")
+MAX_QUERY_TERMS = 16
+BACKFILL_BATCH_SIZE = 500
+
+# 색인 문서를 만드는 데 필요한 메모 컬럼 (대화문 줄은 별도 조회)
+_INDEX_COLUMNS = select(
+    Memo.id, Memo.user_id, Memo.content, Memo.url_title, Memo.url_description,
+    Memo.ai_summary_ko, Memo.ai_summary_en, Memo.dialogue_title, Memo.dialogue_situation,
+)
+
+
+# ── 토큰화 ─────────────────────────────────────────────────────
+
+def _word_tokens(word: str) -> list[list[str]]:
+    """
+    단어 하나 → 한글/비한글 구간별 토큰 목록.
+    한글 구간은 음절 bigram (한 글자면 그대로), 그 외(영문/숫자)는 구간 전체가 토큰 하나.
+    """
+    runs = []
+    for run in HANGUL_RUN_PATTERN.split(word):
+        if not run:
+            continue
+        if HANGUL_RUN_PATTERN.fullmatch(run) and len(run) > 1:
+            runs.append([run[i:i + 2] for i in range(len(run) - 1)])
+        else:
+            runs.append([run])
+    return runs
+
+
+def index_terms(value: Optional[str]) -> str:
+    """색인용 텍스트 — 공백으로 구분된 토큰 (한글 bigram 위치가 원문 순서를 유지해 구문 검색 가능)"""
+    return " ".join(
+        token
+        for word in WORD_PATTERN.findall((value or "").lower())
+        for run in _word_tokens(word)
+        for token in run
+    )
+
+
+def _query_groups(query: str) -> list[tuple[list[str], bool]]:
+    """
+    검색어 → (구문 토큰, 접두 검색 여부) 목록 — 모두 AND.
+    한글 두 글자 이상은 bigram 구문 일치, 한 글자 한글/영문/숫자는 접두 일치 (meet → meeting).
+    """
+    groups = []
+    for word in WORD_PATTERN.findall(query.lower()):
+        for run in _word_tokens(word):
+            hangul = HANGUL_RUN_PATTERN.fullmatch(run[0]) is not None
+            groups.append((run, not hangul or len(run[0]) == 1))
+    return groups[:MAX_QUERY_TERMS]
+
+
+def _fts5_query(owner: str, groups: list[tuple[list[str], bool]]) -> str:
+    terms = " AND ".join(
+        '"' + " ".join(tokens) + '"' + ("*" if prefix else "") for tokens, prefix in groups
+    )
+    return f'owner : "{owner}" AND {{content link ai}} : ({terms})'
+
+
+def _tsquery(groups: list[tuple[list[str], bool]]) -> str:
+    terms = []
+    for tokens, prefix in groups:
+        phrase = " <-> ".join(f"'{token}'" for token in tokens)
+        terms.append(f"({phrase})" if len(tokens) > 1 else phrase + (":*" if prefix else ""))
+    return " & ".join(terms)
+
+
+def _owner_token(user_id: str) -> str:
+    """SQLite 색인의 사용자 토큰 — MATCH 조건으로 사용자 범위를 인덱스에서 바로 좁힘"""
+    return "u" + hashlib.sha1(user_id.encode()).hexdigest()[:24]
+
+
+def _document(
+    content: Optional[str],
+    url_title: Optional[str],
+    url_description: Optional[str],
+    ai_texts: Iterable[Optional[str]],
+) -> dict:
+    return {
+        "content": index_terms(content),
+        "link": index_terms(f"{url_title or ''} {url_description or ''}"),
+        "ai": " ".join(filter(None, (index_terms(value) for value in ai_texts))),
+    }
+
+
+def _memo_document(memo: Memo) -> dict:
+    ai_texts = [memo.ai_summary_ko, memo.ai_summary_en, memo.dialogue_title, memo.dialogue_situation]
+    if memo.dialogue_title is not None:
+        for exchange in memo.exchanges:
+            ai_texts += [exchange.line, exchange.korean]
+    return _document(memo.content, memo.url_title, memo.url_description, ai_texts)
+
+
+# ── 색인 관리 ──────────────────────────────────────────────────
+
+async def ensure_index() -> None:
+    """앱 시작 시 검색 인덱스 테이블 생성 (create_tables 이후, 이미 있으면 무시)"""
+    async with engine.begin() as conn:
+        for statement in SQLITE_DDL if is_sqlite else POSTGRES_DDL:
+            await conn.exec_driver_sql(statement)
+
+
+async def index_memos(db: AsyncSession, memos: Iterable[Memo]) -> None:
+    """
+    메모 색인 갱신 (커밋은 호출자 몫) — 메모의 현재 속성으로 문서를 다시 만듦.
+    새 메모는 flush 후(id 필요), 대화문은 memo.exchanges가 로드된 상태에서 호출.
+    """
+    rows = [{"memo_id": memo.id, "user_id": memo.user_id, **_memo_document(memo)} for memo in memos]
+    await _write_documents(db, rows)
+
+
+async def remove_memos(db: AsyncSession, memo_ids: Iterable[int]) -> None:
+    """삭제된 메모를 색인에서 제거 (SQLite 가상 테이블은 외래키 CASCADE가 없음)"""
+    memo_ids = list(memo_ids)
+    if not memo_ids:
+        return
+    column = "rowid" if is_sqlite else "memo_id"
+    await db.execute(
+        text(f"DELETE FROM memo_search WHERE {column} IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"ids": memo_ids},
+    )
+
+
+async def _write_documents(db: AsyncSession, rows: list[dict]) -> None:
+    if not rows:
+        return
+    if is_sqlite:
+        await remove_memos(db, [row["memo_id"] for row in rows])
+        await db.execute(
+            text(
+                "INSERT INTO memo_search (rowid, owner, content, link, ai) "
+                "VALUES (:memo_id, :owner, :content, :link, :ai)"
+            ),
+            [{**row, "owner": _owner_token(row["user_id"])} for row in rows],
+        )
+    else:
+        await db.execute(
+            text(
+                "INSERT INTO memo_search (memo_id, user_id, document) "
+                f"VALUES (:memo_id, :user_id, {POSTGRES_DOCUMENT}) "
+                "ON CONFLICT (memo_id) DO UPDATE SET "
+                "user_id = EXCLUDED.user_id, document = EXCLUDED.document"
+            ),
+            rows,
+        )
+
+
+async def index_memo_ids(db: AsyncSession, memo_ids: Iterable[int]) -> None:
+    """
+    id로 메모를 읽어 색인 (커밋은 호출자 몫) — 대량 삽입 직후처럼 ORM 객체가 없을 때.
+    메모 컬럼 + 대화문 줄을 쿼리 두 번으로 읽음.
+    """
+    await _index_rows(db, (await db.execute(_INDEX_COLUMNS.where(Memo.id.in_(list(memo_ids))))).all())
+
+
+async def backfill_index(db: AsyncSession) -> int:
+    """
+    색인에 없는 메모를 id 순 배치로 색인 (검색 도입 이전 데이터 / 색인 테이블 재생성 시).
+    이미 색인된 메모는 건너뛰므로 재시작 시 비용은 누락 확인 쿼리뿐.
+    """
+    column = "rowid" if is_sqlite else "memo_id"
+    missing = text(f"NOT EXISTS (SELECT 1 FROM memo_search WHERE memo_search.{column} = memos.id)")
+    indexed, last_id = 0, 0
+    while True:
+        memos = (
+            await db.execute(
+                _INDEX_COLUMNS.where(Memo.id > last_id, missing).order_by(Memo.id).limit(BACKFILL_BATCH_SIZE)
+            )
+        ).all()
+        if not memos:
+            break
+        last_id = memos[-1].id
+        await _index_rows(db, memos)
+        await db.commit()
+        indexed += len(memos)
+
+    if indexed:
+        logger.info("검색 색인 보충 완료: %d개 메모", indexed)
+    return indexed
+
+
+async def _index_rows(db: AsyncSession, memos: list) -> None:
+    """_INDEX_COLUMNS 행 + 대화문 줄 → 색인 문서"""
+    if not memos:
+        return
+    lines: dict[int, list[str]] = {}
+    for memo_id, line, korean in await db.execute(
+        select(DialogueExchange.memo_id, DialogueExchange.line, DialogueExchange.korean)
+        .where(DialogueExchange.memo_id.in_([memo.id for memo in memos]))
+        .order_by(DialogueExchange.memo_id, DialogueExchange.position)
+    ):
+        lines.setdefault(memo_id, []).extend((line, korean))
+
+    await _write_documents(db, [
+        {
+            "memo_id": memo.id,
+            "user_id": memo.user_id,
+            **_document(
+                memo.content, memo.url_title, memo.url_description,
+                [memo.ai_summary_ko, memo.ai_summary_en, memo.dialogue_title, memo.dialogue_situation,
+                 *lines.get(memo.id, [])],
+            ),
+        }
+        for memo in memos
+    ])
+
+
+# ── 검색 ───────────────────────────────────────────────────────
+
+async def search(
+    db: AsyncSession, user_id: str, query: str, limit: int, offset: int = 0
+) -> Optional[list[tuple[int, float]]]:
+    """
+    내 메모 검색 → [(memo_id, score)] (score 높은 순, 같으면 최신 id 순).
+    검색어에 색인 가능한 단어가 없으면 None.
+    """
+    groups = _query_groups(query)
+    if not groups:
+        return None
+    if is_sqlite:
+        stmt = text(
+            f"SELECT rowid AS memo_id, -{SQLITE_RANK} AS score FROM memo_search "
+            "WHERE memo_search MATCH :match "
+            "ORDER BY score DESC, rowid DESC LIMIT :limit OFFSET :offset"
+        )
+        params = {"match": _fts5_query(_owner_token(user_id), groups)}
+    else:
+        stmt = text(
+            "SELECT memo_id, ts_rank_cd(document, query) AS score "
+            "FROM memo_search, to_tsquery('simple', :tsquery) AS query "
+            "WHERE user_id = :user_id AND document @@ query "
+            "ORDER BY score DESC, memo_id DESC LIMIT :limit OFFSET :offset"
+        )
+        params = {"tsquery": _tsquery(groups), "user_id": user_id}
+    rows = await db.execute(stmt, {**params, "limit": limit, "offset": offset})
+    return [(row.memo_id, float(row.score)) for row in rows]
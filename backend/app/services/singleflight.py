@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal, is_sqlite
+from app.models.singleflight_lease import SingleFlightLease
+
+logger = logging.getLogger(__name__)
+
+_insert = sqlite_insert if is_sqlite else pg_insert
+
+
+class LocalLockBackend:
+    """단일 프로세스용 — 프로세스 내 코얼레싱만으로 충분하므로 추가 잠금 없음"""
+
+    @asynccontextmanager
+    async def lock(self, key: str) -> AsyncIterator[None]:
+        yield
+
+
+class DatabaseLeaseBackend:
+    """
+    다중 워커/인스턴스용 — 리스 행(key, owner, expires_at)으로 같은 키의 작업을 직렬화.
+    비었거나 만료된 리스만 차지하는 조건부 UPSERT 한 문장으로 잡고 바로 커밋하므로
+    Gemini/TTS 호출 동안 DB 커넥션을 붙잡지 않음 (풀 고갈 없음, pgbouncer transaction 모드 호환).
+    작업 중에는 주기적으로 만료 시각을 연장하고, 워커가 죽으면 만료 후 다른 워커가 이어받음.
+    뒤에 리스를 얻은 워커는 작업 함수 안에서 DB 상태(is_transformed 등)를 다시 읽어
+    앞선 워커의 결과를 그대로 돌려받게 됨.
+    """
+
+    @asynccontextmanager
+    async def lock(self, key: str) -> AsyncIterator[None]:
+        lease_key = _lease_key(key)
+        owner = uuid.uuid4().hex
+        while not await self._claim(lease_key, owner):
+            await asyncio.sleep(settings.singleflight_poll_interval_seconds)
+        renewer = asyncio.create_task(self._renew(lease_key, owner))
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            await self._release(lease_key, owner)
+
+    async def _claim(self, lease_key: str, owner: str) -> bool:
+        now = datetime.now(timezone.utc)
+        stmt = _insert(SingleFlightLease).values(key=lease_key, owner=owner, expires_at=_lease_expiry(now))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SingleFlightLease.key],
+            set_={"owner": stmt.excluded.owner, "expires_at": stmt.excluded.expires_at},
+            where=SingleFlightLease.expires_at < now,
+        ).returning(SingleFlightLease.owner)
+        async with AsyncSessionLocal() as db:
+            claimed = await db.scalar(stmt)
+            await db.commit()
+        return claimed == owner
+
+    async def _renew(self, lease_key: str, owner: str) -> None:
+        """작업이 끝날 때까지 리스 연장 — 실패해도 작업은 계속 (만료되면 다른 워커가 이어받을 수 있음)"""
+        while True:
+            await asyncio.sleep(settings.singleflight_lease_seconds / 3)
+            try:
+                async with AsyncSessionLocal() as db:
+                    result = await db.execute(
+                        update(SingleFlightLease)
+                        .where(SingleFlightLease.key == lease_key, SingleFlightLease.owner == owner)
+                        .values(expires_at=_lease_expiry(datetime.now(timezone.utc)))
+                    )
+                    await db.commit()
+                if not result.rowcount:
+                    logger.warning("single-flight 리스를 잃음: %s", lease_key)
+                    return
+            except Exception as exc:
+                logger.warning("single-flight 리스 연장 실패: %s (%s)", lease_key, exc)
+
+    async def _release(self, lease_key: str, owner: str) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    delete(SingleFlightLease)
+                    .where(SingleFlightLease.key == lease_key, SingleFlightLease.owner == owner)
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("single-flight 리스 해제 실패 (만료 후 정리됨): %s (%s)", lease_key, exc)
+
+
+def _lease_key(key: str) -> str:
+    """single-flight 키(사용자 id 포함, 길이 가변) → 고정 길이 리스 키"""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _lease_expiry(now: datetime) -> datetime:
+    return now + timedelta(seconds=settings.singleflight_lease_seconds)
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 요청을 하나의 작업으로 합침.
+    먼저 온 요청이 작업을 시작하고, 진행 중에 들어온 요청은 같은 결과(또는 예외)를 공유.
+    작업은 별도 태스크로 실행되어 첫 요청의 연결이 끊겨도 취소되지 않음.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.start(key, fn))
+
+    def start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """
+        진행 중인 작업 태스크 반환 (없으면 시작) — 대기 없이 바로 등록되므로
+        in_flight() 확인과 같은 틱에 호출하면 다른 요청과 경합 없음. 기다릴 때는 shield로 감쌀 것.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            logger.info("진행 중인 작업에 합류: %s", key)
+        return task
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        async with self.backend.lock(key):
+            return await fn()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # 합류한 요청이 모두 사라진 경우에도 "never retrieved" 경고가 남지 않도록 확인
+            logger.debug("single-flight 작업 실패: %s (%r)", key, task.exception())
+
+
+def _make_backend():
+    backend = settings.singleflight_backend
+    if backend == "auto":
+        backend = "local" if is_sqlite else "postgres"
+    if backend == "postgres":
+        return DatabaseLeaseBackend()
+    return LocalLockBackend()
+
+
+inflight = SingleFlight(_make_backend())
@@ -0,0 +1,25 @@
+import json
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+
+def format_event(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 한 건 (data는 JSON 직렬화)"""
+    payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, default=str)
+    lines = "".join(f"data: {line}\n" for line in payload.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+
+def format_comment(text: str = "keep-alive") -> str:
+    """연결 유지용 주석 라인 (클라이언트 이벤트 없음)"""
+    return f": {text}\n\n"
+
+
+def event_stream(events: AsyncIterator[str]) -> StreamingResponse:
+    """SSE 응답 — 프록시 버퍼링/캐시 비활성화"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
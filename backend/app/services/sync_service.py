@@ -0,0 +1,33 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.tombstone import MemoTombstone
+
+logger = logging.getLogger(__name__)
+
+
+def record_deletions(db: AsyncSession, user_id: str, memo_ids: Iterable[int]) -> None:
+    """삭제한 메모의 tombstone 추가 (메모 삭제와 같은 트랜잭션, 커밋은 호출자 몫)"""
+    now = datetime.now(timezone.utc)
+    db.add_all(MemoTombstone(memo_id=memo_id, user_id=user_id, deleted_at=now) for memo_id in memo_ids)
+
+
+def tombstone_horizon(now: datetime) -> datetime:
+    """이 시각 이전의 삭제 기록은 정리됨 — 더 오래된 동기화 커서는 전체 재동기화 필요"""
+    return now - timedelta(days=settings.sync_tombstone_retention_days)
+
+
+async def prune_tombstones(db: AsyncSession) -> int:
+    """앱 시작 시 보관 기간이 지난 tombstone 정리"""
+    result = await db.execute(
+        delete(MemoTombstone).where(MemoTombstone.deleted_at < tombstone_horizon(datetime.now(timezone.utc)))
+    )
+    await db.commit()
+    if result.rowcount:
+        logger.info("오래된 삭제 기록 정리: %d건", result.rowcount)
+    return result.rowcount
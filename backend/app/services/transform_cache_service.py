@@ -0,0 +1,172 @@
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, is_sqlite
+from app.models.transform_cache import TransformCache
+from app.services.gemini_service import GEMINI_MODEL, SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트/모델이 바뀌면 버전이 달라져 기존 캐시는 자동으로 미스 처리 (+ 시작 시 정리)
+PROMPT_VERSION = hashlib.sha256(f"{GEMINI_MODEL}\n{SYSTEM_PROMPT}".encode("utf-8")).hexdigest()[:16]
+
+_insert = sqlite_insert if is_sqlite else pg_insert
+
+EVICT_EVERY_N_PUTS = 100
+_puts_since_evict = 0
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\u00a0\u3000]+")
+
+
+def build_source_text(content: str, url_description: Optional[str]) -> str:
+    """Gemini 입력 텍스트 — 메모 본문 + 링크 요약"""
+    source_text = content
+    if url_description:
+        source_text += f"\n\n[링크 요약]\n{url_description}"
+    return source_text
+
+
+def normalize_source_text(source_text: str) -> str:
+    """캐시 키용 정규화 — NFC, 줄별 공백 축약, 빈 줄 제거"""
+    text = unicodedata.normalize("NFC", source_text)
+    lines = (_INLINE_WHITESPACE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def cache_key(source_text: str) -> str:
+    raw = f"{PROMPT_VERSION}\n{normalize_source_text(source_text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def get_cached_transform(db: AsyncSession, source_text: str) -> Optional[dict]:
+    """TTL 이내 캐시 결과 반환 (히트 시 LRU 시각 갱신 — 커밋은 호출자 몫)"""
+    return (await get_cached_transforms(db, [source_text])).get(source_text)
+
+
+async def get_cached_transforms(db: AsyncSession, source_texts: Iterable[str]) -> dict[str, dict]:
+    """
+    여러 원문의 캐시 결과를 한 번에 조회 → {원문: 결과} (히트만 포함).
+    SELECT 한 번 + 히트분 LRU 갱신 UPDATE 한 번 (커밋은 호출자 몫).
+    """
+    keys: dict[str, list[str]] = {}   # 정규화 후 같은 키가 되는 원문이 여럿일 수 있음
+    for source_text in source_texts:
+        keys.setdefault(cache_key(source_text), []).append(source_text)
+    if not keys:
+        return {}
+    now = datetime.now(timezone.utc)
+    fresh_after = now - timedelta(seconds=settings.transform_cache_ttl_seconds)
+    entries = [
+        entry
+        for entry in await db.scalars(
+            select(TransformCache).where(
+                TransformCache.key.in_(list(keys)), TransformCache.prompt_version == PROMPT_VERSION
+            )
+        )
+        if _as_utc(entry.created_at) >= fresh_after
+    ]
+    if not entries:
+        return {}
+    await db.execute(
+        update(TransformCache)
+        .where(TransformCache.key.in_([entry.key for entry in entries]))
+        .values(last_used_at=now, hit_count=TransformCache.hit_count + 1)
+    )
+    logger.info("변환 캐시 히트: %d/%d건", len(entries), len(keys))
+    return {
+        source_text: json.loads(entry.result_json)
+        for entry in entries
+        for source_text in keys[entry.key]
+    }
+
+
+async def put_cached_transform(source_text: str, result: dict) -> None:
+    """변환 결과 하나 저장 — put_cached_transforms 참고"""
+    await put_cached_transforms({source_text: result})
+
+
+async def put_cached_transforms(results: dict[str, dict]) -> None:
+    """
+    변환 결과 저장 (원문 → 결과) — 메모 저장을 커밋한 뒤 호출.
+    같은 원문을 동시에 변환한 요청끼리 키가 겹쳐도 UPSERT 한 문장이라 충돌 없음 (나중 결과로 갱신).
+    별도 세션/트랜잭션에서 실행하고 실패는 로그만 — 캐시 쓰기가 메모 저장/크레딧 정산을 되돌리지 않음.
+    주기적으로 만료/초과분 정리.
+    """
+    global _puts_since_evict
+    if not results:
+        return
+    now = datetime.now(timezone.utc)
+    rows = {
+        cache_key(source_text): {
+            "key": cache_key(source_text),
+            "prompt_version": PROMPT_VERSION,
+            "result_json": json.dumps(result, ensure_ascii=False),
+            "hit_count": 0,
+            "created_at": now,
+            "last_used_at": now,
+        }
+        for source_text, result in results.items()
+    }
+    stmt = _insert(TransformCache).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TransformCache.key],
+        set_={
+            "prompt_version": stmt.excluded.prompt_version,
+            "result_json": stmt.excluded.result_json,
+            "created_at": stmt.excluded.created_at,
+            "last_used_at": stmt.excluded.last_used_at,
+        },
+    )
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt)
+            _puts_since_evict += len(rows)
+            if _puts_since_evict >= EVICT_EVERY_N_PUTS:
+                _puts_since_evict = 0
+                await evict(db)
+            await db.commit()
+    except Exception as exc:
+        logger.warning("변환 캐시 저장 실패 (메모 저장에는 영향 없음): %s", exc)
+
+
+async def evict(db: AsyncSession) -> None:
+    """TTL 만료 항목 삭제 + 최대 개수 초과 시 오래 안 쓰인 순(LRU)으로 삭제"""
+    expired_before = datetime.now(timezone.utc) - timedelta(seconds=settings.transform_cache_ttl_seconds)
+    await db.execute(delete(TransformCache).where(TransformCache.created_at < expired_before))
+
+    total = await db.scalar(select(func.count()).select_from(TransformCache))
+    overflow = total - settings.transform_cache_max_entries
+    if overflow > 0:
+        oldest = (
+            select(TransformCache.key)
+            .order_by(TransformCache.last_used_at)
+            .limit(overflow)
+            .scalar_subquery()
+        )
+        await db.execute(delete(TransformCache).where(TransformCache.key.in_(oldest)))
+        logger.info("변환 캐시 LRU 정리: %d건", overflow)
+
+
+async def invalidate_stale_prompts(db: AsyncSession) -> None:
+    """SYSTEM_PROMPT/모델 변경 시 이전 버전 캐시 일괄 삭제 — 앱 시작 시 호출"""
+    result = await db.execute(
+        delete(TransformCache).where(TransformCache.prompt_version != PROMPT_VERSION)
+    )
+    await db.commit()
+    if result.rowcount:
+        logger.info("프롬프트 변경으로 변환 캐시 %d건 무효화 (version=%s)", result.rowcount, PROMPT_VERSION)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 타임존 정보 없이 저장됨 (UTC로 기록)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,161 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+from app.services import s3_service
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화 — 유니코드 NFC + 공백 축약 (대소문자/구두점은 발음에 영향이 있어 유지)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def segment_key(voice_name: str, speaking_rate: float, text: str) -> str:
+    """(음성, 속도, 정규화 텍스트) → 콘텐츠 주소 키"""
+    raw = f"{voice_name}|{speaking_rate:.2f}|{normalize_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SegmentCache:
+    """
+    TTS 세그먼트(한 줄 MP3) 캐시.
+    1차: 로컬 디스크 LRU (총 용량 상한), 2차: S3 프리픽스 (선택, 워커/배포 간 공유).
+    """
+
+    def __init__(self, directory: str, max_bytes: int, s3_prefix: Optional[str] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.s3_prefix = s3_prefix
+        self._index: OrderedDict[str, int] = OrderedDict()  # key → size (오래된 순)
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.s3_hits = 0
+        self.misses = 0
+
+    # ── 공개 API ─────────────────────────────────────────────
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = await asyncio.to_thread(self._disk_get, key)
+        if data is not None:
+            self.hits += 1
+            self.disk_hits += 1
+            return data
+
+        if self.s3_prefix:
+            try:
+                data = await s3_service.download_from_s3(self._s3_key(key))
+            except Exception as exc:
+                logger.warning("TTS 캐시 S3 조회 실패: %s", exc)
+                data = None
+            if data is not None:
+                self.hits += 1
+                self.s3_hits += 1
+                await asyncio.to_thread(self._disk_put, key, data)
+                return data
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        try:
+            await asyncio.to_thread(self._disk_put, key, data)
+        except OSError as exc:
+            logger.warning("TTS 캐시 디스크 저장 실패: %s", exc)
+        if self.s3_prefix:
+            try:
+                await s3_service.upload_to_s3(data, self._s3_key(key))
+            except Exception as exc:
+                logger.warning("TTS 캐시 S3 저장 실패: %s", exc)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "s3_hits": self.s3_hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._index),
+            "disk_bytes": self._total_bytes,
+        }
+
+    # ── 디스크 LRU ───────────────────────────────────────────
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.mp3")
+
+    def _s3_key(self, key: str) -> str:
+        return f"{self.s3_prefix.rstrip('/')}/{key[:2]}/{key}.mp3"
+
+    def _load_index(self) -> None:
+        """기존 캐시 디렉토리 스캔 — mtime(마지막 접근) 오름차순으로 LRU 순서 복원"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".mp3"):
+                    stat = os.stat(os.path.join(root, name))
+                    entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if not self._loaded:
+                self._load_index()
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            return None
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if not self._loaded:
+                self._load_index()
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                old_key, size = self._index.popitem(last=False)
+                self._total_bytes -= size
+                try:
+                    os.remove(self._path(old_key))
+                except FileNotFoundError:
+                    pass
+
+
+segment_cache = SegmentCache(
+    directory=settings.tts_cache_dir,
+    max_bytes=settings.tts_cache_max_bytes,
+    s3_prefix=settings.tts_cache_s3_prefix,
+)
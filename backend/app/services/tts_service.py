@@ -1,17 +1,24 @@
+import asyncio
 import logging
+from typing import AsyncIterator, Optional
 from app.config import settings
+from app.services.mp3_service import Mp3Assembler
+from app.services.tts_cache_service import segment_cache, segment_key
 
 logger = logging.getLogger(__name__)
 
+SPEAKING_RATE = 0.9
 
-async def generate_tts_audio(exchanges: list[dict]) -> bytes:
-    """
-    대화문을 Google Cloud TTS로 변환하여 MP3 바이트 반환.
-    google-cloud-texttospeech 미설치 시 RuntimeError 발생.
-    """
+# 프로세스 전역 TTS 클라이언트 / 음성 설정 (최초 호출 시 1회 생성)
+_client = None
+_voice_config: dict | None = None
+_audio_config = None
+_semaphore = asyncio.Semaphore(settings.tts_max_concurrency)
+
+
+def _texttospeech():
     if not settings.google_application_credentials:
         raise RuntimeError("GOOGLE_APPLICATION_CREDENTIALS가 설정되지 않았습니다.")
-
     try:
         from google.cloud import texttospeech  # lazy import
     except ImportError:
@@ -19,38 +26,109 @@ async def generate_tts_audio(exchanges: list[dict]) -> bytes:
             "google-cloud-texttospeech 패키지가 설치되지 않았습니다.\n"
             "pip install google-cloud-texttospeech 를 실행하세요."
         )
+    return texttospeech
 
-    VOICE_CONFIG = {
-        "A": texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            name="en-US-Journey-F",
-            ssml_gender=texttospeech.SsmlVoiceGender.FEMALE,
-        ),
-        "B": texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            name="en-US-Journey-D",
-            ssml_gender=texttospeech.SsmlVoiceGender.MALE,
-        ),
-    }
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
-        speaking_rate=0.9,
-    )
 
-    client = texttospeech.TextToSpeechClient()
-    segments: list[bytes] = []
-    for exchange in exchanges:
-        line = exchange.get("line", "")
-        if not line:
-            continue
-        voice = VOICE_CONFIG.get(exchange.get("speaker", "A"), VOICE_CONFIG["A"])
-        resp = client.synthesize_speech(
+def _get_client():
+    """비동기 TTS 클라이언트 (gRPC 채널 재사용)"""
+    global _client, _voice_config, _audio_config
+    if _client is None:
+        texttospeech = _texttospeech()
+        _voice_config = {
+            "A": texttospeech.VoiceSelectionParams(
+                language_code="en-US",
+                name="en-US-Journey-F",
+                ssml_gender=texttospeech.SsmlVoiceGender.FEMALE,
+            ),
+            "B": texttospeech.VoiceSelectionParams(
+                language_code="en-US",
+                name="en-US-Journey-D",
+                ssml_gender=texttospeech.SsmlVoiceGender.MALE,
+            ),
+        }
+        _audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3,
+            speaking_rate=SPEAKING_RATE,
+        )
+        _client = texttospeech.TextToSpeechAsyncClient()
+    return _client
+
+
+async def _synthesize_line(line: str, speaker: str) -> bytes:
+    """대화문 한 줄 합성 — 세그먼트 캐시 우선, 미스 시 세마포어로 동시 요청 수 제한"""
+    client = _get_client()
+    texttospeech = _texttospeech()
+    voice = _voice_config.get(speaker, _voice_config["A"])
+
+    key = segment_key(voice.name, SPEAKING_RATE, line)
+    cached = await segment_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with _semaphore:
+        resp = await client.synthesize_speech(
             input=texttospeech.SynthesisInput(text=line),
             voice=voice,
-            audio_config=audio_config,
+            audio_config=_audio_config,
         )
-        segments.append(resp.audio_content)
+    await segment_cache.put(key, resp.audio_content)
+    return resp.audio_content
+
+
+def _dialogue_lines(exchanges: list[dict]) -> list[tuple[int, str, str, Optional[int]]]:
+    """(대화 내 인덱스, 문장, 화자, 저장된 줄 id) — 빈 줄 제외"""
+    return [
+        (index, exchange.get("line", ""), exchange.get("speaker", "A"), exchange.get("id"))
+        for index, exchange in enumerate(exchanges)
+        if exchange.get("line")
+    ]
+
 
-    combined = b"".join(segments)
-    logger.info("TTS 생성 완료: %d개 exchanges, %d bytes", len(exchanges), len(combined))
-    return combined
+async def iter_dialogue_audio(exchanges: list[dict], assembler: Mp3Assembler) -> AsyncIterator[bytes]:
+    """
+    모든 줄의 합성을 동시에 시작하고, 완료되는 대로 대화 순서대로 한 줄씩
+    프레임 정합 MP3 바이트(화자 전환 무음 포함)를 yield.
+    첫 청크는 첫 줄 합성 시간만큼만 기다리면 됨. 줄별 타임라인은 assembler에 누적.
+    소비자가 중간에 중단하면 남은 합성 작업은 취소.
+    """
+    _get_client()
+    lines = _dialogue_lines(exchanges)
+    tasks = [asyncio.create_task(_synthesize_line(line, speaker)) for _, line, speaker, _ in lines]
+    try:
+        for (index, _, speaker, exchange_id), task in zip(lines, tasks):
+            yield assembler.add(await task, speaker, index, exchange_id=exchange_id)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def synthesize_exchange(line: str, speaker: str) -> bytes:
+    """대화 한 줄 MP3 (세그먼트 캐시 경유) — 줄 단위 다시 듣기용"""
+    _get_client()
+    return await _synthesize_line(line, speaker)
+
+
+def new_assembler() -> Mp3Assembler:
+    return Mp3Assembler(turn_gap_ms=settings.tts_turn_gap_ms)
+
+
+async def generate_tts_audio(exchanges: list[dict]) -> tuple[bytes, list[dict]]:
+    """
+    대화문을 Google Cloud TTS로 변환하여 (MP3 바이트, 줄별 타임라인) 반환.
+    모든 줄을 동시에 합성한 뒤 대화 순서대로 프레임 단위로 조립.
+    google-cloud-texttospeech 미설치 시 RuntimeError 발생.
+    """
+    _get_client()
+    lines = _dialogue_lines(exchanges)
+    segments = await asyncio.gather(*(_synthesize_line(line, speaker) for _, line, speaker, _ in lines))
+
+    assembler = new_assembler()
+    combined = b"".join(
+        assembler.add(segment, speaker, index, exchange_id=exchange_id)
+        for (index, _, speaker, exchange_id), segment in zip(lines, segments)
+    )
+    logger.info(
+        "TTS 생성 완료: %d개 exchanges, %d bytes, %dms (캐시 %s)",
+        len(exchanges), len(combined), assembler.duration_ms, segment_cache.stats(),
+    )
+    return combined, assembler.timeline
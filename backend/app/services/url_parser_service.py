@@ -1,13 +1,36 @@
+import asyncio
+import importlib.util
 import logging
 import re
+from collections import defaultdict
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 import httpx
-from bs4 import BeautifulSoup
+
+from app.config import settings
+from app.services.cache import TTLCache
+from app.services.html_head_parser import HeadExtractor
 
 logger = logging.getLogger(__name__)
 
 YOUTUBE_PATTERN = re.compile(
     r"(?:youtube\.com/watch\?v=|youtu\.be/)([A-Za-z0-9_-]{11})"
 )
+USER_AGENT = "Mozilla/5.0 (Memolish bot)"
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+URL_PATTERN = re.compile(r"https?://[^\s<>\"'`]+")
+URL_TRAILING_PUNCTUATION = ".,;:!?)]}>\u3002\uff0c\u300d\u300f\u2026"
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# 프로세스 전역 HTTP 클라이언트 (keep-alive/TLS 세션 재사용) + 메타데이터 캐시
+_client: httpx.AsyncClient | None = None
+_metadata_cache = TTLCache(maxsize=settings.url_metadata_cache_size)
+# 캐시 키 → 진행 중인 조회 (동시 요청 합치기)
+_fetching: dict[str, asyncio.Task] = {}
 
 
 async def parse(url: str) -> dict:
@@ -15,62 +38,192 @@ async def parse(url: str) -> dict:
     URL에서 제목과 설명을 파싱.
     YouTube: oEmbed API 사용.
     일반 웹: og:title / og:description / <title> 태그 추출.
+    같은 링크(정규화 URL / YouTube 영상 ID 기준)는 캐시에서 반환 — 실패 결과도 짧게 캐시.
     """
-    if _is_youtube(url):
-        return await _parse_youtube(url)
-    return await _parse_webpage(url)
+    metadata, _ = await resolve(url)
+    return metadata
+
 
+async def resolve(url: str) -> tuple[dict, bool]:
+    """
+    parse와 같지만 성공 여부도 반환 — 실패 시 (URL을 제목으로 한 기본값, False).
+    같은 링크를 동시에 요청하면 네트워크 조회는 한 번만 하고 결과를 공유.
+    """
+    cached = _cached(url)
+    if cached is not None:
+        return cached
 
-def _is_youtube(url: str) -> bool:
-    return bool(YOUTUBE_PATTERN.search(url))
+    key = cache_key(url)
+    task = _fetching.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch(url, key))
+        _fetching[key] = task
+        task.add_done_callback(lambda _: _fetching.pop(key, None))
+    metadata, ok = await asyncio.shield(task)
+    return dict(metadata), ok
 
 
-async def _parse_youtube(url: str) -> dict:
-    """YouTube oEmbed API로 제목/저자 추출"""
-    oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
+async def _fetch(url: str, key: str) -> tuple[dict, bool]:
+    video_id = _youtube_video_id(url)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(oembed_url)
-            resp.raise_for_status()
-            data = resp.json()
-            return {
-                "title": data.get("title", ""),
-                "description": f"YouTube 영상: {data.get('author_name', '')}",
-            }
+        if video_id:
+            metadata = await _parse_youtube(video_id)
+        else:
+            metadata = await _parse_webpage(url)
+        ok, ttl = True, settings.url_metadata_ttl_seconds
     except Exception as exc:
-        logger.warning("YouTube oEmbed 파싱 실패: %s", exc)
-        return {"title": url, "description": ""}
+        if video_id:
+            logger.warning("YouTube oEmbed 파싱 실패: %s", exc)
+        else:
+            logger.warning("웹페이지 파싱 실패 (%s): %s", url, exc)
+        metadata = {"title": url, "description": ""}
+        ok, ttl = False, settings.url_metadata_negative_ttl_seconds
 
+    _metadata_cache.set(key, (metadata, ok), ttl=ttl)
+    return metadata, ok
+
+
+async def resolve_many(urls: Iterable[str], deadline: float) -> dict[str, Optional[tuple[dict, bool]]]:
+    """
+    여러 URL 동시 파싱 — 호스트별 동시 요청 수 제한(url_per_host_concurrency) + 전체 마감 시간.
+    캐시 히트는 제한 없이 즉시 반환. 마감까지 끝나지 않은 URL은 취소 후 None.
+    """
+    semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.url_per_host_concurrency)
+    )
+
+    async def limited(url: str) -> tuple[dict, bool]:
+        cached = _cached(url)
+        if cached is not None:
+            return cached
+        async with semaphores[_host_key(url)]:
+            return await resolve(url)
+
+    tasks = {url: asyncio.create_task(limited(url)) for url in dict.fromkeys(urls)}
+    if tasks:
+        await asyncio.wait(tasks.values(), timeout=deadline)
+
+    results: dict[str, Optional[tuple[dict, bool]]] = {}
+    for url, task in tasks.items():
+        if task.done() and not task.cancelled() and task.exception() is None:
+            results[url] = task.result()
+        else:
+            task.cancel()
+            results[url] = None
+    timed_out = sum(result is None for result in results.values())
+    if timed_out:
+        logger.warning("링크 일괄 파싱 마감 초과: %d/%d건", timed_out, len(results))
+    return results
+
+
+def extract_urls(text: str) -> list[str]:
+    """본문에 포함된 http(s) URL (등장 순서, 중복 제거, 끝 문장부호 제외)"""
+    urls = (match.rstrip(URL_TRAILING_PUNCTUATION) for match in URL_PATTERN.findall(text or ""))
+    return list(dict.fromkeys(url for url in urls if url))
 
-async def _parse_webpage(url: str) -> dict:
-    """일반 웹페이지 og:title / og:description 파싱"""
-    headers = {"User-Agent": "Mozilla/5.0 (Memolish bot)"}
-    try:
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            title = (
-                _og(soup, "og:title")
-                or (soup.title.string.strip() if soup.title else "")
-            )
-            description = (
-                _og(soup, "og:description")
-                or _meta(soup, "description")
-                or ""
-            )
-            return {"title": title[:512], "description": description[:1000]}
-    except Exception as exc:
-        logger.warning("웹페이지 파싱 실패 (%s): %s", url, exc)
-        return {"title": url, "description": ""}
 
+def _cached(url: str) -> Optional[tuple[dict, bool]]:
+    cached = _metadata_cache.get(cache_key(url))
+    if cached is None:
+        return None
+    metadata, ok = cached
+    return dict(metadata), ok
 
-def _og(soup: BeautifulSoup, property_name: str) -> str:
-    tag = soup.find("meta", property=property_name)
-    return tag["content"].strip() if tag and tag.get("content") else ""
 
+def _host_key(url: str) -> str:
+    if _youtube_video_id(url):
+        return "youtube.com"
+    return (urlsplit(url).hostname or "").lower()
+
+
+def cache_key(url: str) -> str:
+    """YouTube는 영상 ID, 그 외는 정규화 URL"""
+    video_id = _youtube_video_id(url)
+    if video_id:
+        return f"yt:{video_id}"
+    return normalize_url(url)
+
+
+def normalize_url(url: str) -> str:
+    """
+    같은 페이지를 가리키는 URL 표기 차이 제거 —
+    scheme/host 소문자, 기본 포트·fragment·추적 파라미터 제거, 쿼리 정렬.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def _youtube_video_id(url: str) -> str | None:
+    match = YOUTUBE_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # HTTP/2는 h2 패키지가 있을 때만 (없으면 HTTP/1.1 keep-alive)
+        http2 = importlib.util.find_spec("h2") is not None
+        _client = httpx.AsyncClient(
+            http2=http2,
+            timeout=settings.url_fetch_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=settings.url_http_max_connections,
+                max_keepalive_connections=settings.url_http_max_keepalive_connections,
+            ),
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+        )
+        logger.info("URL 파서 HTTP 클라이언트 생성 (http2=%s)", http2)
+    return _client
+
+
+async def close_client() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _parse_youtube(video_id: str) -> dict:
+    """YouTube oEmbed API로 제목/저자 추출"""
+    resp = await _get_client().get(
+        "https://www.youtube.com/oembed",
+        params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    return {
+        "title": data.get("title", ""),
+        "description": f"YouTube 영상: {data.get('author_name', '')}",
+    }
+
+
+async def _parse_webpage(url: str) -> dict:
+    """
+    일반 웹페이지 og:title / og:description / <title> 파싱.
+    본문 전체를 받지 않고 조각 단위로 읽으며 </head> 또는 url_head_max_bytes에서 중단.
+    HTML이 아니면(PDF/이미지 등) 본문을 읽지 않고 URL을 제목으로 사용.
+    """
+    async with _get_client().stream("GET", url) as resp:
+        resp.raise_for_status()
+        content_type = resp.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            logger.info("HTML 아님 (%s): %s", content_type, url)
+            return {"title": url, "description": ""}
 
-def _meta(soup: BeautifulSoup, name: str) -> str:
-    tag = soup.find("meta", attrs={"name": name})
-    return tag["content"].strip() if tag and tag.get("content") else ""
+        extractor = HeadExtractor(charset=resp.charset_encoding)
+        async for chunk in resp.aiter_bytes():
+            extractor.feed(chunk)
+            if extractor.done or extractor.bytes_read >= settings.url_head_max_bytes:
+                break
+    return extractor.close()
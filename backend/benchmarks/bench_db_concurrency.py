@@ -0,0 +1,109 @@
+"""
+동시 요청 처리량 벤치마크 — 동기 Session vs AsyncSession.
+
+async 핸들러 안에서 동기 Session으로 쿼리하던 기존 방식(이벤트 루프 블로킹)과
+AsyncSession 방식의 동시 요청 처리량을 비교한다.
+
+실행 (backend 디렉토리에서, 동기 경로용 psycopg2는 requirements-dev.txt):
+    python -m benchmarks.bench_db_concurrency --requests 500 --concurrency 50
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_db_concurrency --server-ms 5
+
+두 경로 모두 요청마다 실제 DB 왕복만 수행한다 (지연을 코드로 주입하지 않음).
+--server-ms: PostgreSQL에서 SELECT pg_sleep(...)으로 서버측 처리 시간을 더함 — 연결을 실제로
+점유한 채 기다리므로 풀 크기/드라이버 동작이 결과에 그대로 반영된다.
+로컬 SQLite는 RTT가 0에 가깝고 pg_sleep이 없어 목록 쿼리 비용만 비교된다.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import create_engine, delete, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal, create_tables, dispose_engine, is_sqlite
+from app.models.memo import Memo
+
+SEED_USER = f"bench-{uuid.uuid4().hex[:8]}"
+
+
+async def _seed(n: int) -> None:
+    async with AsyncSessionLocal() as db:
+        db.add_all(Memo(user_id=SEED_USER, content=f"bench memo {i}") for i in range(n))
+        await db.commit()
+
+
+async def _cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Memo).where(Memo.user_id == SEED_USER))
+        await db.commit()
+
+
+def _make_sync_sessionmaker():
+    """기존(베이스라인) 방식의 동기 엔진 — PostgreSQL은 psycopg2 드라이버 (requirements-dev.txt)"""
+    url = make_url(settings.database_url)
+    if is_sqlite:
+        url, connect_args = url.set(drivername="sqlite"), {"check_same_thread": False}
+    else:
+        url, connect_args = url.set(drivername="postgresql+psycopg2"), {}
+    engine = create_engine(url, connect_args=connect_args, pool_pre_ping=not is_sqlite)
+    return sessionmaker(bind=engine), engine
+
+
+async def _run(handler, total: int, concurrency: int) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            await handler()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=30)
+    parser.add_argument("--memos", type=int, default=50)
+    parser.add_argument("--server-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    if is_sqlite and args.server_ms:
+        print("SQLite에는 pg_sleep이 없어 --server-ms를 무시합니다.")
+
+    await create_tables()
+    await _seed(args.memos)
+    SyncSession, sync_engine = _make_sync_sessionmaker()
+    stmt = select(Memo).where(Memo.user_id == SEED_USER).order_by(Memo.created_at.desc())
+    server_work = None
+    if not is_sqlite and args.server_ms:
+        server_work = text("SELECT pg_sleep(:seconds)").bindparams(seconds=args.server_ms / 1000)
+
+    async def sync_handler():
+        # 베이스라인: async def 안에서 동기 쿼리 → 이벤트 루프 블로킹
+        with SyncSession() as db:
+            if server_work is not None:
+                db.execute(server_work)
+            db.execute(stmt).scalars().all()
+
+    async def async_handler():
+        async with AsyncSessionLocal() as db:
+            if server_work is not None:
+                await db.execute(server_work)
+            (await db.execute(stmt)).scalars().all()
+
+    try:
+        for name, handler in (("sync Session", sync_handler), ("AsyncSession", async_handler)):
+            elapsed = await _run(handler, args.requests, args.concurrency)
+            print(f"{name:<14} {args.requests} req / {elapsed:.2f}s = {args.requests / elapsed:,.0f} req/s")
+    finally:
+        await _cleanup()
+        sync_engine.dispose()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+링크 메타데이터 추출 벤치마크 — 기존 방식(본문 전체 디코딩 + BeautifulSoup 트리) vs
+스트리밍 <head> 파서(조각 단위 증분 파싱, </head> 또는 바이트 상한에서 중단).
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_html_head_parser                 # 합성 페이지 (50KB ~ 4MB)
+    python -m benchmarks.bench_html_head_parser --corpus ./pages  # 저장해 둔 *.html 파일
+"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.config import settings
+from app.services.html_head_parser import HeadExtractor
+
+CHUNK_SIZE = 16 * 1024   # httpx aiter_bytes 기본 조각과 비슷한 크기
+
+
+def _synthetic_page(body_kb: int) -> bytes:
+    head = (
+        "<!doctype html><html lang='ko'><head><meta charset='utf-8'>"
+        "<title>오늘의 뉴스 — 예시 사이트</title>"
+        "<meta property='og:title' content='주말 날씨: 전국 맑음'>"
+        "<meta property='og:description' content='토요일은 전국이 대체로 맑고 일교차가 크겠습니다.'>"
+        + "<link rel='stylesheet' href='/static/app.css'>" * 20
+        + "<script>window.__STATE__ = {};</script></head><body>"
+    )
+    paragraph = "<div class='article'><p>본문 문단입니다. Lorem ipsum dolor sit amet.</p></div>\n"
+    repeat = body_kb * 1024 // len(paragraph.encode()) + 1
+    return (head + paragraph * repeat + "</body></html>").encode("utf-8")
+
+
+def _load_corpus(directory: str | None) -> list[tuple[str, bytes]]:
+    if directory:
+        return [(path.name, path.read_bytes()) for path in sorted(Path(directory).glob("*.html"))]
+    return [(f"synthetic-{kb}KB", _synthetic_page(kb)) for kb in (50, 500, 4000)]
+
+
+def _beautifulsoup_path(raw: bytes) -> dict:
+    """변경 전 _parse_webpage 본문 처리와 동일 (resp.text + BeautifulSoup)"""
+    soup = BeautifulSoup(raw.decode("utf-8", errors="replace"), "html.parser")
+    og_title = soup.find("meta", property="og:title")
+    og_description = soup.find("meta", property="og:description")
+    description = soup.find("meta", attrs={"name": "description"})
+    title = (
+        (og_title.get("content") if og_title else "")
+        or (soup.title.string.strip() if soup.title and soup.title.string else "")
+    )
+    return {
+        "title": title[:512],
+        "description": ((og_description or description or {}).get("content") or "")[:1000],
+    }
+
+
+def _streaming_path(raw: bytes) -> dict:
+    extractor = HeadExtractor(charset="utf-8")
+    for start in range(0, len(raw), CHUNK_SIZE):
+        extractor.feed(raw[start:start + CHUNK_SIZE])
+        if extractor.done or extractor.bytes_read >= settings.url_head_max_bytes:
+            break
+    return extractor.close()
+
+
+def _measure(fn, raw: bytes, repeat: int) -> tuple[float, int, dict]:
+    best = float("inf")
+    result = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(raw)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="저장된 *.html 파일 디렉토리")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'page':<28} {'size':>9}  {'method':<14} {'time':>10} {'peak mem':>11}  match")
+    for name, raw in _load_corpus(args.corpus):
+        baseline = None
+        for label, fn in (("beautifulsoup", _beautifulsoup_path), ("streaming", _streaming_path)):
+            elapsed, peak, result = _measure(fn, raw, args.repeat)
+            baseline = baseline or result
+            print(
+                f"{name[:28]:<28} {len(raw) / 1024:7.0f}KB  {label:<14} "
+                f"{elapsed * 1000:8.2f}ms {peak / 1024:9.0f}KB  {result == baseline}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+메모 목록 벤치마크 — 전체 로드(.all() + MemoResponse) vs keyset 페이지 + 경량 프로젝션.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_memo_listing --memos 100000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_memo_listing
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Request, Response
+from sqlalchemy import delete, insert, select
+
+from app.database import AsyncSessionLocal, create_tables, dispose_engine
+from app.models.dialogue import DialogueExchange
+from app.models.memo import Memo
+from app.routers.memos import list_memos
+from app.schemas.memo import MemoResponse
+
+SEED_USER = f"bench-{uuid.uuid4().hex[:8]}"
+EXCHANGES = [{"speaker": "AB"[i % 2], "line": "Sounds good! " * 4, "korean": "좋아요! " * 4} for i in range(8)]
+
+
+async def _seed(n: int) -> None:
+    base = datetime.now(timezone.utc)
+    rows = [
+        {
+            "user_id": SEED_USER,
+            "content": f"메모 {i} — 내일 회의 준비하고 자료 정리하기. " * 3,
+            "url_description": "링크 설명 " * 50,
+            "is_transformed": i % 2 == 0,
+            "ai_summary_ko": "요약 " * 40,
+            "ai_summary_en": "summary " * 40,
+            "dialogue_title": "Weekend plans" if i % 2 == 0 else None,
+            "dialogue_situation": "주말 계획을 이야기하는 상황" if i % 2 == 0 else None,
+            "created_at": base - timedelta(seconds=i),
+            "start_date": base,
+        }
+        for i in range(n)
+    ]
+    async with AsyncSessionLocal() as db:
+        for start in range(0, n, 5000):
+            memo_ids = (await db.scalars(insert(Memo).returning(Memo.id, sort_by_parameter_order=True), rows[start:start + 5000])).all()
+            exchanges = [
+                {"memo_id": memo_id, "position": position, **exchange}
+                for memo_id, row in zip(memo_ids, rows[start:start + 5000])
+                if row["is_transformed"]
+                for position, exchange in enumerate(EXCHANGES)
+            ]
+            await db.execute(insert(DialogueExchange), exchanges)
+        await db.commit()
+
+
+async def _timed(label: str, fn, repeat: int = 3) -> None:
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = await fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<34} {best * 1000:9.1f} ms  {size / 1024:10.1f} KiB")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--memos", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    await create_tables()
+    print(f"seeding {args.memos:,} memos ...")
+    await _seed(args.memos)
+
+    async def full_list():
+        async with AsyncSessionLocal() as db:
+            memos = (await db.execute(
+                select(Memo).where(Memo.user_id == SEED_USER).order_by(Memo.created_at.desc())
+            )).scalars().all()
+            return len(json.dumps([MemoResponse.model_validate(m).model_dump(mode="json") for m in memos]))
+
+    async def page(cursor=None):
+        async with AsyncSessionLocal() as db:
+            result = await list_memos(
+                request=Request({"type": "http", "headers": [], "query_string": b""}), response=Response(),
+                cursor=cursor, limit=args.limit, status=None, created_from=None, created_to=None,
+                db=db, user_id=SEED_USER,
+            )
+            return result
+
+    async def first_page():
+        return len((await page()).model_dump_json())
+
+    # 깊은 페이지: 중간쯤의 커서를 미리 구함
+    deep_cursor = None
+    result = await page()
+    for _ in range(min(200, args.memos // args.limit // 2)):
+        deep_cursor = result.next_cursor
+        result = await page(deep_cursor)
+
+    async def deep_page():
+        return len((await page(deep_cursor)).model_dump_json())
+
+    try:
+        await _timed("before: full list (.all())", full_list, repeat=1)
+        await _timed(f"after: first page (limit={args.limit})", first_page)
+        await _timed("after: deep page (keyset cursor)", deep_page)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Memo).where(Memo.user_id == SEED_USER))
+            await db.commit()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
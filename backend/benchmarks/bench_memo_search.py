@@ -0,0 +1,140 @@
+"""
+메모 검색 벤치마크 — 색인 없는 LIKE '%검색어%' 전체 스캔 vs 전문 검색 인덱스
+(SQLite FTS5 / PostgreSQL tsvector + GIN, 한글 bigram).
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_memo_search --memos 1000000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_memo_search --memos 1000000
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, or_, select
+
+from app.database import AsyncSessionLocal, create_tables, dispose_engine
+from app.models.memo import Memo
+from app.services import search_service
+
+SEED_USER = f"bench-{uuid.uuid4().hex[:8]}"
+COMMON_WORDS = (
+    "회의록 정리 주말 등산 계획 장보기 병원 예약 영어 공부 발표 자료 준비 여행 숙소 "
+    "meeting notes weekend hiking groceries dentist presentation deadline travel"
+).split()
+VOCABULARY_SIZE = 20_000
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    """자주 쓰는 단어 + 합성 단어 (한글 2~4음절 / 영문) — 등장 빈도는 Zipf 분포로 뽑음"""
+    words = list(COMMON_WORDS)
+    while len(words) < VOCABULARY_SIZE:
+        if rng.random() < 0.7:
+            words.append("".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 4))))
+        else:
+            words.append("".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(4, 9))))
+    return list(dict.fromkeys(words))
+
+
+RNG = random.Random(42)
+VOCABULARY = _vocabulary(RNG)
+CUM_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1)))
+# 흔한 단어 / 중간 빈도 / 드문 단어 / 두 단어 AND / 접두 검색 / 없는 단어
+QUERIES = [
+    VOCABULARY[3],
+    VOCABULARY[500],
+    VOCABULARY[15_000],
+    f"{VOCABULARY[1]} {VOCABULARY[200]}",
+    VOCABULARY[-1][:3] if VOCABULARY[-1].isascii() else VOCABULARY[-1][:2],
+    "존재하지않는단어",
+]
+
+
+def _words(k: int) -> str:
+    return " ".join(RNG.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=k))
+
+
+async def _seed(n: int) -> None:
+    base = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        for start in range(0, n, 5000):
+            rows = [
+                {
+                    "user_id": SEED_USER,
+                    "content": _words(12),
+                    "url_title": _words(4) if i % 3 == 0 else None,
+                    "ai_summary_ko": _words(20) if i % 4 == 0 else None,
+                    "created_at": base - timedelta(seconds=i),
+                    "start_date": base,
+                }
+                for i in range(start, min(start + 5000, n))
+            ]
+            await db.execute(insert(Memo), rows)
+        await db.commit()
+
+
+async def _like_scan(query: str) -> int:
+    """변경 전 방식에 해당하는 서버측 필터 — 모든 텍스트 컬럼 LIKE (인덱스 사용 불가)"""
+    conditions = [
+        or_(*(column.contains(word) for column in (Memo.content, Memo.url_title, Memo.ai_summary_ko)))
+        for word in query.split()
+    ]
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(Memo.id).where(Memo.user_id == SEED_USER, *conditions)
+            .order_by(Memo.created_at.desc()).limit(20)
+        )
+        return len(rows.all())
+
+
+async def _indexed(query: str) -> int:
+    async with AsyncSessionLocal() as db:
+        return len(await search_service.search(db, SEED_USER, query, limit=20))
+
+
+async def _timed(fn, query: str, repeat: int) -> tuple[float, int]:
+    best, hits = float("inf"), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        hits = await fn(query)
+        best = min(best, time.perf_counter() - started)
+    return best, hits
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--memos", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    await create_tables()
+    await search_service.ensure_index()
+    print(f"seeding {args.memos:,} memos ...")
+    await _seed(args.memos)
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        indexed = await search_service.backfill_index(db)
+    print(f"indexed {indexed:,} memos in {time.perf_counter() - started:.1f}s\n")
+
+    try:
+        print(f"{'query':<20} {'LIKE scan':>12} {'indexed':>12}  hits")
+        for query in QUERIES:
+            scan, scan_hits = await _timed(_like_scan, query, args.repeat)
+            fts, fts_hits = await _timed(_indexed, query, args.repeat)
+            print(f"{query:<20} {scan * 1000:9.1f} ms {fts * 1000:9.1f} ms  {scan_hits}/{fts_hits}")
+    finally:
+        async with AsyncSessionLocal() as db:
+            memo_ids = (await db.scalars(select(Memo.id).where(Memo.user_id == SEED_USER))).all()
+            for start in range(0, len(memo_ids), 5000):
+                await search_service.remove_memos(db, memo_ids[start:start + 5000])
+            await db.execute(delete(Memo).where(Memo.user_id == SEED_USER))
+            await db.commit()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
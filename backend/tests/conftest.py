@@ -0,0 +1,32 @@
+import os
+import tempfile
+import uuid
+
+# app 모듈이 설정을 읽기 전에 테스트 전용 SQLite 파일로 지정
+_DB_DIR = tempfile.mkdtemp(prefix="memolish-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["TTS_CACHE_DIR"] = os.path.join(_DB_DIR, "tts")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """앱 lifespan(테이블 생성/작업 워커)까지 띄운 테스트 클라이언트 — 세션 동안 공유"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def headers():
+    """테스트마다 새 사용자 — 공유 DB에서도 서로 간섭하지 않음"""
+    return {"X-Session-Id": f"test-{uuid.uuid4().hex[:12]}"}
+
+
+@pytest.fixture
+def run(client):
+    """코루틴 함수를 앱과 같은 이벤트 루프에서 실행 — 엔진 커넥션 풀을 앱과 공유"""
+    return client.portal.call
@@ -0,0 +1,95 @@
+import asyncio
+from datetime import date, timedelta
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.user import User
+from app.services import credit_service
+
+
+def _call(run, fn, *args, **kwargs):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            return await fn(db, *args, **kwargs)
+
+    return run(scenario)
+
+
+def test_new_session_starts_with_daily_credits(run, headers):
+    balance = _call(run, credit_service.get_balance, headers["X-Session-Id"])
+    assert (balance.daily_credits, balance.is_premium) == (settings.daily_free_credits, False)
+
+
+def test_reserve_until_empty(run, headers):
+    user_id = headers["X-Session-Id"]
+    remaining = [
+        _call(run, credit_service.reserve, user_id).daily_credits for _ in range(settings.daily_free_credits)
+    ]
+    assert remaining == list(range(settings.daily_free_credits - 1, -1, -1))
+    assert _call(run, credit_service.reserve, user_id) is None
+
+
+def test_concurrent_reservations_never_overdraw(run, headers):
+    user_id = headers["X-Session-Id"]
+
+    async def scenario():
+        async def one():
+            async with AsyncSessionLocal() as db:
+                return await credit_service.reserve(db, user_id)
+
+        return await asyncio.gather(*(one() for _ in range(settings.daily_free_credits + 5)))
+
+    granted = [balance for balance in run(scenario) if balance is not None]
+    assert len(granted) == settings.daily_free_credits
+    assert _call(run, credit_service.get_balance, user_id).daily_credits == 0
+
+
+def test_reserve_more_than_daily_limit_is_rejected(run, headers):
+    assert _call(run, credit_service.reserve, headers["X-Session-Id"], amount=settings.daily_free_credits + 1) is None
+
+
+def test_reserve_up_to_grants_what_is_left(run, headers):
+    user_id = headers["X-Session-Id"]
+    _call(run, credit_service.reserve, user_id)
+
+    granted, balance = _call(run, credit_service.reserve_up_to, user_id, amount=10)
+    assert granted == settings.daily_free_credits - 1
+    assert balance.daily_credits == 0
+    assert _call(run, credit_service.reserve_up_to, user_id, amount=1) == (0, None)
+
+
+def test_refund_is_capped_at_daily_limit(run, headers):
+    user_id = headers["X-Session-Id"]
+    _call(run, credit_service.reserve, user_id)
+    _call(run, credit_service.refund, user_id, amount=5)
+    assert _call(run, credit_service.get_balance, user_id).daily_credits == settings.daily_free_credits
+
+
+def test_credits_reset_on_a_new_day(run, headers):
+    user_id = headers["X-Session-Id"]
+    for _ in range(settings.daily_free_credits):
+        _call(run, credit_service.reserve, user_id)
+
+    async def yesterday(db):
+        await db.execute(
+            update(User).where(User.session_id == user_id).values(credits_reset_date=date.today() - timedelta(days=1))
+        )
+        await db.commit()
+
+    _call(run, yesterday)
+    assert _call(run, credit_service.reserve, user_id).daily_credits == settings.daily_free_credits - 1
+
+
+def test_premium_is_never_charged(run, headers):
+    user_id = headers["X-Session-Id"]
+    _call(run, credit_service.get_balance, user_id)
+
+    async def upgrade(db):
+        await db.execute(update(User).where(User.session_id == user_id).values(is_premium=True))
+        await db.commit()
+
+    _call(run, upgrade)
+    balance = _call(run, credit_service.reserve, user_id, amount=settings.daily_free_credits + 10)
+    assert (balance.daily_credits, balance.is_premium) == (settings.daily_free_credits, True)
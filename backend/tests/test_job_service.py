@@ -0,0 +1,101 @@
+import asyncio
+import uuid
+from datetime import timedelta
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.job import Job, JobStatus
+from app.services import credit_service, job_service
+
+
+def test_update_before_wait_is_not_lost(run):
+    job_id = uuid.uuid4().hex
+
+    async def scenario():
+        with job_service.watch(job_id) as updated:
+            job_service._notify(job_id)   # 작업을 읽은 뒤, 대기 전에 상태가 바뀐 경우
+            started = asyncio.get_running_loop().time()
+            await job_service.wait_for_update(updated, timeout=2.0)
+            return asyncio.get_running_loop().time() - started
+
+    assert run(scenario) < 0.5
+    assert job_id not in job_service._job_events
+
+
+def test_every_subscriber_is_notified_and_released(run):
+    job_id = uuid.uuid4().hex
+
+    async def scenario():
+        with job_service.watch(job_id) as first, job_service.watch(job_id) as second:
+            job_service._notify(job_id)
+            return first.is_set() and second.is_set()
+
+    assert run(scenario) is True
+    assert job_id not in job_service._job_events
+
+
+def test_requeue_expired_running_jobs(run):
+    async def scenario():
+        now = job_service._now()
+        expired, live = (
+            Job(id=uuid.uuid4().hex, kind="test-reaper", user_id="reaper", status=JobStatus.RUNNING,
+                attempts=1, created_at=now, started_at=now - timedelta(minutes=5), lease_expires_at=lease)
+            for lease in (now - timedelta(seconds=1), now + timedelta(minutes=1))
+        )
+        async with AsyncSessionLocal() as db:
+            db.add_all([expired, live])
+            await db.commit()
+
+        requeued = await job_service.requeue_expired()
+        async with AsyncSessionLocal() as db:
+            live_row = await db.get(Job, live.id)
+            return requeued, live_row.status, live_row.attempts
+
+    requeued, live_status, live_attempts = run(scenario)
+    assert requeued == 1
+    assert (live_status, live_attempts) == (JobStatus.RUNNING, 1)
+
+
+def test_stale_attempt_does_not_overwrite_job(run):
+    """리스를 잃고 재실행된 작업 — 이전 시도의 결과는 버려짐"""
+    job_service.register("test-stale", lambda job: asyncio.sleep(0, result={"attempt": job.attempts}))
+
+    async def scenario():
+        now = job_service._now()
+        job = Job(id=uuid.uuid4().hex, kind="test-stale", user_id="stale", status=JobStatus.RUNNING,
+                  attempts=2, created_at=now, started_at=now, lease_expires_at=now + timedelta(minutes=1))
+        async with AsyncSessionLocal() as db:
+            db.add(job)
+            await db.commit()
+            stale = await db.get(Job, job.id)
+        stale.attempts = 1
+        await job_service._execute(stale)
+        async with AsyncSessionLocal() as db:
+            row = await db.get(Job, job.id)
+            return row.status, row.result_json
+
+    assert run(scenario) == (JobStatus.RUNNING, None)
+
+
+def test_requeued_transform_refunds_reservation(run, headers):
+    """워커가 죽어 재대기된 변환 시도의 예약 크레딧은 환불"""
+    user_id = headers["X-Session-Id"]
+
+    async def scenario():
+        now = job_service._now()
+        async with AsyncSessionLocal() as db:
+            await credit_service.reserve(db, user_id)
+            db.add(Job(id=uuid.uuid4().hex, kind="transform", user_id=user_id, memo_id=10**9,
+                       status=JobStatus.RUNNING, attempts=1, created_at=now, started_at=now,
+                       lease_expires_at=now - timedelta(seconds=1), reserved_credits=1))
+            await db.commit()
+        await job_service.requeue_expired()
+        async with AsyncSessionLocal() as db:
+            return (await credit_service.get_balance(db, user_id)).daily_credits
+
+    assert run(scenario) == settings.daily_free_credits
+
+
+def test_background_request_for_missing_memo_is_404(client, headers):
+    assert client.post("/api/ai/transform/999999999?background=true", headers=headers).status_code == 404
+    assert client.post("/api/audio/generate/999999999?background=true", headers=headers).status_code == 404
@@ -0,0 +1,76 @@
+import json
+
+from app.config import settings
+
+
+def _ndjson(records):
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode()
+
+
+def _import(client, headers, body):
+    response = client.post(
+        "/api/memos/import", content=body, headers={**headers, "Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_import_round_trips_with_export(client, headers):
+    body = _ndjson([{"content": f"imported {i}"} for i in range(5)])
+    assert _import(client, headers, body) == {"imported": 5, "failed": 0, "errors": []}
+
+    exported = client.get("/api/memos/export", headers=headers).text.splitlines()
+    assert [json.loads(line)["content"] for line in exported] == [f"imported {i}" for i in range(5)]
+
+
+def test_invalid_lines_are_reported_and_skipped(client, headers):
+    body = b'{"content": "ok"}\nnot json\n\n{"status": "pending"}\n{"content": "ok 2"}\n'
+    result = _import(client, headers, body)
+    assert result["imported"] == 2
+    assert result["failed"] == 2
+    assert [error["line"] for error in result["errors"]] == [2, 4]
+
+
+def test_records_past_the_cap_are_counted_as_failed(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "memo_import_max_records", 3)
+    monkeypatch.setattr(settings, "memo_import_chunk_size", 2)
+    body = _ndjson([{"content": f"capped {i}"} for i in range(7)])
+
+    result = _import(client, headers, body)
+
+    assert result["imported"] == 3
+    assert result["failed"] == 4   # 남은 줄을 버리지 않고 끝까지 읽어 실패로 집계
+    assert [error["line"] for error in result["errors"]] == [4, 5, 6, 7]
+    assert all("최대 3개" in error["error"] for error in result["errors"])
+    assert len(client.get("/api/memos/export", headers=headers).text.splitlines()) == 3
+
+
+def test_oversized_line_is_rejected(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "memo_import_max_line_bytes", 64)
+    body = _ndjson([{"content": "x" * 200}, {"content": "short"}])
+    result = _import(client, headers, body)
+    assert (result["imported"], result["failed"]) == (1, 1)
+    assert result["errors"][0]["line"] == 1
+
+
+def test_lines_split_across_chunks(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "memo_import_max_line_bytes", 64)
+    body = _ndjson([{"content": "first"}, {"content": "x" * 200}, {"content": "second"}]) + b'{"content": "last"}'
+    # 몇 바이트씩 잘라 보내 줄이 여러 청크에 걸치게 함
+    chunks = [body[start:start + 7] for start in range(0, len(body), 7)]
+    result = _import(client, headers, iter(chunks))
+    assert (result["imported"], result["failed"]) == (3, 1)
+    assert result["errors"][0]["line"] == 2
+    exported = client.get("/api/memos/export", headers=headers).text.splitlines()
+    assert [json.loads(line)["content"] for line in exported] == ["first", "second", "last"]
+
+
+def test_dialogue_without_summaries_is_rejected(client, headers):
+    dialogue = {"title": "t", "situation": "s", "exchanges": [{"speaker": "A", "line": "Hi", "korean": "안녕"}]}
+    body = _ndjson([
+        {"content": "partial", "ai_summary_ko": "요약", "ai_dialogue": dialogue},
+        {"content": "full", "ai_summary_ko": "요약", "ai_summary_en": "summary", "ai_dialogue": dialogue},
+    ])
+    result = _import(client, headers, body)
+    assert (result["imported"], result["failed"]) == (1, 1)
+    assert result["errors"][0]["line"] == 1
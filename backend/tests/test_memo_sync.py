@@ -0,0 +1,78 @@
+import base64
+import json
+import time
+from datetime import datetime
+
+from app.config import settings
+
+
+def _tombstone_at(cursor: str) -> datetime:
+    return datetime.fromisoformat(json.loads(base64.urlsafe_b64decode(cursor))["t"][0])
+
+
+def _sync(client, headers, cursor=None, **params):
+    if cursor:
+        params["cursor"] = cursor
+    response = client.get("/api/memos/sync", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_first_sync_pages_everything(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 0.0)
+    ids = [client.post("/api/memos", json={"content": f"m{i}"}, headers=headers).json()["id"] for i in range(3)]
+
+    page = _sync(client, headers, limit=2)
+    assert page["reset"] is True and page["has_more"] is True
+    rest = _sync(client, headers, page["cursor"], limit=2)
+    assert rest["reset"] is False and rest["has_more"] is False
+    assert [m["id"] for m in page["changed"] + rest["changed"]] == ids
+
+
+def test_cursor_returns_changes_and_deletes(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 0.0)
+    keep, gone = (client.post("/api/memos", json={"content": c}, headers=headers).json()["id"] for c in "ab")
+    cursor = _sync(client, headers)["cursor"]
+
+    client.patch(f"/api/memos/{keep}/status", json={"status": "completed"}, headers=headers)
+    client.delete(f"/api/memos/{gone}", headers=headers)
+    delta = _sync(client, headers, cursor)
+    assert [(m["id"], m["status"]) for m in delta["changed"]] == [(keep, "completed")]
+    assert delta["deleted"] == [gone]
+
+    assert _sync(client, headers, delta["cursor"])["changed"] == []
+
+
+def test_overlap_window_resends_recent_changes(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 60.0)
+    memo_id = client.post("/api/memos", json={"content": "recent"}, headers=headers).json()["id"]
+    first = _sync(client, headers)
+    again = _sync(client, headers, first["cursor"])
+    assert [m["id"] for m in again["changed"]] == [memo_id]
+
+
+def test_idle_cursor_advances_tombstone_key(client, headers, monkeypatch):
+    """삭제가 없어도 tombstone 커서가 watermark를 따라가 보관 기간에 걸리지 않음"""
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 0.0)
+    monkeypatch.setattr(settings, "sync_tombstone_retention_days", 0.3 / 86400)
+    client.post("/api/memos", json={"content": "long-lived"}, headers=headers)
+
+    cursor = _sync(client, headers)["cursor"]
+    for _ in range(3):
+        time.sleep(0.15)
+        page = _sync(client, headers, cursor)
+        assert page["reset"] is False
+        assert _tombstone_at(page["cursor"]) > _tombstone_at(cursor)
+        cursor = page["cursor"]
+
+
+def test_expired_cursor_forces_reset(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 0.0)
+    monkeypatch.setattr(settings, "sync_tombstone_retention_days", 0.1 / 86400)
+    cursor = _sync(client, headers)["cursor"]
+    time.sleep(0.2)
+    assert _sync(client, headers, cursor)["reset"] is True
+
+
+def test_invalid_cursor_is_rejected(client, headers):
+    assert client.get("/api/memos/sync", params={"cursor": "garbage"}, headers=headers).status_code == 400
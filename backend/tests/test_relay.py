@@ -0,0 +1,47 @@
+import asyncio
+
+from app.services.relay import Relay
+
+
+def test_relay_delivers_in_order():
+    async def scenario():
+        relay = Relay(maxsize=2, stall_seconds=1.0)
+
+        async def produce():
+            for i in range(5):
+                await relay.put(i)
+            await relay.close()
+
+        producer = asyncio.create_task(produce())
+        received = [item async for item in relay.items()]
+        await producer
+        return received
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+
+
+def test_slow_listener_is_detached():
+    async def scenario():
+        relay = Relay(maxsize=2, stall_seconds=0.05)
+        for i in range(10):  # 아무도 읽지 않음 — 큐가 차면 분리되고 나머지는 버려져야 함
+            await relay.put(i)
+        await relay.close()
+        return relay.detached, [item async for item in relay.items()]
+
+    detached, received = asyncio.run(scenario())
+    assert detached
+    assert received == []
+
+
+def test_disconnected_listener_does_not_block_producer():
+    async def scenario():
+        relay = Relay(maxsize=1, stall_seconds=5.0)
+        items = relay.items()
+        await relay.put(0)
+        assert await anext(items) == 0
+        await items.aclose()  # 클라이언트 끊김
+        # stall_seconds를 기다리지 않고 바로 끝나야 함
+        await asyncio.wait_for(asyncio.gather(*(relay.put(i) for i in range(5)), relay.close()), 1.0)
+        return relay.detached
+
+    assert asyncio.run(scenario())
@@ -0,0 +1,28 @@
+from app.services import s3_service
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls += 1
+        return f"https://s3/{Params['Key']}?n={self.calls}&expires={ExpiresIn}"
+
+
+def test_cached_presigned_url_reports_remaining_ttl(run, monkeypatch):
+    client = _FakeClient()
+    monkeypatch.setattr(s3_service, "_get_client", lambda: client)
+    s3_service._presigned_urls.clear()
+
+    url, ttl = run(s3_service.get_presigned_url_with_ttl, "audio/x.mp3", 900)
+    assert ttl == 900
+
+    # 5분 전에 발급된 URL인 것처럼 캐시 항목을 앞당김
+    cache_key = ("audio/x.mp3", 900)
+    cached_url, url_expires_at = s3_service._presigned_urls.get(cache_key)
+    s3_service._presigned_urls.set(cache_key, (cached_url, url_expires_at - 300), ttl=500)
+
+    again, remaining = run(s3_service.get_presigned_url_with_ttl, "audio/x.mp3", 900)
+    assert again == url and client.calls == 1
+    assert 595 <= remaining <= 600
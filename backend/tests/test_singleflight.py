@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+
+from app.config import settings
+from app.services.singleflight import DatabaseLeaseBackend, SingleFlight, _lease_key
+
+
+def test_lease_serializes_same_key(run, monkeypatch):
+    monkeypatch.setattr(settings, "singleflight_poll_interval_seconds", 0.02)
+    key = f"transform:{uuid.uuid4().hex}"
+    events = []
+
+    async def worker(name):
+        async with DatabaseLeaseBackend().lock(key):
+            events.append(("in", name))
+            await asyncio.sleep(0.1)
+            events.append(("out", name))
+
+    async def both():
+        await asyncio.gather(worker("a"), worker("b"))
+
+    run(both)
+    assert [kind for kind, _ in events] == ["in", "out", "in", "out"]
+
+
+def test_lease_is_renewed_while_running(run, monkeypatch):
+    monkeypatch.setattr(settings, "singleflight_lease_seconds", 0.15)
+    monkeypatch.setattr(settings, "singleflight_poll_interval_seconds", 0.02)
+    key = f"audio:{uuid.uuid4().hex}"
+    backend = DatabaseLeaseBackend()
+
+    async def scenario():
+        async with backend.lock(key):
+            await asyncio.sleep(0.4)  # 리스 만료 시간보다 길게 — 연장되어야 다른 워커가 못 잡음
+            return await backend._claim(_lease_key(key), "intruder")
+
+    assert run(scenario) is False
+
+
+def test_expired_lease_is_taken_over(run, monkeypatch):
+    monkeypatch.setattr(settings, "singleflight_lease_seconds", 0.1)
+    monkeypatch.setattr(settings, "singleflight_poll_interval_seconds", 0.02)
+    key = f"transform:{uuid.uuid4().hex}"
+    backend = DatabaseLeaseBackend()
+
+    async def scenario():
+        assert await backend._claim(_lease_key(key), "crashed-worker")
+        async with backend.lock(key):
+            return True
+
+    assert run(scenario) is True
+
+
+def test_concurrent_calls_share_one_run(run):
+    flight = SingleFlight(DatabaseLeaseBackend())
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("shared", work) for _ in range(5)))
+
+    assert run(scenario) == ["result"] * 5
+    assert len(calls) == 1
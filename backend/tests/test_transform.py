@@ -0,0 +1,48 @@
+import app.routers.ai as ai_router
+from app.config import settings
+
+
+def _result(text, **exchange):
+    return {
+        "summary_ko": f"요약 {text}",
+        "summary_en": f"summary {text}",
+        "dialogue": {
+            "title": text,
+            "situation": "s",
+            "exchanges": [{"speaker": "A", "line": "Hi", "korean": "안녕", **exchange}],
+        },
+    }
+
+
+def _credits(client, headers):
+    return client.get("/api/ai/credits", headers=headers).json()["daily_credits"]
+
+
+def test_transform_saves_and_charges_once(client, headers, monkeypatch):
+    async def gemini(text):
+        return _result(text)
+
+    monkeypatch.setattr(ai_router, "transform_memo_with_gemini", gemini)
+    memo_id = client.post("/api/memos", json={"content": f"ok {headers}"}, headers=headers).json()["id"]
+
+    response = client.post(f"/api/ai/transform/{memo_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["credits_remaining"] == settings.daily_free_credits - 1
+    # 두 번째 호출은 저장된 결과 — 차감 없음
+    assert client.post(f"/api/ai/transform/{memo_id}", headers=headers).json()["credits_remaining"] == (
+        settings.daily_free_credits - 1
+    )
+
+
+def test_malformed_result_is_refunded_and_not_saved(client, headers, monkeypatch):
+    async def gemini(text):
+        result = _result(text)
+        del result["dialogue"]["exchanges"][0]["korean"]
+        return result
+
+    monkeypatch.setattr(ai_router, "transform_memo_with_gemini", gemini)
+    memo_id = client.post("/api/memos", json={"content": f"broken {headers}"}, headers=headers).json()["id"]
+
+    assert client.post(f"/api/ai/transform/{memo_id}", headers=headers).status_code == 502
+    assert _credits(client, headers) == settings.daily_free_credits
+    assert client.get(f"/api/memos/{memo_id}", headers=headers).json()["is_transformed"] is False
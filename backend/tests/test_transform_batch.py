@@ -0,0 +1,96 @@
+import asyncio
+
+import app.routers.ai as ai_router
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.schemas.memo import BatchTransformRequest
+
+
+def _result(text):
+    return {
+        "summary_ko": f"요약 {text}",
+        "summary_en": f"summary {text}",
+        "dialogue": {
+            "title": text,
+            "situation": "s",
+            "exchanges": [{"speaker": "A", "line": "Hi", "korean": "안녕"}],
+        },
+    }
+
+
+def _fake_gemini(monkeypatch, calls):
+    async def batch(sources):
+        calls.append(len(sources))
+        return {memo_id: _result(text) for memo_id, text in sources.items()}
+
+    async def single(text):
+        calls.append(1)
+        return _result(text)
+
+    monkeypatch.setattr(ai_router, "transform_memos_batch_with_gemini", batch)
+    monkeypatch.setattr(ai_router, "transform_memo_with_gemini", single)
+
+
+def _create(client, headers, contents):
+    return [client.post("/api/memos", json={"content": c}, headers=headers).json()["id"] for c in contents]
+
+
+def test_batch_transforms_what_credits_allow(client, headers, monkeypatch):
+    calls = []
+    _fake_gemini(monkeypatch, calls)
+    contents = [f"partial-{headers['X-Session-Id']}-{i}" for i in range(settings.daily_free_credits + 2)]
+    ids = _create(client, headers, contents)
+
+    body = client.post("/api/ai/transform-batch", json={"memo_ids": ids}, headers=headers).json()
+
+    ok = [item["ok"] for item in body["results"]]
+    assert ok == [True] * settings.daily_free_credits + [False, False]
+    assert {item["error"]["status_code"] for item in body["results"] if not item["ok"]} == {402}
+    assert body["credits_used"] == settings.daily_free_credits
+    assert body["credits_remaining"] == 0
+    assert calls == [settings.daily_free_credits]
+
+
+def test_batch_reuses_cache_without_credits(client, headers, monkeypatch):
+    calls = []
+    _fake_gemini(monkeypatch, calls)
+    text = f"shared-{headers['X-Session-Id']}"
+    first, second = _create(client, headers, [text, text + "  "])   # 정규화 후 같은 캐시 키
+
+    assert client.post("/api/ai/transform-batch", json={"memo_ids": [first]}, headers=headers).json()["credits_used"] == 1
+    body = client.post("/api/ai/transform-batch", json={"memo_ids": [first, second]}, headers=headers).json()
+
+    assert [(item["ok"], item["cached"]) for item in body["results"]] == [(True, True), (True, True)]
+    assert body["credits_used"] == 0
+    assert len(calls) == 1
+
+
+def test_batch_joins_memo_already_in_flight(client, run, headers, monkeypatch):
+    """단건 변환이 진행 중인 메모는 배치 호출에 넣지 않고 그 결과를 공유"""
+    user_id = headers["X-Session-Id"]
+    busy, idle = _create(client, headers, [f"busy-{user_id}", f"idle-{user_id}"])
+    sent = []
+
+    async def slow_single(text):
+        await asyncio.sleep(0.2)
+        return _result(text)
+
+    async def single(text):
+        sent.append(text)
+        return _result(text)
+
+    async def scenario():
+        monkeypatch.setattr(ai_router, "transform_memo_with_gemini", slow_single)
+        running = asyncio.ensure_future(ai_router._transform_once(busy, user_id))
+        await asyncio.sleep(0.05)
+        monkeypatch.setattr(ai_router, "transform_memo_with_gemini", single)
+        async with AsyncSessionLocal() as db:
+            body = await ai_router.transform_memos_batch(BatchTransformRequest(memo_ids=[busy, idle]), db, user_id)
+        await running
+        return body
+
+    body = run(scenario)
+    assert sent == [f"idle-{user_id}"]
+    assert [(item.memo_id, item.ok) for item in body.results] == [(busy, True), (idle, True)]
+    assert body.credits_used == 1
+    assert body.credits_remaining == settings.daily_free_credits - 2
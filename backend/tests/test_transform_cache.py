@@ -0,0 +1,96 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+
+from app.database import AsyncSessionLocal
+from app.models.transform_cache import TransformCache
+from app.services import transform_cache_service
+from app.services.transform_cache_service import cache_key
+
+
+def _lookup(run, *source_texts):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            found = await transform_cache_service.get_cached_transforms(db, source_texts)
+            await db.commit()
+            return found
+
+    return run(scenario)
+
+
+def test_put_then_get(run):
+    source = f"회의 준비 {uuid.uuid4().hex}"
+    run(transform_cache_service.put_cached_transform, source, {"summary_ko": "요약"})
+    assert _lookup(run, source) == {source: {"summary_ko": "요약"}}
+
+
+def test_lookup_normalizes_whitespace(run):
+    source = f"내일  회의 {uuid.uuid4().hex}"
+    run(transform_cache_service.put_cached_transform, source, {"v": 1})
+    variant = "  " + source.replace("  ", " ") + "\n\n"
+    assert _lookup(run, source, variant) == {source: {"v": 1}, variant: {"v": 1}}
+
+
+def test_concurrent_puts_of_same_key_upsert(run):
+    """같은 원문을 동시에 저장해도 PK 충돌 없이 한 행으로 합쳐짐"""
+    source = f"동시 저장 {uuid.uuid4().hex}"
+
+    async def scenario():
+        await asyncio.gather(*(
+            transform_cache_service.put_cached_transform(source, {"n": n}) for n in range(8)
+        ))
+        async with AsyncSessionLocal() as db:
+            return await db.scalar(
+                select(func.count()).select_from(TransformCache).where(TransformCache.key == cache_key(source))
+            )
+
+    assert run(scenario) == 1
+    assert set(_lookup(run, source)[source]) == {"n"}
+
+
+def test_put_overwrites_existing_result(run):
+    source = f"덮어쓰기 {uuid.uuid4().hex}"
+    run(transform_cache_service.put_cached_transform, source, {"v": "old"})
+    run(transform_cache_service.put_cached_transform, source, {"v": "new"})
+    assert _lookup(run, source)[source] == {"v": "new"}
+
+
+def test_expired_entries_are_misses(run):
+    source = f"만료 {uuid.uuid4().hex}"
+    run(transform_cache_service.put_cached_transform, source, {"v": 1})
+
+    async def age():
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(TransformCache)
+                .where(TransformCache.key == cache_key(source))
+                .values(created_at=datetime.now(timezone.utc) - timedelta(days=365))
+            )
+            await db.commit()
+
+    run(age)
+    assert _lookup(run, source) == {}
+
+
+def test_hits_update_lru_counters(run):
+    source = f"히트 {uuid.uuid4().hex}"
+    run(transform_cache_service.put_cached_transform, source, {"v": 1})
+    _lookup(run, source)
+    _lookup(run, source)
+
+    async def hits():
+        async with AsyncSessionLocal() as db:
+            return (await db.get(TransformCache, cache_key(source))).hit_count
+
+    assert run(hits) == 2
+
+
+def test_failed_write_is_swallowed(run, monkeypatch):
+    """캐시 저장 실패가 호출자(메모 저장/크레딧 정산)로 번지지 않음"""
+    def broken_session():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(transform_cache_service, "AsyncSessionLocal", broken_session)
+    assert run(transform_cache_service.put_cached_transform, "아무 원문", {"v": 1}) is None
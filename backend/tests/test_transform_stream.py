@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import pytest
+
+import app.routers.ai as ai_router
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.memo import Memo
+from app.services import credit_service
+
+
+def _reserve(run, user_id, times):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            balance = None
+            for _ in range(times):
+                balance = await credit_service.reserve(db, user_id)
+            return balance
+
+    return run(scenario)
+
+
+def _balance(run, user_id):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            return (await credit_service.get_balance(db, user_id)).daily_credits
+
+    return run(scenario)
+
+
+def test_failed_save_refunds_exactly_once(run, headers):
+    user_id = headers["X-Session-Id"]
+    balance = _reserve(run, user_id, 2)
+
+    async def save_deleted_memo():
+        await ai_router._save_result(10**9, user_id, "deleted", {}, balance)
+
+    with pytest.raises(LookupError):
+        run(save_deleted_memo)
+    assert _balance(run, user_id) == settings.daily_free_credits - 1
+
+
+def _result(text):
+    return {
+        "summary_ko": f"요약 {text}",
+        "summary_en": f"summary {text}",
+        "dialogue": {
+            "title": text,
+            "situation": "s",
+            "exchanges": [{"speaker": "A", "line": "Hi", "korean": "안녕"}],
+        },
+    }
+
+
+def _fake_stream(calls):
+    async def stream(text):
+        calls.append(text)
+        payload = json.dumps(_result(text), ensure_ascii=False)
+        for start in range(0, len(payload), 40):
+            await asyncio.sleep(0.01)
+            yield payload[start:start + 40]
+
+    return stream
+
+
+async def _no_blocking_gemini(text):
+    raise AssertionError("스트리밍 중인 메모에 Gemini를 다시 호출함")
+
+
+def _new_memo(client, headers, content):
+    return client.post("/api/memos", json={"content": f"{content} {headers}"}, headers=headers).json()["id"]
+
+
+def test_transform_joins_running_stream(client, run, headers, monkeypatch):
+    """스트리밍 중에 들어온 일반 변환은 같은 작업에 합류 — Gemini 호출·차감 한 번"""
+    user_id = headers["X-Session-Id"]
+    calls = []
+    monkeypatch.setattr(ai_router, "stream_transform_with_gemini", _fake_stream(calls))
+    monkeypatch.setattr(ai_router, "transform_memo_with_gemini", _no_blocking_gemini)
+    memo_id = _new_memo(client, headers, "join")
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            response = await ai_router.stream_transform(memo_id, db, user_id)
+        joined = await ai_router._transform_once(memo_id, user_id)
+        body = "".join([event async for event in response.body_iterator])
+        return joined, body
+
+    joined, body = run(scenario)
+    assert len(calls) == 1
+    assert "event: done" in body
+    assert joined.credits_remaining == settings.daily_free_credits - 1
+    assert _balance(run, user_id) == settings.daily_free_credits - 1
+
+
+def test_disconnected_stream_still_saves(client, run, headers, monkeypatch):
+    """클라이언트가 끊겨도 생성 태스크는 저장까지 진행하고 환불하지 않음"""
+    user_id = headers["X-Session-Id"]
+    monkeypatch.setattr(ai_router, "stream_transform_with_gemini", _fake_stream([]))
+    memo_id = _new_memo(client, headers, "disconnect")
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            response = await ai_router.stream_transform(memo_id, db, user_id)
+        await response.body_iterator.aclose()
+        await ai_router._transform_once(memo_id, user_id)
+
+    run(scenario)
+    assert client.get(f"/api/memos/{memo_id}", headers=headers).json()["is_transformed"] is True
+    assert _balance(run, user_id) == settings.daily_free_credits - 1
+
+
+def test_transform_refunds_when_saved_meanwhile(client, run, headers, monkeypatch):
+    """Gemini 호출 중 다른 워커가 먼저 저장했으면 저장된 결과를 돌려주고 예약은 환불"""
+    user_id = headers["X-Session-Id"]
+    memo_id = _new_memo(client, headers, "race")
+
+    async def gemini(text):
+        async with AsyncSessionLocal() as db:
+            memo = await db.get(Memo, memo_id)
+            await ai_router._apply_transform(db, memo, _result("first"))
+            await db.commit()
+        return _result("second")
+
+    monkeypatch.setattr(ai_router, "transform_memo_with_gemini", gemini)
+
+    response = run(ai_router._run_transform, memo_id, user_id)
+    assert response.dialogue.title == "first"
+    assert _balance(run, user_id) == settings.daily_free_credits
@@ -1,6 +1,6 @@
 import axios from 'axios';
 import { getSession } from 'next-auth/react';
-import type { Memo, MemoStatus, TransformResult, Credits } from '@/types/memo';
+import type { Board, Memo, MemoListItem, MemoPage, MemoSearchPage, MemoStatus, MemoSync, MemoBatchOperation, MemoBatchResult, MemoImportResult, TransformResult, BatchTransformResult, Credits, AudioTimelineEntry, Job, JobAccepted, MemoParsedUrls } from '@/types/memo';
 
 const BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL ?? 'http://localhost:8000';
 
@@ -17,9 +17,46 @@ client.interceptors.request.use(async (config) => {
 
 // ── 메모 CRUD ──────────────────────────────────────────────────
 
+const toMemo = ({ content_preview, ...item }: MemoListItem): Memo => ({
+  ...item,
+  content: content_preview,
+});
+
 export const memosApi = {
-  list: () =>
-    client.get<Memo[]>('/api/memos').then((r) => r.data),
+  /** 커서를 따라 전체 페이지 조회 (목록은 본문 미리보기만 포함) */
+  list: async () => {
+    const memos: Memo[] = [];
+    let cursor: string | null = null;
+    do {
+      const page: MemoPage = await client
+        .get<MemoPage>('/api/memos', { params: { limit: 200, cursor: cursor ?? undefined } })
+        .then((r) => r.data);
+      memos.push(...page.items.map(toMemo));
+      cursor = page.next_cursor;
+    } while (cursor);
+    return memos;
+  },
+
+  /** 칸반 보드: 상태별 개수 + 상태별 최신 N개 */
+  board: (perStatus = 20) =>
+    client.get<Board>('/api/memos/board', { params: { per_status: perStatus } }).then((r) => r.data),
+
+  /** 보드 열 "더 보기" — board 응답의 next_cursor 사용 */
+  listByStatus: (status: MemoStatus, cursor: string, limit = 20) =>
+    client.get<MemoPage>('/api/memos', { params: { status, cursor, limit } }).then((r) => r.data),
+
+  /** 전문 검색 (관련도 순) — 다음 페이지는 next_offset 사용 */
+  search: (q: string, offset = 0, limit = 20) =>
+    client.get<MemoSearchPage>('/api/memos/search', { params: { q, offset, limit } }).then((r) => r.data),
+
+  /** 델타 동기화 — 이전 응답의 cursor 이후 변경/삭제분만 (cursor 없으면 전체) */
+  sync: (cursor?: string | null, limit = 200) =>
+    client
+      .get<MemoSync>('/api/memos/sync', { params: { cursor: cursor ?? undefined, limit } })
+      .then((r) => ({ ...r.data, changed: r.data.changed.map(toMemo) })),
+
+  get: (id: number) =>
+    client.get<Memo>(`/api/memos/${id}`).then((r) => r.data),
 
   create: (content: string, source_url?: string) =>
     client.post<Memo>('/api/memos', { content, source_url }).then((r) => r.data),
@@ -33,8 +70,30 @@ export const memosApi = {
   updateStatus: (id: number, status: MemoStatus) =>
     client.patch<Memo>(`/api/memos/${id}/status`, { status }).then((r) => r.data),
 
+  /** 상태 변경/수정/삭제 여러 건을 한 트랜잭션으로 — 항목별 결과 반환 */
+  batch: (operations: MemoBatchOperation[]) =>
+    client
+      .post<{ results: MemoBatchResult[] }>('/api/memos/batch', { operations })
+      .then((r) => r.data.results),
+
+  /** NDJSON 가져오기 — 한 줄에 메모 하나 (내보내기 파일 그대로 사용 가능) */
+  importNdjson: (file: Blob) =>
+    client
+      .post<MemoImportResult>('/api/memos/import', file, { headers: { 'Content-Type': 'application/x-ndjson' } })
+      .then((r) => r.data),
+
+  /** NDJSON 내보내기 — AI 요약/대화문 포함 */
+  exportNdjson: () =>
+    client.get<Blob>('/api/memos/export', { responseType: 'blob' }).then((r) => r.data),
+
   parseUrl: (id: number, url: string) =>
     client.post(`/api/memos/${id}/parse-url`, { url }).then((r) => r.data),
+
+  /** 여러 메모의 링크를 한 번에 파싱 — memoIds는 본문에서 URL 자동 추출 */
+  parseUrls: (memoIds: number[], items: { memo_id: number; url: string }[] = []) =>
+    client
+      .post<{ results: MemoParsedUrls[] }>('/api/memos/parse-urls', { memo_ids: memoIds, items })
+      .then((r) => r.data.results),
 };
 
 // ── AI 변환 (수동 트리거 전용) ─────────────────────────────────
@@ -44,6 +103,17 @@ export const aiApi = {
   transform: (memoId: number) =>
     client.post<TransformResult>(`/api/ai/transform/${memoId}`).then((r) => r.data),
 
+  /** 백그라운드 변환 — job_id를 받아 jobsApi로 완료 여부 확인 */
+  transformInBackground: (memoId: number) =>
+    client.post<JobAccepted>(`/api/ai/transform/${memoId}`, null, { params: { background: true } }).then((r) => r.data),
+
+  /** 여러 메모 일괄 변환 — 메모별 ok/error 확인 */
+  transformBatch: (memoIds: number[]) =>
+    client.post<BatchTransformResult>('/api/ai/transform-batch', { memo_ids: memoIds }).then((r) => r.data),
+
+  /** 스트리밍 변환 SSE 주소 — POST 요청이므로 fetch + ReadableStream으로 소비 */
+  transformStreamUrl: (memoId: number) => `${BASE_URL}/api/ai/transform/${memoId}/stream`,
+
   getCredits: () =>
     client.get<Credits>('/api/ai/credits').then((r) => r.data),
 };
@@ -52,8 +122,18 @@ export const aiApi = {
 
 export const audioApi = {
   generate: (memoId: number) =>
-    client.post<{ audio_url: string; cached: boolean }>(`/api/audio/generate/${memoId}`).then((r) => r.data),
+    client.post<{ audio_url: string; cached: boolean; timeline: AudioTimelineEntry[] | null }>(`/api/audio/generate/${memoId}`).then((r) => r.data),
+
+  generateInBackground: (memoId: number) =>
+    client.post<JobAccepted>(`/api/audio/generate/${memoId}`, null, { params: { background: true } }).then((r) => r.data),
 
   getDownloadUrl: (memoId: number) =>
     client.get<{ download_url: string; expires_in_seconds: number }>(`/api/audio/download/${memoId}`).then((r) => r.data),
 };
+
+// ── 백그라운드 작업 ────────────────────────────────────────────
+
+export const jobsApi = {
+  get: <T = unknown>(jobId: string) =>
+    client.get<Job<T>>(`/api/jobs/${jobId}`).then((r) => r.data),
+};
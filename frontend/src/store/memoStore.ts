@@ -1,10 +1,11 @@
 import { create } from 'zustand';
-import type { Memo, MemoStatus, TransformResult, Credits } from '@/types/memo';
+import type { Memo, MemoBatchOperation, MemoBatchResult, MemoStatus, TransformResult, Credits } from '@/types/memo';
 import { memosApi, aiApi, audioApi } from '@/lib/api';
 
 interface MemoStore {
   // ── 데이터 ────────────────────────────────────────────────
   memos: Memo[];
+  syncCursor: string | null;   // 델타 동기화 커서 — 새로고침 시 변경분만 수신
   credits: Credits | null;
   isLoading: boolean;
   error: string | null;
@@ -23,6 +24,7 @@ interface MemoStore {
   createMemo: (content: string, sourceUrl?: string) => Promise<void>;
   updateStatus: (id: number, status: MemoStatus) => Promise<void>;
   deleteMemo: (id: number) => Promise<void>;
+  applyBatch: (operations: MemoBatchOperation[]) => Promise<MemoBatchResult[]>;
 
   // ── 액션: AI 변환 (수동 트리거만) ─────────────────────────
   fetchCredits: () => Promise<void>;
@@ -42,6 +44,7 @@ interface MemoStore {
 
 export const useMemoStore = create<MemoStore>((set, get) => ({
   memos: [],
+  syncCursor: null,
   credits: null,
   isLoading: false,
   error: null,
@@ -56,8 +59,26 @@ export const useMemoStore = create<MemoStore>((set, get) => ({
   fetchMemos: async () => {
     set({ isLoading: true, error: null });
     try {
-      const memos = await memosApi.list();
-      set({ memos });
+      // 첫 호출은 전체, 이후에는 마지막 커서 이후 변경/삭제분만 받아 병합
+      let { memos, syncCursor } = get();
+      let hasMore = true;
+      while (hasMore) {
+        const page = await memosApi.sync(syncCursor);
+        const changed = new Map(page.changed.map((m) => [m.id, m]));
+        const deleted = new Set(page.deleted);
+        const current = page.reset ? [] : memos;
+        const known = new Set(current.map((m) => m.id));
+        memos = [
+          ...current
+            .filter((m) => !deleted.has(m.id))
+            .map((m) => (changed.has(m.id) ? { ...m, ...changed.get(m.id)! } : m)),
+          ...page.changed.filter((m) => !known.has(m.id)),
+        ];
+        syncCursor = page.cursor;
+        hasMore = page.has_more;
+      }
+      memos.sort((a, b) => b.created_at.localeCompare(a.created_at) || b.id - a.id);
+      set({ memos, syncCursor });
     } catch {
       set({ error: '메모를 불러오는데 실패했습니다.' });
     } finally {
@@ -80,6 +101,13 @@ export const useMemoStore = create<MemoStore>((set, get) => ({
     set((s) => ({ memos: s.memos.filter((m) => m.id !== id) }));
   },
 
+  /** 보드 재정리 등 여러 변경을 요청 한 번으로 — 적용 후 델타 동기화로 목록 갱신 */
+  applyBatch: async (operations) => {
+    const results = await memosApi.batch(operations);
+    await get().fetchMemos();
+    return results;
+  },
+
   fetchCredits: async () => {
     try {
       const credits = await aiApi.getCredits();
@@ -140,8 +168,14 @@ export const useMemoStore = create<MemoStore>((set, get) => ({
 
   setActiveFilter: (filter) => set({ activeFilter: filter }),
   setInputPanelOpen: (open) => set({ inputPanelOpen: open }),
-  openLearningModal: (memoId) =>
-    set({ learningModalMemoId: memoId, learningResult: null, audioUrl: null }),
+  openLearningModal: (memoId) => {
+    set({ learningModalMemoId: memoId, learningResult: null, audioUrl: null });
+    // 목록에는 본문 미리보기만 있으므로 상세 조회로 교체
+    memosApi
+      .get(memoId)
+      .then((memo) => set((s) => ({ memos: s.memos.map((m) => (m.id === memoId ? memo : m)) })))
+      .catch(() => {});
+  },
   closeLearningModal: () =>
     set({ learningModalMemoId: null, learningResult: null, audioUrl: null }),
   clearError: () => set({ error: null }),
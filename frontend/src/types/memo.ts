@@ -15,6 +15,8 @@ export const STATUS_COLOR: Record<MemoStatus, string> = {
 };
 
 export interface DialogueExchange {
+  /** 저장된 줄 id — 줄 단위 오디오(/api/audio/exchange/{id}) 조회용 */
+  id?: number;
   speaker: 'A' | 'B';
   line: string;
   korean: string;
@@ -26,13 +28,17 @@ export interface AIDialogue {
   exchanges: DialogueExchange[];
 }
 
+export type UrlEnrichmentStatus = 'pending' | 'done' | 'failed';
+
 export interface Memo {
   id: number;
-  user_id: string;
+  user_id?: string;
   content: string;
   source_url?: string;
   url_title?: string;
   url_description?: string;
+  /** 링크 메타데이터 백그라운드 수집 상태 (URL 없으면 null) */
+  url_enrichment_status?: UrlEnrichmentStatus | null;
   status: MemoStatus;
   start_date: string;
   end_date?: string;
@@ -41,8 +47,89 @@ export interface Memo {
   is_transformed: boolean;
   ai_summary_ko?: string;
   ai_summary_en?: string;
-  ai_dialogue_json?: string;
+  ai_dialogue?: AIDialogue | null;
   audio_s3_key?: string;
+  audio_timeline_json?: string;
+}
+
+/** 오디오 파일 내 대화 줄별 재생 위치 (줄 단위 탐색/Range 요청용) */
+export interface AudioTimelineEntry {
+  line_index: number;
+  exchange_id: number | null;
+  speaker: 'A' | 'B';
+  offset_ms: number;
+  duration_ms: number;
+  byte_offset: number;
+  byte_length: number;
+}
+
+/** 목록 API의 경량 프로젝션 — 본문은 미리보기만 포함 */
+export interface MemoListItem {
+  id: number;
+  content_preview: string;
+  source_url?: string;
+  url_title?: string;
+  url_enrichment_status?: UrlEnrichmentStatus | null;
+  status: MemoStatus;
+  start_date: string;
+  end_date?: string;
+  created_at: string;
+  updated_at: string;
+  is_transformed: boolean;
+  has_audio: boolean;
+}
+
+export interface MemoPage {
+  items: MemoListItem[];
+  next_cursor: string | null;
+}
+
+export interface MemoSearchItem extends MemoListItem {
+  score: number;
+}
+
+export interface MemoSearchPage {
+  items: MemoSearchItem[];
+  next_offset: number | null;
+}
+
+export type MemoBatchOperation =
+  | { op: 'status'; memo_id: number; status: MemoStatus }
+  | { op: 'edit'; memo_id: number; content: string; source_url?: string }
+  | { op: 'delete'; memo_id: number };
+
+export interface MemoBatchResult {
+  index: number;
+  memo_id: number;
+  op: MemoBatchOperation['op'];
+  ok: boolean;
+  error: string | null;
+}
+
+export interface MemoImportResult {
+  imported: number;
+  failed: number;
+  errors: { line: number; error: string }[];
+}
+
+export interface MemoSync {
+  changed: MemoListItem[];
+  deleted: number[];
+  cursor: string;
+  has_more: boolean;
+  reset: boolean;
+}
+
+export interface BoardColumn {
+  status: MemoStatus;
+  count: number;
+  items: MemoListItem[];
+  next_cursor: string | null;
+}
+
+export interface Board {
+  columns: BoardColumn[];
+  total: number;
 }
 
 export interface TransformResult {
@@ -52,8 +139,59 @@ export interface TransformResult {
   credits_remaining: number;
 }
 
+export interface BatchTransformItem {
+  memo_id: number;
+  ok: boolean;
+  cached: boolean;
+  summary_ko: string | null;
+  summary_en: string | null;
+  dialogue: AIDialogue | null;
+  error: { status_code: number; detail: unknown } | null;
+}
+
+export interface BatchTransformResult {
+  results: BatchTransformItem[];
+  credits_used: number;
+  credits_remaining: number;
+}
+
 export interface Credits {
   daily_credits: number;
   is_premium: boolean;
   max_daily_credits: number;
 }
+
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export interface JobAccepted {
+  job_id: string;
+  status: JobStatus;
+}
+
+export interface Job<T = unknown> {
+  id: string;
+  kind: string;
+  memo_id: number | null;
+  status: JobStatus;
+  attempts: number;
+  result: T | null;
+  error: { status_code: number; detail: string } | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}
+
+export interface ParsedUrl {
+  url: string;
+  ok: boolean;
+  title: string | null;
+  description: string | null;
+  error: 'timeout' | 'fetch_failed' | null;
+}
+
+export interface MemoParsedUrls {
+  memo_id: number;
+  urls: ParsedUrl[];
+  saved_url: string | null;
+  error: string | null;
+}